@@ -0,0 +1,59 @@
+# avl_memory_benchmark.py
+#
+# Builds the same AVL tree with each storage engine and reports how many
+# bytes of node storage every key costs. Run it as-is:
+#
+#   python benchmarks/avl_memory_benchmark.py [key_count]
+#
+# Keys are created before measuring starts, so the numbers cover the tree
+# structure only (plus the copied key values for typed array storage).
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "week11"))
+
+from avl_tree import AVLTree, AVLNode, AVLSlotNode
+from array_avl_tree import ArrayAVLTree
+
+KEY_COUNT = 200_000
+
+
+def engines():
+    return [
+        ("dataclass nodes (AVLNode)", lambda: AVLTree(node_type=AVLNode)),
+        ("__slots__ nodes (AVLSlotNode)", lambda: AVLTree(node_type=AVLSlotNode)),
+        ("struct-of-arrays, list keys", lambda: ArrayAVLTree()),
+        ("struct-of-arrays, 'q' keys", lambda: ArrayAVLTree("q")),
+    ]
+
+
+def measure(factory, keys):
+    tracemalloc.start()
+    start = time.perf_counter()
+    tree = factory()
+    for k in keys:
+        tree.insert(k)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tree, current, peak, elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else KEY_COUNT
+    keys = random.sample(range(count * 10), count)
+    print(f"Inserting {count:,} random keys into each storage engine...\n")
+    print(f"{'engine':<32}{'bytes/key':>12}{'peak bytes/key':>16}{'build time':>12}")
+    for label, factory in engines():
+        tree, current, peak, elapsed = measure(factory, keys)
+        print(f"{label:<32}{current / count:>12.1f}{peak / count:>16.1f}{elapsed:>11.2f}s")
+        del tree
+
+
+if __name__ == "__main__":
+    main()
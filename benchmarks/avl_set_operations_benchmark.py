@@ -0,0 +1,58 @@
+# avl_set_operations_benchmark.py
+#
+# Merges delta sets of several sizes into a large base set, once by
+# inserting the delta keys one at a time and once with the bulk union.
+# Run it as-is:
+#
+#   python benchmarks/avl_set_operations_benchmark.py [base_count]
+#
+# Both approaches start from the delta as an AVLTree. The gap widens as the
+# delta grows, since union touches O(m·log(n/m + 1)) base nodes instead of
+# doing m full root-to-leaf descents.
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "week11"))
+
+from avl_tree import AVLTree
+
+BASE_COUNT = 1_000_000
+DELTA_FRACTIONS = (0.001, 0.01, 0.1, 0.5)
+
+
+def merge_by_insert(base, delta):
+    for k in delta:
+        if base.search(k) is None:
+            base.insert(k)
+    return base
+
+
+def merge_by_union(base, delta):
+    return base.union(delta)
+
+
+def main():
+    base_count = int(sys.argv[1]) if len(sys.argv) > 1 else BASE_COUNT
+    base_keys = range(0, 2 * base_count, 2)
+
+    print(f"Merging delta sets into a base set of {base_count:,} keys\n")
+    print(f"{'delta keys':>12}{'per-key insert':>16}{'union':>10}{'speedup':>10}")
+    for fraction in DELTA_FRACTIONS:
+        delta_keys = random.sample(range(2 * base_count), int(base_count * fraction))
+        times = []
+        for merge in (merge_by_insert, merge_by_union):
+            base = AVLTree.from_sorted(base_keys)
+            delta = AVLTree.from_iterable(delta_keys)
+            start = time.perf_counter()
+            merged = merge(base, delta)
+            times.append(time.perf_counter() - start)
+            del merged
+        print(f"{len(delta_keys):>12,}{times[0]:>15.3f}s{times[1]:>9.3f}s{times[0] / times[1]:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
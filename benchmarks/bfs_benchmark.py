@@ -0,0 +1,96 @@
+# bfs_benchmark.py
+#
+# Compares the original queue.Queue breadth-first traversal plus a separate
+# recursive height walk (both kept here as reference functions) with the
+# level-order API, which swaps plain lists level by level and gets height,
+# per-level widths and the leaf count in the same pass. Run it as-is:
+#
+#   python benchmarks/bfs_benchmark.py [nodes]
+
+import os
+import queue
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "week9", "binary-tree"))
+
+from binary_tree import BinaryTree, Node
+from traversal_benchmark import balanced_tree
+
+NODES = 1_000_000
+
+
+def random_tree(n, seed=0):
+    """Tree grown by attaching each new node to a random free child slot."""
+    rng = random.Random(seed)
+    tree = BinaryTree()
+    if n == 0:
+        return tree
+    tree.root = Node(0)
+    slots = [(tree.root, "left"), (tree.root, "right")]
+    for i in range(1, n):
+        j = rng.randrange(len(slots))
+        slots[j], slots[-1] = slots[-1], slots[j]
+        parent, side = slots.pop()
+        node = Node(i)
+        setattr(parent, side, node)
+        slots += [(node, "left"), (node, "right")]
+    return tree
+
+
+def queue_bfs(root):
+    if root is None:
+        return []
+
+    result = []
+    cola = queue.Queue()
+    cola.put(root)
+
+    while not cola.empty():
+        tmp = cola.get()
+        result.append(tmp.key)
+        if tmp.left is not None:
+            cola.put(tmp.left)
+        if tmp.right is not None:
+            cola.put(tmp.right)
+
+    return result
+
+
+def recursive_height(r):
+    if r is None:
+        return -1
+    return max(recursive_height(r.left), recursive_height(r.right)) + 1
+
+
+def best_of(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else NODES
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))  # random trees are ~O(log n) deep
+    for shape, build in (("balanced", balanced_tree), ("random", random_tree)):
+        tree = build(n)
+        queue_time = best_of(lambda: queue_bfs(tree.root))
+        level_time = best_of(lambda: [k for level in tree.level_order() for k in level])
+        both_old = best_of(lambda: (queue_bfs(tree.root), recursive_height(tree.root)))
+        both_new = best_of(tree.level_profile)
+        profile = tree.level_profile()
+        print(f"{shape} tree, {n:,} nodes: height {profile['height']}, "
+              f"{len(profile['widths'])} levels, {profile['leaves']:,} leaves")
+        print(f"  traversal   queue.Queue {queue_time:6.2f} s   level_order    {level_time:6.2f} s"
+              f"   ({queue_time / level_time:.1f}x)")
+        print(f"  + height    two walks   {both_old:6.2f} s   level_profile  {both_new:6.2f} s"
+              f"   ({both_old / both_new:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
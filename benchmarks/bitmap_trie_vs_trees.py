@@ -0,0 +1,87 @@
+# bitmap_trie_vs_trees.py
+#
+# BitmapTrie (64-ary bitmap trie over 32-bit ints) against AVLTree, RBTree
+# and SkipList on the same n keys, phase by phase:
+#
+#   bulk     from_iterable() on the n keys
+#   insert   n inserts in random order into an empty structure
+#   search   n random lookups, half of them misses (member / search)
+#   range    n/100 range scans of about 100 keys each (items(lo, hi))
+#   delete   deleting every key in random order
+#
+# Rates are operations (keys, for bulk and range) per second. The last
+# column is the memory held by the populated structure (tracemalloc).
+# It runs twice: on keys spread over the whole 32-bit range, where nearly
+# every key has trie words of its own (the trie's worst case for memory and
+# scans), and on dense keys (n out of [0, 2n)), where words fill up.
+#
+#   python benchmarks/bitmap_trie_vs_trees.py [n]
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, d) for d in ("week11", "week12", "week13")]
+
+from avl_tree import AVLTree
+from bitmap_trie import BitmapTrie
+from red_black_tree import RBTree
+from skip_list import SkipList
+
+N = 100_000
+UNIVERSE = 1 << 32
+STRUCTURES = {"AVLTree": AVLTree, "RBTree": RBTree, "SkipList": SkipList, "BitmapTrie": BitmapTrie}
+PHASES = ("bulk", "insert", "search", "range", "delete")
+
+
+def rate(count, fn):
+    start = time.perf_counter()
+    fn()
+    return count / (time.perf_counter() - start)
+
+
+def run_phases(name, cls, keys, probes, ranges):
+    n = len(keys)
+    lookup = "member" if name == "BitmapTrie" else "search"
+    results = {"bulk": rate(n, lambda: cls.from_iterable(keys))}
+
+    s = cls()
+    results["insert"] = rate(n, lambda: [s.insert(k) for k in keys])
+    find = getattr(s, lookup)
+    results["search"] = rate(len(probes), lambda: [find(k) for k in probes])
+    scanned = sum(1 for lo, hi in ranges for _ in s.items(lo, hi))
+    results["range"] = rate(scanned, lambda: [list(s.items(lo, hi)) for lo, hi in ranges])
+    results["delete"] = rate(n, lambda: [s.delete(k) for k in keys])
+    assert len(s) == 0
+
+    tracemalloc.start()
+    full = cls.from_iterable(keys)
+    results["KB"], _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del full
+    return results
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N
+    rng = random.Random(0)
+    for label, span in (("random 32-bit", UNIVERSE), (f"dense, in [0, {2 * n:,})", 2 * n)):
+        keys = rng.sample(range(span), n)
+        probes = rng.sample(keys, n // 2) + [rng.randrange(span) for _ in range(n - n // 2)]
+        rng.shuffle(probes)
+        width = span // n * 100  # about 100 keys per scan
+        ranges = [(lo, lo + width) for lo in (rng.randrange(span - width) for _ in range(max(1, n // 100)))]
+
+        print(f"n = {n:,} keys, {label}; ops/s, memory in KB\n")
+        print(f"{'structure':<12}" + "".join(f"{p:>11}" for p in PHASES) + f"{'KB':>10}")
+        for name, cls in STRUCTURES.items():
+            r = run_phases(name, cls, keys, probes, ranges)
+            print(f"{name:<12}" + "".join(f"{r[p]:>11,.0f}" for p in PHASES) + f"{r['KB'] / 1024:>10,.0f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
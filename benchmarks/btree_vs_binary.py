@@ -0,0 +1,80 @@
+# btree_vs_binary.py
+#
+# Bulk-loads the same sorted keys into BST, AVLTree, RBTree and BPlusTree and
+# compares random point lookups and narrow range scans. Run it as-is:
+#
+#   python benchmarks/btree_vs_binary.py [key_count] [order]
+#
+# Try 10_000_000 keys for the large end of the comparison (needs several GB
+# of RAM for the binary trees).
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, d) for d in ("week10", "week11", "week12", "week13")]
+
+from avl_tree import AVLTree
+from b_plus_tree import BPlusTree, DEFAULT_ORDER
+from bst_tree import BST
+from red_black_tree import RBTree
+
+KEY_COUNT = 1_000_000
+LOOKUP_COUNT = 200_000
+SCAN_COUNT = 2_000
+SCAN_WIDTH = 1_000
+
+
+def time_lookups(tree, probes):
+    search = tree.search
+    start = time.perf_counter()
+    for k in probes:
+        search(k)
+    return len(probes) / (time.perf_counter() - start)
+
+
+def time_scans(tree, starts):
+    start = time.perf_counter()
+    scanned = 0
+    for lo in starts:
+        for _ in tree.items(lo, lo + SCAN_WIDTH):
+            scanned += 1
+    return scanned / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else KEY_COUNT
+    order = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_ORDER
+    keys = range(count)
+    probes = [random.randrange(count) for _ in range(LOOKUP_COUNT)]
+    starts = [random.randrange(count - SCAN_WIDTH) for _ in range(SCAN_COUNT)]
+
+    trees = (
+        ("BST", lambda: BST.from_sorted(keys)),
+        ("AVLTree", lambda: AVLTree.from_sorted(keys)),
+        ("RBTree", lambda: RBTree.from_sorted(keys)),
+        (f"BPlusTree({order})", lambda: BPlusTree.from_sorted(keys, order=order)),
+        (f"BPlusTree({order}, 'q')", lambda: BPlusTree.from_sorted(keys, order=order, key_type="q")),
+    )
+
+    print(f"{count:,} keys: {LOOKUP_COUNT:,} random lookups, "
+          f"{SCAN_COUNT:,} scans of {SCAN_WIDTH:,} keys\n")
+    print(f"{'tree':<24}{'build':>9}{'lookups/s':>14}{'scanned keys/s':>17}")
+    baseline = None
+    for name, build in trees:
+        start = time.perf_counter()
+        tree = build()
+        build_time = time.perf_counter() - start
+        lookups = time_lookups(tree, probes)
+        scans = time_scans(tree, starts)
+        if baseline is None:
+            baseline = (lookups, scans)
+        print(f"{name:<24}{build_time:>8.2f}s{lookups:>14,.0f}{scans:>17,.0f}"
+              f"   ({lookups / baseline[0]:.1f}x / {scans / baseline[1]:.1f}x vs BST)")
+        del tree
+
+
+if __name__ == "__main__":
+    main()
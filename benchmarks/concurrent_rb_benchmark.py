@@ -0,0 +1,106 @@
+# concurrent_rb_benchmark.py
+#
+# Read throughput of an RBTree shared by N reader threads while one writer
+# keeps inserting and deleting, comparing a global lock around every
+# operation with ConcurrentRBTree's optimistic (seqlock) readers. Also
+# reports the writer's throughput, which the global lock starves when many
+# readers queue on it. Run it as-is:
+#
+#   python benchmarks/concurrent_rb_benchmark.py [tree_size] [seconds_per_run]
+#
+# Under CPython's global interpreter lock the threads never run Python code
+# in parallel, so the totals cannot scale with cores; what the comparison
+# shows is the cost of lock handoffs between threads. On a free-threaded
+# build the optimistic readers also run in parallel.
+
+import os
+import random
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "week12"))
+
+from concurrent_rb_tree import ConcurrentRBTree
+from red_black_tree import RBTree
+
+TREE_SIZE = 100_000
+SECONDS = 2.0
+READER_COUNTS = (1, 2, 4, 8)
+
+
+class LockedRBTree:
+    """The baseline: one lock around every operation."""
+
+    def __init__(self, tree):
+        self._tree = tree
+        self._lock = threading.Lock()
+
+    def insert(self, key):
+        with self._lock:
+            self._tree.insert(key)
+
+    def delete(self, key):
+        with self._lock:
+            self._tree.delete(key)
+
+    def search(self, key):
+        with self._lock:
+            return self._tree.search(key) is not None
+
+
+def run(shared, keys, readers, seconds):
+    """Returns (reads/s summed over readers, writes/s)."""
+    stop = threading.Event()
+    reads = [0] * readers
+    writes = [0]
+
+    def writer():
+        rng = random.Random(1)
+        live = list(keys)
+        while not stop.is_set():
+            k = rng.random() * len(keys)
+            shared.insert(k)
+            i = rng.randrange(len(live))
+            live[i], k = k, live[i]
+            shared.delete(k)
+            writes[0] += 2
+
+    def reader(slot):
+        rng = random.Random(slot)
+        search, count = shared.search, 0
+        while not stop.is_set():
+            for _ in range(100):
+                search(rng.random() * len(keys))
+            count += 100
+        reads[slot] = count
+
+    threads = [threading.Thread(target=writer)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    for th in threads:
+        th.start()
+    time.sleep(seconds)
+    stop.set()
+    for th in threads:
+        th.join()
+    return sum(reads) / seconds, writes[0] / seconds
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else TREE_SIZE
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else SECONDS
+    keys = [random.random() * size for _ in range(size)]
+
+    print(f"RBTree with {size:,} keys, one writer running, {seconds:g} s per run")
+    print(f"{'readers':>7}  {'global lock reads/s':>20}{'writes/s':>10}"
+          f"  {'seqlock reads/s':>18}{'writes/s':>10}{'reads':>8}")
+    for readers in READER_COUNTS:
+        locked = run(LockedRBTree(RBTree.from_iterable(keys)), keys, readers, seconds)
+        free = run(ConcurrentRBTree(RBTree.from_iterable(keys)), keys, readers, seconds)
+        print(f"{readers:>7}  {locked[0]:>20,.0f}{locked[1]:>10,.0f}"
+              f"  {free[0]:>18,.0f}{free[1]:>10,.0f}{free[0] / locked[0]:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# csr_vs_adjacency_lists.py
+#
+# Graph (dict of Python lists) against its frozen CSRGraph form on a random
+# DAG: memory held by each representation (tracemalloc), the time to build
+# the CSR form, and the time of bfs/dfs (week14) and both topological sorts
+# (week15) on each. The recursive dfs and DFS topological sort of Graph
+# fail with RecursionError on deep graphs (reported as "recursion"); the
+# CSR versions are iterative. Run it as-is:
+#
+#   python benchmarks/csr_vs_adjacency_lists.py [vertices] [edges]
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, d) for d in ("week14", "week15")]
+
+from csr_graph import CSRGraph
+from graph import Graph
+from graph_algorithms import bfs, dfs
+from topology_sorting import topological_sort_dfs, topological_sort_kahn
+
+VERTICES = 100_000
+EDGES = 1_000_000
+TRAVERSALS = {
+    "bfs": lambda g, s: bfs(g, s),
+    "dfs": lambda g, s: dfs(g, s),
+    "topo (DFS)": lambda g, s: topological_sort_dfs(g),
+    "topo (Kahn)": lambda g, s: topological_sort_kahn(g),
+}
+
+
+def random_dag(n, m, rng):
+    """Directed graph with m random edges u -> v, u < v, over vertices 'v0'..'v{n-1}'."""
+    g = Graph(directed=True)
+    labels = [f"v{i}" for i in range(n)]
+    for v in labels:
+        g.add_vertex(v)
+    added = 0
+    while added < m:
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            g.add_edge(labels[min(u, v)], labels[max(u, v)])
+            added += 1
+    return g
+
+
+def retained(build, *args):
+    """Returns (result, bytes still allocated by build once it returns)."""
+    tracemalloc.start()
+    result = build(*args)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def seconds(fn, *args):
+    start = time.perf_counter()
+    try:
+        fn(*args)
+    except RecursionError:
+        return None
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else VERTICES
+    m = int(sys.argv[2]) if len(sys.argv) > 2 else EDGES
+    rng = random.Random(0)
+    graph, graph_bytes = retained(random_dag, n, m, rng)
+    csr, csr_bytes = retained(CSRGraph, graph)
+    build = seconds(CSRGraph, graph)
+
+    print(f"random DAG: {n:,} vertices, {m:,} edges\n")
+    print(f"{'':<14}{'Graph':>12}{'CSRGraph':>12}")
+    print(f"{'memory MB':<14}{graph_bytes / 2**20:>12.1f}{csr_bytes / 2**20:>12.1f}"
+          f"   (offsets + targets: {csr.nbytes() / 2**20:.1f} MB; CSR build {build:.2f} s)")
+    for name, run in TRAVERSALS.items():
+        cells = []
+        for g in (graph, csr):
+            t = seconds(run, g, "v0")
+            cells.append("recursion" if t is None else f"{t:.3f} s")
+        print(f"{name:<14}{cells[0]:>12}{cells[1]:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# disk_b_plus_tree_benchmark.py
+#
+# Builds page-file indexes of increasing size and shows that opening one
+# costs about the same no matter how big it is, then times random lookups
+# (a first pass over cold pages and a second one over the same keys) and a
+# range scan. Run it as-is:
+#
+#   python benchmarks/disk_b_plus_tree_benchmark.py [largest_key_count]
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "week13"))
+
+from disk_b_plus_tree import DiskBPlusTree
+
+LARGEST_KEY_COUNT = 10_000_000
+LOOKUP_COUNT = 20_000
+SCAN_WIDTH = 100_000
+INDEX_FILE = "benchmark_index.bpt"
+
+
+def pretty(sec):
+    if sec < 1e-3:
+        return f"{sec * 1e6:.2f} µs"
+    if sec < 1:
+        return f"{sec * 1e3:.2f} ms"
+    return f"{sec:.3f} s"
+
+
+def run(count):
+    start = time.perf_counter()
+    DiskBPlusTree.build(INDEX_FILE, ((k, 2 * k) for k in range(0, 2 * count, 2)))
+    build_time = time.perf_counter() - start
+    size = os.path.getsize(INDEX_FILE)
+
+    start = time.perf_counter()
+    index = DiskBPlusTree(INDEX_FILE)
+    open_time = time.perf_counter() - start
+
+    probes = [random.randrange(2 * count) for _ in range(LOOKUP_COUNT)]
+    start = time.perf_counter()
+    for k in probes:
+        index.search(k)
+    cold = (time.perf_counter() - start) / LOOKUP_COUNT
+    start = time.perf_counter()
+    for k in probes:
+        index.search(k)
+    warm = (time.perf_counter() - start) / LOOKUP_COUNT
+
+    lo = random.randrange(max(1, 2 * count - 2 * SCAN_WIDTH))
+    start = time.perf_counter()
+    scanned = sum(1 for _ in index.items(lo, lo + 2 * SCAN_WIDTH))
+    scan_rate = scanned / (time.perf_counter() - start)
+
+    print(f"{count:>12,}{size / 2**20:>10.1f} MB{build_time:>9.1f}s{pretty(open_time):>12}"
+          f"{pretty(cold):>12}{pretty(warm):>12}{scan_rate:>14,.0f}")
+    index.close()
+    os.remove(INDEX_FILE)
+
+
+def main():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else LARGEST_KEY_COUNT
+    print(f"{'keys':>12}{'file':>13}{'build':>10}{'open':>12}{'lookup':>12}{'2nd pass':>12}{'scan keys/s':>14}")
+    count = 10_000
+    while count <= largest:
+        run(count)
+        count *= 10
+
+
+if __name__ == "__main__":
+    main()
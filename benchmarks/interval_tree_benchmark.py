@@ -0,0 +1,55 @@
+# interval_tree_benchmark.py
+#
+# "Which stored time ranges overlap [a, b]?" answered by a linear scan over
+# a list of intervals and by IntervalTree.overlapping(), for short and long
+# query windows. Run it as-is:
+#
+#   python benchmarks/interval_tree_benchmark.py [intervals] [queries]
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "week12"))
+
+from interval_tree import IntervalTree
+
+INTERVALS = 200_000
+QUERIES = 1_000
+HORIZON = 10_000_000  # interval starts are drawn from [0, HORIZON)
+MAX_LENGTH = 5_000
+WINDOWS = (0, 1_000, 100_000)  # query lengths; 0 is a stabbing query
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else INTERVALS
+    q = int(sys.argv[2]) if len(sys.argv) > 2 else QUERIES
+    rng = random.Random(0)
+    intervals = set()
+    while len(intervals) < n:
+        start = rng.randrange(HORIZON)
+        intervals.add((start, start + rng.randrange(MAX_LENGTH)))
+    intervals = list(intervals)
+
+    start = time.perf_counter()
+    tree = IntervalTree.from_iterable(intervals)
+    print(f"{n:,} intervals, bulk-loaded in {time.perf_counter() - start:.2f} s\n")
+    print(f"{'window':>8}{'hits/query':>12}{'linear scan':>14}{'interval tree':>16}{'speedup':>10}")
+    for window in WINDOWS:
+        queries = [(lo, lo + window) for lo in (rng.randrange(HORIZON) for _ in range(q))]
+        start = time.perf_counter()
+        expected = [[iv for iv in intervals if iv[0] <= hi and iv[1] >= lo] for lo, hi in queries]
+        scan = (time.perf_counter() - start) / q
+        start = time.perf_counter()
+        found = [list(tree.overlapping(lo, hi)) for lo, hi in queries]
+        indexed = (time.perf_counter() - start) / q
+        assert [sorted(e) for e in expected] == found
+        hits = sum(map(len, found)) / q
+        print(f"{window:>8,}{hits:>12.1f}{scan * 1000:>12.2f}ms{indexed * 1000:>14.3f}ms"
+              f"{scan / indexed:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
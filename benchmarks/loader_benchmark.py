@@ -0,0 +1,115 @@
+# loader_benchmark.py
+#
+# Times loading a serialized BinaryTree three ways: the original recursive
+# loader that calls read(1) per character (kept here as a reference), the chunked iterative text loader
+# now behind create_from_file, and the length-prefixed binary format. Uses a
+# balanced tree and a left-skewed chain (where the recursive loader hits the
+# recursion limit). Run it as-is:
+#
+#   python benchmarks/loader_benchmark.py [nodes]
+
+import os
+import sys
+import tempfile
+import time
+from collections import deque
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "week9", "binary-tree"))
+
+from binary_tree import BinaryTree, Node
+
+NODES = 1_000_000
+KEYS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def balanced_tree(n):
+    """Complete tree with n nodes and single-character keys."""
+    tree = BinaryTree()
+    if n == 0:
+        return tree
+    tree.root = Node(KEYS[0])
+    parents = deque([tree.root])
+    for i in range(1, n):
+        node = Node(KEYS[i % len(KEYS)])
+        if i % 2:
+            parents[0].left = node
+        else:
+            parents.popleft().right = node
+        parents.append(node)
+    return tree
+
+
+def skewed_tree(n):
+    """Chain of n nodes hanging to the left."""
+    tree = BinaryTree()
+    for i in range(n):
+        node = Node(KEYS[i % len(KEYS)])
+        node.left = tree.root
+        tree.root = node
+    return tree
+
+
+def save_text(tree, filename):
+    """Writes the `$`-terminated pre-order text format."""
+    parts, stack = [], [tree.root]
+    while stack:
+        r = stack.pop()
+        if r is None:
+            parts.append("$")
+        else:
+            parts.append(r.key)
+            stack.append(r.right)
+            stack.append(r.left)
+    with open(filename, "w") as handle:
+        handle.write("".join(parts))
+
+
+def read_node(handle):
+    c = handle.read(1)
+    if c == '$':
+        return None
+
+    tmp = Node(c)
+    tmp.left = read_node(handle)
+    tmp.right = read_node(handle)
+    return tmp
+
+
+def old_loader(filename):
+    tree = BinaryTree()
+    with open(filename, "r") as handle:
+        tree.root = read_node(handle)
+
+
+def timed(load, filename):
+    start = time.perf_counter()
+    try:
+        load(filename)
+    except RecursionError:
+        return "RecursionError"
+    return f"{time.perf_counter() - start:.2f} s"
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else NODES
+    folder = tempfile.mkdtemp()
+    text, binary = os.path.join(folder, "tree.txt"), os.path.join(folder, "tree.bin")
+    for shape, build in (("balanced", balanced_tree), ("skewed", skewed_tree)):
+        tree = build(n)
+        save_text(tree, text)
+        tree.save_to_binary_file(binary)
+        del tree
+        print(f"{shape} tree, {n:,} nodes "
+              f"(text {os.path.getsize(text):,} B, binary {os.path.getsize(binary):,} B)")
+        print(f"  read(1) + recursion:  {timed(old_loader, text):>16}")
+        print(f"  chunked text loader:  {timed(BinaryTree().create_from_file, text):>16}")
+        print(f"  binary loader:        {timed(BinaryTree().create_from_binary_file, binary):>16}")
+        print()
+    os.remove(text)
+    os.remove(binary)
+    os.rmdir(folder)
+
+
+if __name__ == "__main__":
+    main()
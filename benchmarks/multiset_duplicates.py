@@ -0,0 +1,74 @@
+# multiset_duplicates.py
+#
+# Heavy-duplicate insert stream (few distinct keys, each repeated many
+# times) into BST and AVLTree, with and without multiset mode. Reports
+# insert throughput, nodes allocated, final height, rotations and the
+# memory held by the tree (tracemalloc). Without multiset mode the repeats
+# of a key form a chain below its first copy, which is what makes the plain
+# BST slow here. Run it as-is:
+#
+#   python benchmarks/multiset_duplicates.py [inserts] [distinct_keys]
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, d) for d in ("shared", "week10", "week11")]
+
+from avl_tree import AVLTree
+from bst_tree import BST
+from tree_stats import instrument
+from tree_suite import tree_height
+
+INSERTS = 50_000
+DISTINCT = 200
+
+TREES = {
+    "BST": BST,
+    "BST(multiset)": lambda: BST(multiset=True),
+    "AVLTree": AVLTree,
+    "AVLTree(multiset)": lambda: AVLTree(multiset=True),
+}
+
+
+def node_count(tree):
+    count, stack = 0, [tree.root] if tree.root else []
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack += [c for c in (node.left, node.right) if c]
+    return count
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else INSERTS
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else DISTINCT
+    rng = random.Random(0)
+    stream = [rng.randrange(distinct) for _ in range(n)]
+
+    print(f"{n:,} inserts over {distinct:,} distinct keys\n")
+    print(f"{'tree':<19}{'inserts/s':>11}{'nodes':>9}{'height':>8}{'rotations':>11}{'KB':>9}")
+    for name, make in TREES.items():
+        tree = make()
+        start = time.perf_counter()
+        for k in stream:
+            tree.insert(k)
+        rate = n / (time.perf_counter() - start)
+
+        tracemalloc.start()
+        copy = make()
+        with instrument(copy) as stats:
+            for k in stream:
+                copy.insert(k)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert sorted(stream) == list(tree)
+        print(f"{name:<19}{rate:>11,.0f}{node_count(tree):>9,}{tree_height(tree):>8,}"
+              f"{stats.rotations:>11,}{current / 1024:>9,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# order_statistics.py
+#
+# Compares the O(log n) select/rank/count_range of AVLTree and RBTree built
+# with track_sizes=True against the linear in-order walk that is the only
+# option without subtree sizes, then prices the size tracking itself:
+# insert/delete ops/sec of each tree with track_sizes off and on. Run it as-is:
+#
+#   python benchmarks/order_statistics.py [key_count]
+
+import gc
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "week11"), os.path.join(ROOT, "week12")]
+
+from avl_tree import AVLTree
+from red_black_tree import RBTree
+
+KEY_COUNT = 1_000_000
+QUERY_COUNT = 20
+CHURN_COUNT = 200_000
+CHURN_RUNS = 5  # best of, alternating the two trees
+
+
+def in_order(tree):
+    """Iterative in-order walk; works for both None and NIL-terminated trees."""
+    nil = getattr(tree, "NIL", None)
+    stack, cur = [], tree.root
+    while stack or cur is not nil:
+        while cur is not nil:
+            stack.append(cur)
+            cur = cur.left
+        cur = stack.pop()
+        yield cur.key
+        cur = cur.right
+
+
+def linear_select(tree, k):
+    for i, key in enumerate(in_order(tree)):
+        if i == k:
+            return key
+    raise IndexError("select index out of range")
+
+
+def linear_rank(tree, key):
+    r = 0
+    for k in in_order(tree):
+        if not k < key:
+            break
+        r += 1
+    return r
+
+
+def linear_count_range(tree, lo, hi):
+    return sum(1 for k in in_order(tree) if lo <= k <= hi)
+
+
+def time_queries(fn, tree, queries):
+    start = time.perf_counter()
+    for q in queries:
+        fn(tree, *q)
+    return (time.perf_counter() - start) / len(queries)
+
+
+def pretty(sec):
+    if sec < 1e-3:
+        return f"{sec * 1e6:.2f} µs"
+    if sec < 1:
+        return f"{sec * 1e3:.2f} ms"
+    return f"{sec:.4f} s"
+
+
+def churn_rate(cls, track_sizes, keys, doomed):
+    """Returns (inserts/sec, deletes/sec) of keys into an empty tree, then of doomed."""
+    gc.collect()  # don't bill one run for the garbage of the previous one
+    tree = cls(track_sizes=track_sizes)
+    start = time.perf_counter()
+    for k in keys:
+        tree.insert(k)
+    mid = time.perf_counter()
+    for k in doomed:
+        tree.delete(k)
+    end = time.perf_counter()
+    return len(keys) / (mid - start), len(doomed) / (end - mid)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else KEY_COUNT
+    keys = range(0, 2 * count, 2)
+    selects = [(random.randrange(count),) for _ in range(QUERY_COUNT)]
+    ranks = [(random.randrange(2 * count),) for _ in range(QUERY_COUNT)]
+    ranges = []
+    for _ in range(QUERY_COUNT):
+        lo = random.randrange(2 * count)
+        ranges.append((lo, lo + count // 10))
+
+    print(f"Order statistics on {count:,} keys ({QUERY_COUNT} queries each)\n")
+    print(f"{'tree':<10}{'query':<14}{'linear walk':>14}{'size-augmented':>16}{'speedup':>10}")
+    for name, cls in (("AVLTree", AVLTree), ("RBTree", RBTree)):
+        tree = cls.from_sorted(keys, track_sizes=True)
+        cases = (
+            ("select", linear_select, lambda t, k: t.select(k), selects),
+            ("rank", linear_rank, lambda t, k: t.rank(k), ranks),
+            ("count_range", linear_count_range, lambda t, lo, hi: t.count_range(lo, hi), ranges),
+        )
+        for label, slow, fast, queries in cases:
+            slow_t = time_queries(slow, tree, queries)
+            fast_t = time_queries(fast, tree, queries)
+            print(f"{name:<10}{label:<14}{pretty(slow_t):>14}{pretty(fast_t):>16}{slow_t / fast_t:>9.0f}x")
+
+    churn = min(count, CHURN_COUNT)
+    keys = random.sample(range(10 * churn), churn)
+    doomed = random.sample(keys, churn)
+    print(f"\nCost of maintaining sizes: ops/sec on {churn:,} random keys (best of {CHURN_RUNS})\n")
+    print(f"{'tree':<10}{'op':<14}{'no sizes':>14}{'with sizes':>16}{'cost':>10}")
+    for name, cls in (("AVLTree", AVLTree), ("RBTree", RBTree)):
+        runs = [(churn_rate(cls, False, keys, doomed), churn_rate(cls, True, keys, doomed)) for _ in range(CHURN_RUNS)]
+        plain = [max(p[i] for p, _ in runs) for i in (0, 1)]
+        sized = [max(s[i] for _, s in runs) for i in (0, 1)]
+        for label, p, s in zip(("insert", "delete"), plain, sized):
+            print(f"{name:<10}{label:<14}{p:>14,.0f}{s:>16,.0f}{p / s - 1:>10.0%}")
+
+
+if __name__ == "__main__":
+    main()
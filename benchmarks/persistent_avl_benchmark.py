@@ -0,0 +1,101 @@
+# persistent_avl_benchmark.py
+#
+# Keeps every historical version of a sorted key set, two ways: deep-copying
+# an AVLTree before each batch of updates, or PersistentAVLTree, where each
+# update returns a new version that shares all untouched nodes. Reports the
+# memory retained per version (tracemalloc), the time to create a version,
+# and lookup throughput on random old versions. Run it as-is:
+#
+#   python benchmarks/persistent_avl_benchmark.py [keys] [versions] [updates_per_version]
+
+import copy
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "week11"))
+
+from avl_tree import AVLTree, AVLSlotNode
+from persistent_avl_tree import PersistentAVLTree
+
+KEYS = 20_000
+VERSIONS = 20
+UPDATES = 10
+LOOKUPS = 100_000
+
+
+def deepcopy_versions(base, batches):
+    versions = [base]
+    for batch in batches:
+        tree = copy.deepcopy(versions[-1])
+        for kind, k in batch:
+            tree.insert(k) if kind == "insert" else tree.delete(k)
+        versions.append(tree)
+    return versions
+
+
+def persistent_versions(base, batches):
+    versions = [base]
+    for batch in batches:
+        tree = versions[-1]
+        for kind, k in batch:
+            tree = tree.insert(k) if kind == "insert" else tree.delete(k)
+        versions.append(tree)
+    return versions
+
+
+def measure(build, base, batches):
+    """
+    Returns (versions, bytes retained, seconds) for building all versions.
+
+    Timing and memory come from separate runs, since tracemalloc slows
+    allocation-heavy code (deepcopy above all) by an order of magnitude.
+    """
+    start = time.perf_counter()
+    versions = build(base, batches)
+    elapsed = time.perf_counter() - start
+    del versions
+    tracemalloc.start()
+    versions = build(base, batches)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return versions, current, elapsed
+
+
+def lookup_rate(versions, probes, rng):
+    start = time.perf_counter()
+    for k in probes:
+        rng.choice(versions).search(k)
+    return len(probes) / (time.perf_counter() - start)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else KEYS
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else VERSIONS
+    updates = int(sys.argv[3]) if len(sys.argv) > 3 else UPDATES
+    rng = random.Random(0)
+    keys = rng.sample(range(10 * n), n)
+    batches = [[("insert", rng.randrange(10 * n)) if rng.random() < 0.5 else ("delete", rng.choice(keys))
+                for _ in range(updates)] for _ in range(count)]
+    probes = [rng.randrange(10 * n) for _ in range(LOOKUPS)]
+
+    print(f"{count} versions of a {n:,}-key set, {updates} updates per version\n")
+    print(f"{'approach':<30}{'KB/version':>12}{'ms/version':>12}{'lookups/s':>12}")
+    rows = (
+        ("deepcopy(AVLTree)", deepcopy_versions, AVLTree.from_sorted(sorted(keys))),
+        ("deepcopy(AVLTree, __slots__)", deepcopy_versions,
+         AVLTree.from_sorted(sorted(keys), node_type=AVLSlotNode)),
+        ("PersistentAVLTree", persistent_versions, PersistentAVLTree.from_sorted(sorted(keys))),
+    )
+    for label, build, base in rows:
+        versions, retained, elapsed = measure(build, base, batches)
+        rate = lookup_rate(versions, probes, random.Random(1))
+        print(f"{label:<30}{retained / count / 1024:>12,.1f}{elapsed / count * 1000:>12.2f}{rate:>12,.0f}")
+        del versions
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# rb_churn_benchmark.py
+#
+# Keeps an RBTree at a constant size while keys expire: every step inserts a
+# new key and deletes the oldest one. Compares that with the old approach of
+# rebuilding the whole tree after each batch of expirations, and checks that
+# steady-state churn allocates no new nodes. Run it as-is:
+#
+#   python benchmarks/rb_churn_benchmark.py [tree_size] [churn_ops]
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "week12"))
+
+from red_black_tree import RBTree
+
+TREE_SIZE = 100_000
+CHURN_OPS = 100_000
+REBUILD_BATCH = 1_000
+
+
+def churn(tree, live, ops):
+    """Inserts a fresh key and deletes the oldest one, ops times."""
+    for _ in range(ops):
+        k = random.random()
+        tree.insert(k)
+        live.append(k)
+        tree.delete(live.popleft())
+
+
+def rebuild(live, ops):
+    """The old way: append keys, expire a batch, rebuild with inserts."""
+    tree = None
+    for _ in range(0, ops, REBUILD_BATCH):
+        for _ in range(REBUILD_BATCH):
+            live.append(random.random())
+            live.popleft()
+        tree = RBTree()
+        for k in live:
+            tree.insert(k)
+    return tree
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else TREE_SIZE
+    ops = int(sys.argv[2]) if len(sys.argv) > 2 else CHURN_OPS
+
+    live = deque(random.random() for _ in range(size))
+    tree = RBTree.from_iterable(live)
+    live = deque(random.sample(list(live), len(live)))  # expire in random order
+
+    churn(tree, live, size // 10)  # warm up, so the free list is in use
+    tracemalloc.start()
+    start = time.perf_counter()
+    churn(tree, live, ops)
+    elapsed = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Churn at constant size {size:,} ({ops:,} insert+delete pairs)")
+    print(f"  insert+delete pairs/s: {ops / elapsed:,.0f}")
+    print(f"  free list length:      {len(tree._free)}")
+    print(f"  net bytes allocated:   {current:,} ({current / ops:.1f} per op, "
+          f"an RBNode alone is ~{sys.getsizeof(tree.root) + sys.getsizeof(tree.root.__dict__)})")
+
+    rebuild_ops = min(ops, 5 * REBUILD_BATCH)
+    start = time.perf_counter()
+    rebuild(deque(live), rebuild_ops)
+    rebuild_rate = rebuild_ops / (time.perf_counter() - start)
+    print(f"\nRebuild every {REBUILD_BATCH:,} expirations ({rebuild_ops:,} expirations)")
+    print(f"  expirations/s:         {rebuild_rate:,.0f}")
+    ratio = ops / elapsed / rebuild_rate
+    if ratio >= 1:
+        print(f"\nIn-place delete is {ratio:.2f}x faster")
+    else:
+        print(f"\nIn-place delete is {1 / ratio:.2f}x slower")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# recursive_vs_iterative.py
+#
+# Compares ops/sec of the iterative insert/delete used by AVLTree and BST
+# with the recursive versions they replaced (kept here, not in the trees),
+# and shows the recursive BST delete failing on a degenerate tree. Run it
+# as-is:
+#
+#   python benchmarks/recursive_vs_iterative.py [key_count]
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, "week10"), os.path.join(ROOT, "week11")]
+
+from avl_tree import AVLTree
+from bst_tree import BST
+
+KEY_COUNT = 200_000
+DEGENERATE_COUNT = 5_000
+
+
+def min_node(n):
+    while n.left:
+        n = n.left
+    return n
+
+
+def avl_insert(tree, node, key):
+    """Recursive AVL insert into the subtree at node; returns its new root."""
+    if not node:
+        return tree.node_type(key)
+    if tree.multiset and key == node.key:
+        node.count += 1
+        node.size += 1
+        return node
+    if key < node.key:
+        node.left = avl_insert(tree, node.left, key)
+    else:
+        node.right = avl_insert(tree, node.right, key)
+    return tree._rebalance(node)
+
+
+def avl_delete(tree, node, key):
+    """Recursive AVL delete from the subtree at node; returns its new root."""
+    if not node:
+        return None
+    if key < node.key:
+        node.left = avl_delete(tree, node.left, key)
+    elif key > node.key:
+        node.right = avl_delete(tree, node.right, key)
+    elif node.count > 1:
+        node.count -= 1
+    else:
+        if not node.left:
+            return node.right
+        if not node.right:
+            return node.left
+        succ = min_node(node.right)
+        node.key, node.count = succ.key, succ.count
+        succ.count = 1  # the whole successor node moves up, not one repeat
+        node.right = avl_delete(tree, node.right, succ.key)
+    return tree._rebalance(node)
+
+
+def bst_delete(node, key):
+    """Recursive BST delete from the subtree at node; returns its new root."""
+    if not node:
+        return None
+    if key < node.key:
+        node.left = bst_delete(node.left, key)
+    elif key > node.key:
+        node.right = bst_delete(node.right, key)
+    elif node.count > 1:
+        node.count -= 1
+    else:
+        if not node.left:
+            return node.right
+        if not node.right:
+            return node.left
+        succ = min_node(node.right)
+        node.key, node.count = succ.key, succ.count
+        succ.count = 1
+        node.right = bst_delete(node.right, succ.key)
+    return node
+
+
+def avl_insert_recursive(tree, key):
+    tree.root = avl_insert(tree, tree.root, key)
+
+
+def avl_delete_recursive(tree, key):
+    tree.root = avl_delete(tree, tree.root, key)
+
+
+def bst_delete_recursive(tree, key):
+    tree.root = bst_delete(tree.root, key)
+
+
+def ops_per_sec(op, tree, keys):
+    start = time.perf_counter()
+    for k in keys:
+        op(tree, k)
+    return len(keys) / (time.perf_counter() - start)
+
+
+def compare(label, make_tree, recursive, iterative, keys):
+    rec = ops_per_sec(recursive, make_tree(), keys)
+    it = ops_per_sec(iterative, make_tree(), keys)
+    print(f"{label:<22}{rec:>14,.0f}{it:>14,.0f}{it / rec:>10.2f}x")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else KEY_COUNT
+    keys = random.sample(range(count * 10), count)
+    doomed = random.sample(keys, count // 2)
+
+    print(f"Ops/sec on {count:,} random keys\n")
+    print(f"{'operation':<22}{'recursive':>14}{'iterative':>14}{'speedup':>11}")
+
+    compare("AVLTree.insert", AVLTree, avl_insert_recursive, AVLTree.insert, keys)
+    compare("AVLTree.delete", lambda: AVLTree.from_iterable(keys),
+            avl_delete_recursive, AVLTree.delete, doomed)
+    compare("BST.delete", lambda: BST.from_iterable(keys),
+            bst_delete_recursive, BST.delete, doomed)
+
+    print(f"\nDegenerate BST ({DEGENERATE_COUNT:,} keys inserted in order), delete of the deepest key:")
+    tree = BST()
+    for k in range(DEGENERATE_COUNT):
+        tree.insert(k)
+    try:
+        bst_delete_recursive(tree, DEGENERATE_COUNT - 1)
+        print("  recursive: ok")
+    except RecursionError:
+        print("  recursive: RecursionError")
+    tree.delete(DEGENERATE_COUNT - 1)
+    print("  iterative: ok")
+
+
+if __name__ == "__main__":
+    main()
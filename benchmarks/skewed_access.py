@@ -0,0 +1,83 @@
+# skewed_access.py
+#
+# Search throughput and comparisons per lookup on Zipf-distributed traces
+# (workloads.zipf_sampler) for the balanced trees and the self-adjusting
+# ones: AVLTree, RBTree, SplayTree, Treap with random priorities and Treap
+# with priority by access frequency. Every tree is loaded with the same keys
+# in the same order; exponent 0 is a uniform trace for reference.
+#
+#   python benchmarks/skewed_access.py [keys] [lookups]
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, d) for d in ("shared", "week11", "week12", "week13")]
+
+from avl_tree import AVLTree
+from red_black_tree import RBTree
+from splay_tree import SplayTree
+from tree_stats import instrument
+from treap import Treap
+from workloads import zipf_sampler
+
+KEYS = 100_000
+LOOKUPS = 500_000
+EXPONENTS = (0.0, 0.8, 1.1, 1.5)
+
+TREES = {
+    "AVLTree": AVLTree,
+    "RBTree": RBTree,
+    "SplayTree": SplayTree,
+    "Treap": lambda: Treap(seed=0),
+    "Treap(freq)": lambda: Treap(by_frequency=True, seed=0),
+}
+
+
+def build(make, keys):
+    tree = make()
+    for k in keys:
+        tree.insert(k)
+    return tree
+
+
+def timed_searches(tree, trace, repeat=3):
+    """Best of repeat passes over the trace (self-adjusting trees keep adapting)."""
+    search = tree.search
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for k in trace:
+            search(k)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else KEYS
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else LOOKUPS
+    rng = random.Random(0)
+    keys = rng.sample(range(4 * n), n)
+
+    for s in EXPONENTS:
+        trace = zipf_sampler(keys, random.Random(s), s)(lookups)
+        print(f"Zipf s={s} ({n:,} keys, {lookups:,} lookups)")
+        print(f"  {'tree':<13}{'lookups/s':>12}{'cmp/lookup':>12}{'vs AVL':>8}")
+        base = None
+        for name, make in TREES.items():
+            elapsed = timed_searches(build(make, keys), trace)
+            tree = build(make, keys)
+            with instrument(tree) as stats:
+                for k in trace[:lookups // 10]:
+                    tree.search(k)
+            rate = lookups / elapsed
+            base = base or rate
+            print(f"  {name:<13}{rate:>12,.0f}{stats.snapshot()['comparisons_per_op']:>12.1f}"
+                  f"{rate / base:>7.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    main()
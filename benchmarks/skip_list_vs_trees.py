@@ -0,0 +1,79 @@
+# skip_list_vs_trees.py
+#
+# Head-to-head throughput of SkipList against AVLTree and RBTree, phase by
+# phase on the same keys:
+#
+#   bulk     from_sorted() on n ascending keys
+#   insert   n inserts in random order into an empty structure
+#   search   n random searches (half of them misses)
+#   churn    n/2 insert+delete pairs at constant size (write-heavy)
+#   mixed    the 70/20/10 search/insert/delete workload from workloads.py
+#   delete   deleting every key in random order
+#
+#   python benchmarks/skip_list_vs_trees.py [n]
+
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, d) for d in ("week11", "week12", "week13")]
+
+from avl_tree import AVLTree
+from red_black_tree import RBTree
+from skip_list import SkipList
+from workloads import make_workload
+
+N = 100_000
+STRUCTURES = {"AVLTree": AVLTree, "RBTree": RBTree, "SkipList": SkipList}
+PHASES = ("bulk", "insert", "search", "churn", "mixed", "delete")
+
+
+def rate(count, fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return count / (time.perf_counter() - start)
+
+
+def run_phases(cls, n, rng):
+    keys = rng.sample(range(4 * n), n)
+    probes = [rng.randrange(4 * n) for _ in range(n)]
+    fresh = rng.sample(range(4 * n, 8 * n), n // 2)
+    load, ops = make_workload("mixed", n)
+    results = {"bulk": rate(n, cls.from_sorted, range(n))}
+
+    s = cls()
+    results["insert"] = rate(n, lambda: [s.insert(k) for k in keys])
+    results["search"] = rate(n, lambda: [s.search(k) for k in probes])
+
+    def churn():
+        for new, old in zip(fresh, keys):
+            s.insert(new)
+            s.delete(old)
+    results["churn"] = rate(2 * len(fresh), churn)
+
+    m = cls.from_iterable(load)
+    calls = {"insert": m.insert, "search": m.search, "delete": m.delete}
+    results["mixed"] = rate(len(ops), lambda: [calls[kind](k) for kind, k in ops])
+
+    remaining = keys[len(fresh):] + fresh
+    rng.shuffle(remaining)
+    results["delete"] = rate(n, lambda: [s.delete(k) for k in remaining])
+    assert len(s) == 0
+    return results
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N
+    results = {name: run_phases(cls, n, random.Random(0)) for name, cls in STRUCTURES.items()}
+    print(f"Operations per second, n = {n:,}")
+    print(f"{'phase':<8}" + "".join(f"{name:>12}" for name in STRUCTURES) + f"{'skip/AVL':>10}{'skip/RB':>9}")
+    for phase in PHASES:
+        row = [results[name][phase] for name in STRUCTURES]
+        print(f"{phase:<8}" + "".join(f"{r:>12,.0f}" for r in row)
+              + f"{row[2] / row[0]:>9.2f}x{row[2] / row[1]:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
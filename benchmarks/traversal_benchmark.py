@@ -0,0 +1,111 @@
+# traversal_benchmark.py
+#
+# Compares the original list-building recursive traversals (kept here as
+# reference functions) with BinaryTree's explicit-stack generators and the
+# Morris traversals, on a balanced tree and on a left-skewed chain (where
+# the recursive versions hit the recursion limit). Peak extra memory is measured with tracemalloc; the traversal
+# result is consumed without being stored. Run it as-is:
+#
+#   python benchmarks/traversal_benchmark.py [nodes]
+
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "week9", "binary-tree"))
+
+from binary_tree import BinaryTree, Node
+
+NODES = 1_000_000
+
+
+def balanced_tree(n):
+    """Complete tree with n nodes, built level by level."""
+    tree = BinaryTree()
+    if n == 0:
+        return tree
+    tree.root = Node(0)
+    parents = deque([tree.root])
+    for i in range(1, n):
+        node = Node(i)
+        if i % 2:
+            parents[0].left = node
+        else:
+            parents.popleft().right = node
+        parents.append(node)
+    return tree
+
+
+def skewed_tree(n):
+    """Chain of n nodes hanging to the left (every node is a left child)."""
+    tree = BinaryTree()
+    for i in range(n):
+        node = Node(i)
+        node.left = tree.root
+        tree.root = node
+    return tree
+
+
+def recursive_pre_order(r):
+    if r is None:
+        return []
+    return [r.key] + recursive_pre_order(r.left) + recursive_pre_order(r.right)
+
+
+def recursive_in_order(r):
+    if r is None:
+        return []
+    return recursive_in_order(r.left) + [r.key] + recursive_in_order(r.right)
+
+
+def recursive_pos_order(r):
+    if r is None:
+        return []
+    return recursive_pos_order(r.left) + recursive_pos_order(r.right) + [r.key]
+
+
+def run(traversal):
+    """Consumes the traversal; returns (seconds, peak bytes) or None on RecursionError."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        deque(traversal(), maxlen=0)
+    except RecursionError:
+        return None
+    finally:
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else NODES
+    for shape, build in (("balanced", balanced_tree), ("skewed", skewed_tree)):
+        tree = build(n)
+        print(f"{shape} tree, {n:,} nodes")
+        print(f"  {'traversal':<18}{'time (s)':>10}{'peak KB':>12}")
+        cases = (
+            ("recursive pre", lambda: recursive_pre_order(tree.root)),
+            ("iter_pre_order", tree.iter_pre_order),
+            ("morris_pre_order", tree.morris_pre_order),
+            ("recursive in", lambda: recursive_in_order(tree.root)),
+            ("iter_in_order", tree.iter_in_order),
+            ("morris_in_order", tree.morris_in_order),
+            ("recursive pos", lambda: recursive_pos_order(tree.root)),
+            ("iter_pos_order", tree.iter_pos_order),
+        )
+        for name, traversal in cases:
+            result = run(traversal)
+            if result is None:
+                print(f"  {name:<18}{'RecursionError':>22}")
+            else:
+                print(f"  {name:<18}{result[0]:>10.2f}{result[1] / 1024:>12,.1f}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
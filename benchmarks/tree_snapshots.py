@@ -0,0 +1,71 @@
+# tree_snapshots.py
+#
+# Snapshot and restore of AVLTree and RBTree: pickle (which walks every node
+# recursively) versus dump()/load(), which stream the in-order key array
+# and rebuild with from_sorted. Reports seconds to save and to restore and
+# the snapshot size, for int and str keys. Run it as-is:
+#
+#   python benchmarks/tree_snapshots.py [keys]
+
+import gc
+import io
+import os
+import pickle
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, d) for d in ("shared", "week11", "week12")]
+
+from avl_tree import AVLTree
+from red_black_tree import RBTree
+
+KEYS = 200_000
+TREES = {"AVLTree": AVLTree, "RBTree": RBTree}
+
+
+def timed(fn, *args):
+    gc.collect()  # don't bill one run for the garbage of the previous one
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def with_pickle(tree):
+    data, save = timed(pickle.dumps, tree, pickle.HIGHEST_PROTOCOL)
+    copy, restore = timed(pickle.loads, data)
+    return copy, save, restore, len(data)
+
+
+def with_dump(tree):
+    buf = io.BytesIO()
+    _, save = timed(tree.dump, buf)
+    buf.seek(0)
+    copy, restore = timed(type(tree).load, buf)
+    return copy, save, restore, len(buf.getvalue())
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else KEYS
+    rng = random.Random(0)
+    ints = rng.sample(range(10 * n), n)
+    key_sets = {"int": ints, "str": [f"user:{k:010d}" for k in ints]}
+
+    print(f"{n:,} keys\n")
+    print(f"{'tree':<9}{'keys':<6}{'method':<8}{'save s':>9}{'load s':>9}{'MB':>8}")
+    for name, cls in TREES.items():
+        for kind, keys in key_sets.items():
+            tree = cls.from_iterable(keys)
+            for method, run in (("pickle", with_pickle), ("dump", with_dump)):
+                try:
+                    copy, save, restore, size = run(tree)
+                except RecursionError:
+                    print(f"{name:<9}{kind:<6}{method:<8}{'RecursionError':>26}")
+                    continue
+                assert list(copy) == list(tree)
+                print(f"{name:<9}{kind:<6}{method:<8}{save:>9.2f}{restore:>9.2f}{size / 2**20:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# tree_suite.py
+#
+# Drives BST, AVLTree and RBTree through the workloads in workloads.py and
+# reports, per tree/workload/size:
+#
+#   ops_per_sec     measured operations per second (plain int keys)
+#   peak_bytes      tracemalloc peak while loading and running the workload
+#   height          nodes on the longest root-to-leaf path of the final tree
+#   rotations       rotate_left/rotate_right calls during the measured ops
+#   comparisons     key comparisons during the measured ops
+#
+# Rotations and comparisons are collected with shared/tree_stats.py. Each
+# metric comes from its own pass, so tracemalloc and the instrumentation
+# never distort the timing. Results go to stdout and, with --output, to a
+# JSON file that can be diffed against earlier runs. Examples:
+#
+#   python benchmarks/tree_suite.py
+#   python benchmarks/tree_suite.py --sizes 10000 100000 --output results.json
+#   python benchmarks/tree_suite.py --trees AVLTree RBTree --workloads zipf mixed
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, d) for d in ("week10", "week11", "week12", "shared")]
+
+from avl_tree import AVLTree
+from bst_tree import BST
+from red_black_tree import RBTree
+from tree_stats import instrument
+from workloads import WORKLOADS, make_workload
+
+TREES = {"BST": BST, "AVLTree": AVLTree, "RBTree": RBTree}
+DEFAULT_SIZES = (10_000,)
+
+# An unbalanced BST fed sorted keys degenerates into a list: n inserts cost
+# O(n^2), so those runs are skipped above this size.
+BST_DEGENERATE_LIMIT = 20_000
+
+
+def run_ops(tree, load, ops):
+    for k in load:
+        tree.insert(k)
+    calls = {"insert": tree.insert, "search": tree.search, "delete": tree.delete}
+    start = time.perf_counter()
+    for kind, k in ops:
+        calls[kind](k)
+    return time.perf_counter() - start
+
+
+def tree_height(tree):
+    """Iterative height: works for None- and NIL-terminated trees."""
+    nil = getattr(tree, "NIL", None)
+    if tree.root is nil:
+        return 0
+    best, stack = 0, [(tree.root, 1)]
+    while stack:
+        node, depth = stack.pop()
+        best = max(best, depth)
+        for child in (node.left, node.right):
+            if child is not nil:
+                stack.append((child, depth + 1))
+    return best
+
+
+def count_pass(cls, load, ops):
+    """Runs the workload instrumented; returns (comparisons, rotations, height)."""
+    tree = cls()
+    for k in load:
+        tree.insert(k)
+    with instrument(tree) as stats:
+        run_ops(tree, [], ops)
+    return stats.comparisons, stats.rotations, tree_height(tree)
+
+
+def memory_pass(cls, load, ops):
+    tracemalloc.start()
+    run_ops(cls(), load, ops)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def measure(name, cls, workload, n, seed):
+    load, ops = make_workload(workload, n, seed)
+    elapsed = run_ops(cls(), load, ops)
+    comparisons, rotations, height = count_pass(cls, load, ops)
+    return {
+        "tree": name,
+        "workload": workload,
+        "size": n,
+        "ops": len(ops),
+        "ops_per_sec": round(len(ops) / elapsed),
+        "peak_bytes": memory_pass(cls, load, ops),
+        "height": height,
+        "rotations": rotations,
+        "comparisons": comparisons,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BST, AVLTree and RBTree.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--trees", nargs="+", choices=list(TREES), default=list(TREES))
+    parser.add_argument("--workloads", nargs="+", choices=WORKLOADS, default=list(WORKLOADS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = []
+    print(f"{'tree':<9}{'workload':<9}{'size':>10}{'ops/s':>12}{'peak MB':>10}"
+          f"{'height':>8}{'rotations':>11}{'comparisons':>13}")
+    for n in args.sizes:
+        for workload in args.workloads:
+            for name in args.trees:
+                if name == "BST" and workload in ("sorted", "reverse") and n > BST_DEGENERATE_LIMIT:
+                    print(f"{name:<9}{workload:<9}{n:>10,}   skipped (degenerate, O(n^2))")
+                    continue
+                r = measure(name, TREES[name], workload, n, args.seed)
+                results.append(r)
+                print(f"{name:<9}{workload:<9}{n:>10,}{r['ops_per_sec']:>12,}"
+                      f"{r['peak_bytes'] / 2**20:>10.1f}{r['height']:>8}"
+                      f"{r['rotations']:>11,}{r['comparisons']:>13,}")
+
+    if args.output:
+        report = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# workloads.py
+#
+# Workload generators shared by the tree benchmarks. Every generator returns
+# (load, ops): the keys inserted before measuring starts, and the measured
+# operations as ("insert" | "search" | "delete", key) tuples. All of them are
+# deterministic for a given seed, so runs can be compared over time.
+
+import random
+from itertools import accumulate
+
+WORKLOADS = ("random", "sorted", "reverse", "zipf", "mixed")
+
+ZIPF_EXPONENT = 1.1
+MIXED_RATIOS = (("search", 0.7), ("insert", 0.2), ("delete", 0.1))
+
+
+def zipf_sampler(keys, rng, s=ZIPF_EXPONENT):
+    """
+    Returns a function drawing count keys with Zipf(s) popularity.
+
+    Key popularity follows rank: the r-th key of a shuffled copy of keys is
+    drawn with probability proportional to 1 / r**s.
+    """
+    ranked = list(keys)
+    rng.shuffle(ranked)
+    cum = list(accumulate(1 / r ** s for r in range(1, len(ranked) + 1)))
+    return lambda count: rng.choices(ranked, cum_weights=cum, k=count)
+
+
+def random_workload(n, rng):
+    """n inserts of random keys, then n searches (half of them misses)."""
+    keys = rng.sample(range(4 * n), n)
+    ops = [("insert", k) for k in keys]
+    ops += [("search", rng.randrange(4 * n)) for _ in range(n)]
+    return [], ops
+
+
+def sorted_workload(n, rng):
+    """n inserts in ascending order, then n random searches."""
+    ops = [("insert", k) for k in range(n)]
+    ops += [("search", rng.randrange(n)) for _ in range(n)]
+    return [], ops
+
+
+def reverse_workload(n, rng):
+    """n inserts in descending order, then n random searches."""
+    ops = [("insert", k) for k in range(n - 1, -1, -1)]
+    ops += [("search", rng.randrange(n)) for _ in range(n)]
+    return [], ops
+
+
+def zipf_workload(n, rng):
+    """n preloaded keys, then n searches with Zipf-skewed popularity."""
+    load = rng.sample(range(4 * n), n)
+    return load, [("search", k) for k in zipf_sampler(load, rng)(n)]
+
+
+def mixed_workload(n, rng):
+    """n preloaded keys, then n operations: 70% search, 20% insert, 10% delete."""
+    load = rng.sample(range(4 * n), n)
+    live = list(load)
+    kinds = rng.choices([k for k, _ in MIXED_RATIOS], weights=[w for _, w in MIXED_RATIOS], k=n)
+    ops = []
+    for kind in kinds:
+        if kind == "insert":
+            k = rng.randrange(4 * n)
+            live.append(k)
+        elif kind == "delete" and live:
+            i = rng.randrange(len(live))
+            live[i], live[-1] = live[-1], live[i]
+            k = live.pop()
+        else:
+            kind, k = "search", rng.choice(live)
+        ops.append((kind, k))
+    return load, ops
+
+
+GENERATORS = {
+    "random": random_workload,
+    "sorted": sorted_workload,
+    "reverse": reverse_workload,
+    "zipf": zipf_workload,
+    "mixed": mixed_workload,
+}
+
+
+def make_workload(name, n, seed=0):
+    """Returns (load, ops) for the named workload."""
+    return GENERATORS[name](n, random.Random(f"{name}-{n}-{seed}"))
@@ -0,0 +1,107 @@
+# ascii_tree.py
+#
+# Shared pretty printer for the binary trees (BST, AVLTree, RBTree, ...).
+#
+# Layout happens in one iterative in-order pass: every node gets a column
+# right after the label of its in-order predecessor, so labels never
+# overlap and no row ever has to be re-padded. Rows are then built one depth
+# at a time and written straight to the output stream:
+#
+#         ____8___
+#        /        \
+#      _4_       _12_
+#     /   \     /    \
+#     2   6    10    14
+#
+# max_depth stops the layout below a given depth (0 = root only) and
+# max_width keeps only the leftmost max_width columns. Both cut the layout
+# pass short, so a dump of a huge tree costs only what is actually printed;
+# on a big tree, max_depth is usually the one wanted (max_width alone shows
+# the leftmost, deepest corner of the tree).
+
+import sys
+
+
+def _layout(root, label, nil, max_depth, max_width):
+    """
+    Places every node on its row; returns rows of [x, text, left_x, right_x].
+
+    left_x/right_x are the columns of the children's label centers, or None.
+    Nodes are placed left to right, so the pass stops as soon as it runs past
+    max_width; links into the cut-off part point at column max_width.
+    """
+    rows = []
+    cursor = 0
+    stack = []
+    node, depth, parent, side = root, 0, None, None
+    while stack or node is not None:
+        while node is not None:
+            rec = [0, "", None, None]
+            stack.append((node, depth, parent, side, rec))
+            child = node.left
+            if child is nil or (max_depth is not None and depth >= max_depth):
+                child = None
+            node, depth, parent, side = child, depth + 1, rec, 2
+        node, depth, parent, side, rec = stack.pop()
+        text = str(label(node))
+        rec[0], rec[1] = cursor, text
+        cursor += len(text) + 1
+        if parent is not None:
+            parent[side] = rec[0] + len(text) // 2
+        while len(rows) <= depth:
+            rows.append([])
+        rows[depth].append(rec)
+        child = node.right
+        if child is nil or (max_depth is not None and depth >= max_depth):
+            child = None
+        node, depth, parent, side = child, depth + 1, rec, 3
+        if max_width is not None and cursor >= max_width:
+            if node is not None:
+                rec[3] = max_width
+            for _, _, parent, side, _ in stack:
+                if side == 3:
+                    parent[3] = max_width
+            break
+    return rows
+
+
+def render_tree(root, label=str, out=None, max_depth=None, max_width=None, nil=None):
+    """
+    Writes an ASCII drawing of a binary tree to out (default: stdout).
+
+    label maps a node to its text. nil is the sentinel used for missing
+    children (e.g. RBTree.NIL); None is always treated as missing.
+    """
+    out = sys.stdout if out is None else out
+    if root is None or root is nil:
+        return
+    limit = max_width if max_width is not None else float("inf")
+    for row in _layout(root, label, nil, max_depth, max_width):
+        labels, links = [], []
+        pos = link_pos = 0
+        for x, text, lx, rx in row:
+            start = lx + 1 if lx is not None else x
+            if start >= limit:
+                break
+            labels.append(" " * (start - pos))
+            if lx is not None:
+                labels.append("_" * (x - start))
+                links.append(" " * (lx - link_pos) + "/")
+                link_pos = lx + 1
+            labels.append(text)
+            pos = x + len(text)
+            if rx is not None:
+                labels.append("_" * (rx - pos))
+                pos = rx
+                links.append(" " * (rx - link_pos) + "\\")
+                link_pos = rx + 1
+        line = "".join(labels)
+        out.write((line[:max_width] if max_width is not None else line).rstrip() + "\n")
+        if links:
+            line = "".join(links)
+            out.write((line[:max_width] if max_width is not None else line).rstrip() + "\n")
+
+
+def pretty_print(root, label=str, out=None, max_depth=None, max_width=None, nil=None):
+    """Prints a binary tree with aligned branches and multi-digit support."""
+    render_tree(root, label, out, max_depth, max_width, nil)
@@ -0,0 +1,161 @@
+# tree_snapshot.py
+#
+# Compact snapshots of a sorted key sequence, used by AVLTree.dump/load and
+# RBTree.dump/load. Only the in-order keys are stored: heights and colors
+# are recomputed by from_sorted(), which rebuilds the tree in O(n) without
+# rotations, so a snapshot is as deep-tree-proof as the key list itself.
+#
+# Format: MAGIC, then blocks of up to BLOCK keys, then END. Each block starts
+# with a kind byte and its key count (4 bytes, little-endian); the kind is
+# picked per block and sets its layout:
+#   q  int64 keys, 8 bytes each, little-endian
+#   d  float keys, 8 bytes each (IEEE 754), little-endian
+#   s  str keys: the UTF-8 byte lengths as int64, then the UTF-8 bytes
+#      (lone surrogates are kept, with the surrogatepass error handler)
+#   p  anything else: one pickled list
+# Keys are written and read one block at a time, so neither side holds
+# more than a block beyond its own input or output, and a block that needs
+# pickle does not force it on the others. int and float keys go through
+# array.array, with no per-key Python work.
+#
+# save_keys()/load_keys() also accept a path. A path is written through a
+# temporary file in the same folder that replaces the target only once the
+# snapshot is complete, so a dump that fails halfway leaves the previous
+# snapshot (or no file) behind rather than a truncated one.
+
+import os
+import pickle
+import sys
+import tempfile
+from array import array
+from itertools import islice
+
+MAGIC = b"TKEYS\x00\x02\n"
+END = b"\x00" * 5  # a block header with a count of 0
+BLOCK = 1 << 16
+INT64_MIN, INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+def _kind(keys):
+    """Returns the kind byte for a list of keys (see the format above)."""
+    if all(type(k) is int for k in keys):
+        if not keys or (INT64_MIN <= min(keys) and max(keys) <= INT64_MAX):
+            return b"q"
+    elif all(type(k) is float for k in keys):
+        return b"d"
+    elif all(type(k) is str for k in keys):
+        return b"s"
+    return b"p"
+
+
+def _packed(typecode, values):
+    """Returns values as little-endian bytes of the given array typecode."""
+    a = array(typecode, values)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a.tobytes()
+
+
+def _unpacked(typecode, data):
+    """Inverse of _packed: returns the values stored in data as a list."""
+    a = array(typecode)
+    a.frombytes(data)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a.tolist()
+
+
+def _read_exactly(fp, size):
+    """Reads size bytes from fp, raising ValueError if the file ends first."""
+    data = fp.read(size)
+    if len(data) != size:
+        raise ValueError("truncated tree snapshot")
+    return data
+
+
+def write_keys(fp, keys):
+    """
+    Streams keys (any iterable) to the binary file object fp.
+
+    Only one block of keys is held at a time, so the memory used does not
+    grow with the number of keys.
+    """
+    fp.write(MAGIC)
+    keys = iter(keys)
+    while True:
+        block = list(islice(keys, BLOCK))
+        if not block:
+            break
+        kind = _kind(block)
+        fp.write(kind + len(block).to_bytes(4, "little"))
+        if kind == b"q" or kind == b"d":
+            fp.write(_packed(kind.decode(), block))
+        elif kind == b"s":
+            encoded = [k.encode("utf-8", "surrogatepass") for k in block]
+            fp.write(_packed("q", [len(b) for b in encoded]))
+            fp.write(b"".join(encoded))
+        else:
+            pickle.dump(block, fp, pickle.HIGHEST_PROTOCOL)
+    fp.write(END)
+
+
+def read_keys(fp):
+    """
+    Lazily yields the keys written by write_keys to fp, one block at a time.
+
+    Raises ValueError if fp does not hold a snapshot or it is truncated.
+    Blocks of kind p are unpickled, so only read files you trust.
+    """
+    if fp.read(len(MAGIC)) != MAGIC:
+        raise ValueError("not a tree snapshot")
+    while True:
+        header = _read_exactly(fp, 5)
+        kind, count = header[:1], int.from_bytes(header[1:], "little")
+        if not count:
+            return
+        if kind == b"q" or kind == b"d":
+            yield from _unpacked(kind.decode(), _read_exactly(fp, 8 * count))
+        elif kind == b"s":
+            lengths = _unpacked("q", _read_exactly(fp, 8 * count))
+            data, pos = _read_exactly(fp, sum(lengths)), 0
+            for n in lengths:
+                yield data[pos:pos + n].decode("utf-8", "surrogatepass")
+                pos += n
+        elif kind == b"p":
+            try:
+                block = pickle.load(fp)
+            except (EOFError, pickle.UnpicklingError):
+                raise ValueError("truncated tree snapshot") from None
+            if len(block) != count:
+                raise ValueError("corrupt tree snapshot")
+            yield from block
+        else:
+            raise ValueError("unknown tree snapshot block kind")
+
+
+def save_keys(target, keys):
+    """
+    Writes keys to target: a binary file object, streamed to as by
+    write_keys, or a path, which is replaced atomically.
+    """
+    if not isinstance(target, (str, os.PathLike)):
+        write_keys(target, keys)
+        return
+    folder = os.path.dirname(os.path.abspath(target))
+    fd, tmp = tempfile.mkstemp(suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            write_keys(fp, keys)
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_keys(source):
+    """Lazily yields the keys of the snapshot at source, a path or a binary file object."""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as fp:
+            yield from read_keys(fp)
+    else:
+        yield from read_keys(source)
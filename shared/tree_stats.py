@@ -0,0 +1,214 @@
+# tree_stats.py
+#
+# Opt-in hot-path instrumentation for BST, AVLTree and RBTree.
+#
+# Nothing in the tree classes knows about this module. attach() shadows the
+# tree's search/insert/delete/rotate_left/rotate_right with counting wrappers
+# stored on the instance, and detach() deletes them again, so a tree that is
+# not instrumented runs exactly the original code at zero extra cost.
+#
+#   stats = TreeStats()
+#   with instrument(tree, stats):
+#       tree.insert(5)
+#       tree.search(5)
+#   print(stats.snapshot())
+#
+# A metrics exporter can also attach() once and poll stats.snapshot().
+#
+# How the counters are collected:
+#   - search/delete receive the key wrapped in a probe object, so every
+#     comparison the tree makes against it is counted exactly, and every
+#     node it is compared for equality with counts as visited;
+#   - insert cannot store a probe in the tree, so a shadow descent with the
+#     probe measures the path first (one comparison per level plus the final
+#     one that picks the side, or the equality tests of a multiset tree),
+#     then the real insert runs with the plain key;
+#   - rotations are counted by wrapping rotate_left/rotate_right.
+
+from collections import Counter
+from contextlib import contextmanager
+
+PATCHED = ("search", "insert", "delete", "rotate_left", "rotate_right")
+
+
+class TreeStats:
+    """Counters collected while one or more trees are instrumented."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Zeroes every counter."""
+        self.operations = Counter()
+        self.comparisons = 0
+        self.rotations = 0
+        self.nodes_visited = 0
+        self.depth_histogram = Counter()
+
+    def snapshot(self):
+        """Returns the counters as a plain dict (safe to export as JSON)."""
+        ops = sum(self.operations.values())
+        return {
+            "operations": dict(self.operations),
+            "comparisons": self.comparisons,
+            "rotations": self.rotations,
+            "nodes_visited": self.nodes_visited,
+            "comparisons_per_op": self.comparisons / ops if ops else 0.0,
+            "nodes_visited_per_op": self.nodes_visited / ops if ops else 0.0,
+            "depth_histogram": dict(sorted(self.depth_histogram.items())),
+        }
+
+
+class _Probe:
+    """Stands in for a search key and counts the comparisons made with it."""
+
+    __slots__ = ("key", "comparisons", "visits")
+
+    def __init__(self, key):
+        self.key = key
+        self.comparisons = 0
+        self.visits = 0
+
+    def __lt__(self, other):
+        self.comparisons += 1
+        return self.key < other
+
+    def __gt__(self, other):
+        self.comparisons += 1
+        return self.key > other
+
+    def __le__(self, other):
+        self.comparisons += 1
+        return self.key <= other
+
+    def __ge__(self, other):
+        self.comparisons += 1
+        return self.key >= other
+
+    def __eq__(self, other):
+        self.comparisons += 1
+        self.visits += 1
+        return self.key == other
+
+    def __ne__(self, other):
+        self.comparisons += 1
+        self.visits += 1
+        return self.key != other
+
+    __hash__ = None
+
+
+def _nil(tree):
+    return getattr(tree, "NIL", None)
+
+
+def attach(tree, stats=None):
+    """Starts counting operations on tree; returns the TreeStats used."""
+    if "search" in vars(tree):
+        raise ValueError("tree is already instrumented")
+    stats = stats if stats is not None else TreeStats()
+    cls = type(tree)
+    active = [False]  # set while an instrumented operation is running
+
+    def probed(name):
+        original = getattr(cls, name)
+
+        def wrapper(key):
+            if active[0]:
+                return original(tree, key)
+            active[0] = True
+            try:
+                probe = _Probe(key)
+                result = original(tree, probe)
+            finally:
+                active[0] = False
+            _record(stats, name, probe.comparisons, probe.visits)
+            return result
+        return wrapper
+
+    def insert(key):
+        if active[0]:
+            return cls.insert(tree, key)
+        probe, nil, cur = _Probe(key), _nil(tree), tree.root
+        multiset = getattr(tree, "multiset", False)
+        visits, repeat = 0, False
+        while cur is not nil:
+            visits += 1
+            if multiset and probe == cur.key:
+                repeat = True  # only the count is bumped
+                break
+            cur = cur.left if probe < cur.key else cur.right
+        comparisons = probe.comparisons + (1 if visits and not repeat else 0)
+        active[0] = True
+        try:
+            cls.insert(tree, key)
+        finally:
+            active[0] = False
+        _record(stats, "insert", comparisons, visits)
+
+    def rotation(name):
+        original = getattr(cls, name)
+
+        def wrapper(x):
+            stats.rotations += 1
+            return original(tree, x)
+        return wrapper
+
+    tree.search = probed("search")
+    tree.delete = probed("delete")
+    tree.insert = insert
+    if hasattr(cls, "rotate_left"):  # BST never rotates
+        tree.rotate_left = rotation("rotate_left")
+        tree.rotate_right = rotation("rotate_right")
+    return stats
+
+
+def detach(tree):
+    """Removes the instrumentation wrappers; the tree runs at full speed again."""
+    for name in PATCHED:
+        vars(tree).pop(name, None)
+
+
+@contextmanager
+def instrument(tree, stats=None):
+    """Context manager form of attach()/detach(); yields the TreeStats."""
+    stats = attach(tree, stats)
+    try:
+        yield stats
+    finally:
+        detach(tree)
+
+
+def _record(stats, op, comparisons, visits):
+    stats.operations[op] += 1
+    stats.comparisons += comparisons
+    stats.nodes_visited += visits
+    stats.depth_histogram[visits] += 1
+
+
+if __name__ == "__main__":
+    import os
+    import random
+    import sys
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path[:0] = [os.path.join(root, d) for d in ("week10", "week11", "week12")]
+    from avl_tree import AVLTree
+    from bst_tree import BST
+    from red_black_tree import RBTree
+
+    keys = random.sample(range(100_000), 10_000)
+    for cls in (BST, AVLTree, RBTree):
+        tree = cls()
+        with instrument(tree) as stats:
+            for k in keys:
+                tree.insert(k)
+            for k in keys[:1_000]:
+                tree.search(k)
+                tree.delete(k)
+        snap = stats.snapshot()
+        print(f"{cls.__name__:<8} ops={sum(snap['operations'].values()):,} "
+              f"comparisons/op={snap['comparisons_per_op']:.1f} "
+              f"visited/op={snap['nodes_visited_per_op']:.1f} "
+              f"rotations={snap['rotations']:,} "
+              f"max depth={max(snap['depth_histogram'])}")
@@ -0,0 +1,70 @@
+# tree_walk.py
+#
+# Ordered traversal helpers shared by the binary search trees (BST, AVLTree,
+# RBTree, SplayTree, Treap, PersistentAVLTree).
+#
+# range_keys() is the lazy in-order walk behind their items(): it descends
+# straight to the first key in range and keeps only the current path on an
+# explicit stack, so it uses O(height) memory and needs no recursion.
+# ascending() checks the input of the from_sorted() bulk loaders.
+
+from itertools import islice
+
+
+def ascending(keys):
+    """Returns keys as a list, raising ValueError if they are not ascending."""
+    keys = list(keys)
+    for prev, cur in zip(keys, islice(keys, 1, None)):
+        if cur < prev:
+            raise ValueError("from_sorted() requires keys in ascending order")
+    return keys
+
+
+def range_keys(root, lo=None, hi=None, reverse=False, nil=None, counted=False):
+    """
+    Lazily yields the keys k with lo <= k <= hi of the subtree at root, in
+    sorted order (descending if reverse).
+
+    Bounds of None are open. nil is the sentinel used for missing children
+    (None, or e.g. RBTree.NIL). With counted=True each key is yielded
+    node.count times (multiset trees).
+    """
+    stack, cur = [], root
+    if not reverse:
+        while cur is not nil:
+            if lo is not None and cur.key < lo:
+                cur = cur.right
+            else:
+                stack.append(cur)
+                cur = cur.left
+        while stack:
+            node = stack.pop()
+            if hi is not None and hi < node.key:
+                return
+            yield node.key
+            if counted:
+                for _ in range(node.count - 1):
+                    yield node.key
+            cur = node.right
+            while cur is not nil:
+                stack.append(cur)
+                cur = cur.left
+    else:
+        while cur is not nil:
+            if hi is not None and hi < cur.key:
+                cur = cur.left
+            else:
+                stack.append(cur)
+                cur = cur.right
+        while stack:
+            node = stack.pop()
+            if lo is not None and node.key < lo:
+                return
+            yield node.key
+            if counted:
+                for _ in range(node.count - 1):
+                    yield node.key
+            cur = node.left
+            while cur is not nil:
+                stack.append(cur)
+                cur = cur.right
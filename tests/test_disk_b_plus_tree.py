@@ -0,0 +1,23 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "week13"))
+
+from disk_b_plus_tree import DiskBPlusTree  # noqa: E402
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "index.bpt")
+    DiskBPlusTree.build(path, ((k, 10 * k) for k in range(0, 5000, 3)))
+    with DiskBPlusTree(path) as index:
+        assert len(index) == len(range(0, 5000, 3))
+
+
+@pytest.mark.parametrize("data", [b"", b"x", b"not an index" * 500])
+def test_garbage_file_raises_value_error(tmp_path, data):
+    path = tmp_path / "garbage.bpt"
+    path.write_bytes(data)
+    with pytest.raises(ValueError):
+        DiskBPlusTree(str(path))
@@ -0,0 +1,36 @@
+import os
+import pickle
+import sys
+
+import pytest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path[:0] = [os.path.join(ROOT, "week11"), os.path.join(ROOT, "week12")]
+
+from avl_tree import AVLTree  # noqa: E402
+from red_black_tree import RBTree  # noqa: E402
+
+
+@pytest.mark.parametrize("cls", [AVLTree, RBTree])
+def test_lone_surrogate_round_trip(tmp_path, cls):
+    keys = ["", "a", "\ud800", "café", "\udfff z"]
+    path = tmp_path / "keys.snap"
+    cls.from_iterable(keys).dump(path)
+    assert list(cls.load(path)) == sorted(keys)
+
+
+@pytest.mark.parametrize("cls", [AVLTree, RBTree])
+def test_failed_dump_keeps_previous_snapshot(tmp_path, cls):
+    class Unpicklable:  # local classes cannot be pickled
+        def __init__(self, n):
+            self.n = n
+
+        def __lt__(self, other):
+            return self.n < other.n
+
+    path = tmp_path / "keys.snap"
+    cls.from_iterable(range(10)).dump(path)
+    with pytest.raises((AttributeError, pickle.PicklingError)):
+        cls.from_iterable(Unpicklable(n) for n in range(10)).dump(path)
+    assert list(cls.load(path)) == list(range(10))
+    assert os.listdir(tmp_path) == ["keys.snap"]
@@ -1,81 +1,13 @@
-
+import os
+import sys
 from dataclasses import dataclass
+from itertools import groupby
 
 # ---------- Pretty Printer ----------
 
-def _build_ascii_tree(node, label=str):
-    """
-    Recursively builds an ASCII rendering for a binary tree.
-    Returns (lines, width, height, root_x).
-
-    - lines: list of strings (each a row)
-    - width: total character width of the block
-    - height: number of rows
-    - root_x: horizontal index (0-based) of the root label start within the block
-    """
-    if node is None:
-        return [""], 0, 0, 0
-
-    s = str(label(node))
-    sw = len(s)
-
-    left_lines, lw, lh, lx = _build_ascii_tree(getattr(node, "left", None), label) if getattr(node, "left", None) else ([""], 0, 0, 0)
-    right_lines, rw, rh, rx = _build_ascii_tree(getattr(node, "right", None), label) if getattr(node, "right", None) else ([""], 0, 0, 0)
-
-    # No children
-    if lw == 0 and rw == 0:
-        return [s], sw, 1, sw // 2
-
-    # Only left child
-    if rw == 0:
-        # position root so its left edge is just after left block
-        root_x = lw + 1 + (sw // 2)
-        first = " " * (lx + 1) + "_" * (lw - lx - 1) + s
-        second = " " * lx + "/" + " " * (lw - lx - 1 + sw)
-        # pad right side to same height
-        pad = [""] * lh
-        merged = [l.ljust(lw) + " " * sw for l in left_lines]  # right is empty
-        return [first, second] + merged, lw + sw, 2 + lh, root_x
-
-    # Only right child
-    if lw == 0:
-        root_x = (sw // 2)
-        first = s + "_" * rx + " " * (rw - rx)
-        second = " " * (sw + rx) + "\\" + " " * (rw - rx - 1)
-        merged = [" " * sw + r.ljust(rw) for r in right_lines]
-        return [first, second] + merged, sw + rw, 2 + rh, root_x
-
-    # Two children
-    gap = 2  # minimum gap between left and right blocks
-    # position subroots relative to their blocks
-    # left connector goes from (lx) up to just before root; right from after root to (sw+rx)
-    # Build top two connector rows
-    first = (
-        " " * (lx + 1) + "_" * (lw - lx - 1) +
-        s +
-        "_" * rx + " " * (rw - rx)
-    )
-    second = (
-        " " * lx + "/" + " " * (lw - lx - 1) +
-        " " * sw +
-        " " * rx + "\\" + " " * (rw - rx - 1)
-    )
-
-    # Balance heights
-    h = max(lh, rh)
-    left_lines += [""] * (h - lh)
-    right_lines += [""] * (h - rh)
-
-    merged = [l.ljust(lw) + " " * sw + r.ljust(rw) for l, r in zip(left_lines, right_lines)]
-    root_x = lw + (sw // 2)
-    return [first, second] + merged, lw + sw + rw, 2 + h, root_x
-
-
-def pretty_print(root, label=str):
-    """Prints a binary tree with aligned branches and multi-digit support."""
-    lines, _, _, _ = _build_ascii_tree(root, label)
-    for line in lines:
-        print(line.rstrip())
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared"))
+from ascii_tree import pretty_print  # noqa: E402
+from tree_walk import ascending, range_keys  # noqa: E402
 
 
 # ---------- Binary Search Tree (BST) ----------
@@ -85,13 +17,62 @@ class BSTNode:
     key: any
     left = None
     right = None
+    count = 1
+
+def _label(n):
+    """Node label for pretty_print: the key, with its count if repeated."""
+    return str(n.key) if n.count == 1 else f"{n.key}x{n.count}"
 
 class BST:
     """Binary Search Tree implementation with insert, search, delete."""
 
-    def __init__(self):
-        """Initializes an empty BST."""
+    def __init__(self, multiset=False):
+        """
+        Initializes an empty BST.
+
+        With multiset=True each node holds a count, so inserting a key that
+        is already present only increments it instead of adding a node.
+        """
         self.root = None
+        self.multiset = multiset
+
+    @classmethod
+    def from_sorted(cls, iterable, **options):
+        """
+        Builds a perfectly balanced BST from keys in ascending order in O(n).
+
+        Options are forwarded to the constructor. Equal keys may end up in
+        either subtree of each other, which search and delete both handle.
+        """
+        tree = cls(**options)
+        tree._load_sorted(ascending(iterable))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable, **options):
+        """Sorts the keys first, then builds a balanced BST with from_sorted."""
+        return cls.from_sorted(sorted(iterable), **options)
+
+    def _load_sorted(self, keys):
+        """Replaces the tree with a balanced one holding the ascending list keys."""
+        if self.multiset:
+            runs = [(k, len(list(g))) for k, g in groupby(keys)]
+            keys, counts = [k for k, _ in runs], [c for _, c in runs]
+            self.root = self._build_balanced(keys, 0, len(keys), counts)
+        else:
+            self.root = self._build_balanced(keys, 0, len(keys))
+
+    def _build_balanced(self, keys, lo, hi, counts=None):
+        """Builds the subtree for keys[lo:hi] around its middle key (counts: per-key repeats)."""
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = BSTNode(keys[mid])
+        if counts is not None:
+            node.count = counts[mid]
+        node.left = self._build_balanced(keys, lo, mid, counts)
+        node.right = self._build_balanced(keys, mid + 1, hi, counts)
+        return node
 
     def search(self, key):
         """Searches for a key in the tree."""
@@ -102,13 +83,37 @@ class BST:
             cur = cur.left if key < cur.key else cur.right
         return None
 
+    def count(self, key):
+        """Returns how many times key is stored."""
+        if self.multiset:
+            node = self.search(key)
+            return node.count if node else 0
+        return sum(1 for _ in self.items(key, key))
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yields the keys k with lo <= k <= hi in sorted order.
+
+        Bounds of None are open. The walk keeps only the current path on an
+        explicit stack (see tree_walk.range_keys).
+        """
+        return range_keys(self.root, lo, hi, reverse, counted=self.multiset)
+
+    def __iter__(self):
+        """Iterates over all keys in ascending order."""
+        return self.items()
+
     def insert(self, key):
-        """Inserts a key into the BST."""
+        """Inserts a key into the BST (in multiset mode, repeats only bump a count)."""
         if not self.root:
             self.root = BSTNode(key)
             return
         parent, cur = None, self.root
+        multiset = self.multiset
         while cur:
+            if multiset and key == cur.key:
+                cur.count += 1
+                return
             parent = cur
             cur = cur.left if key < cur.key else cur.right
         if key < parent.key:
@@ -116,37 +121,40 @@ class BST:
         else:
             parent.right = BSTNode(key)
 
-    def _min_node(self, x):
-        """Returns the node with the minimum key in a subtree."""
-        while x.left:
-            x = x.left
-        return x
-
     def delete(self, key):
-        """Deletes a key from the BST."""
-        self.root = self._delete_rec(self.root, key)
+        """
+        Deletes a key from the BST.
 
-    def _delete_rec(self, node, key):
-        """Recursive deletion helper."""
-        if not node:
-            return None
-        if key < node.key:
-            node.left = self._delete_rec(node.left, key)
-        elif key > node.key:
-            node.right = self._delete_rec(node.right, key)
+        The walk is iterative, so degenerate (list-shaped) trees of any depth
+        are handled without hitting the recursion limit. In multiset mode one
+        occurrence is removed.
+        """
+        parent, cur = None, self.root
+        while cur and key != cur.key:
+            parent = cur
+            cur = cur.left if key < cur.key else cur.right
+        if not cur:
+            return
+        if cur.count > 1:
+            cur.count -= 1
+            return
+        if cur.left and cur.right:
+            parent, succ = cur, cur.right
+            while succ.left:
+                parent, succ = succ, succ.left
+            cur.key, cur.count = succ.key, succ.count
+            cur = succ
+        child = cur.left or cur.right
+        if parent is None:
+            self.root = child
+        elif parent.left is cur:
+            parent.left = child
         else:
-            if not node.left:
-                return node.right
-            if not node.right:
-                return node.left
-            succ = self._min_node(node.right)
-            node.key = succ.key
-            node.right = self._delete_rec(node.right, succ.key)
-        return node
+            parent.right = child
 
-    def pretty_print(self):
-        """Displays the tree structure."""
-        pretty_print(self.root, label=lambda n: str(n.key))
+    def pretty_print(self, out=None, max_depth=None, max_width=None):
+        """Displays the tree structure (see ascii_tree.render_tree for the options)."""
+        pretty_print(self.root, _label, out, max_depth, max_width)
 
 
 if __name__ == "__main__":
@@ -158,4 +166,7 @@ if __name__ == "__main__":
     print("\nDelete 7 (root):")
     bst.delete(7)
     bst.pretty_print()
-    print("\nSearch 6:", bst.search(6) is not None)
\ No newline at end of file
+    print("\nSearch 6:", bst.search(6) is not None)
+
+    print("\n=== BST.from_sorted ===")
+    BST.from_sorted(range(1, 16)).pretty_print()
\ No newline at end of file
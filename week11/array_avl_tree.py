@@ -0,0 +1,208 @@
+from array import array
+
+from avl_tree import pretty_print
+
+# ---------- Struct-of-arrays AVL Tree ----------
+#
+# Instead of one Python object per node, every node is an index into a set of
+# parallel buffers:
+#
+#   keys[i]    the key of node i (a list, or an array.array for numeric keys)
+#   left[i]    index of the left child  (0 = no child)
+#   right[i]   index of the right child (0 = no child)
+#   height[i]  height of the subtree rooted at i (0 for the null slot)
+#
+# Slot 0 is reserved as the null node, so height[0] == 0 and no None checks
+# are needed. Deleted slots are chained into a free list through left[] and
+# reused by later inserts.
+
+CHILD_TYPE = "i"    # 4-byte signed index -> up to 2**31 - 1 nodes
+HEIGHT_TYPE = "B"   # 1-byte unsigned height, far above any reachable AVL height
+
+
+class _NodeView:
+    """Read-only node-like view over one slot, used by the pretty printer."""
+
+    __slots__ = ("tree", "index")
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+
+    @property
+    def key(self):
+        return self.tree.keys[self.index]
+
+    @property
+    def left(self):
+        i = self.tree.left[self.index]
+        return _NodeView(self.tree, i) if i else None
+
+    @property
+    def right(self):
+        i = self.tree.right[self.index]
+        return _NodeView(self.tree, i) if i else None
+
+
+class ArrayAVLTree:
+    """AVL Tree whose nodes live in parallel array.array buffers."""
+
+    def __init__(self, key_type=None):
+        """
+        Initializes an empty array-backed AVL tree.
+
+        key_type is an array.array typecode (e.g. "q" for 64-bit ints, "d"
+        for floats). Use None to keep arbitrary Python keys in a list.
+        """
+        self.keys = [None] if key_type is None else array(key_type, [0])
+        self.left = array(CHILD_TYPE, [0])
+        self.right = array(CHILD_TYPE, [0])
+        self.height = array(HEIGHT_TYPE, [0])
+        self.root = 0
+        self._free = 0
+        self._count = 0
+
+    def __len__(self):
+        """Returns the number of keys stored in the tree."""
+        return self._count
+
+    # --- slot management ---
+
+    def _alloc(self, key):
+        """Returns a slot for a new leaf, reusing the free list first."""
+        i = self._free
+        if i:
+            self._free = self.left[i]
+            self.keys[i] = key
+            self.left[i] = 0
+            self.right[i] = 0
+            self.height[i] = 1
+            return i
+        self.keys.append(key)
+        self.left.append(0)
+        self.right.append(0)
+        self.height.append(1)
+        return len(self.height) - 1
+
+    def _release(self, i):
+        """Pushes a slot onto the free list."""
+        if isinstance(self.keys, list):
+            self.keys[i] = None
+        self.left[i] = self._free
+        self.right[i] = 0
+        self.height[i] = 0
+        self._free = i
+
+    def _update(self, i):
+        """Updates the height of slot i."""
+        hl = self.height[self.left[i]]
+        hr = self.height[self.right[i]]
+        self.height[i] = 1 + (hl if hl > hr else hr)
+
+    def _balance(self, i):
+        """Returns the balance factor of slot i."""
+        return self.height[self.left[i]] - self.height[self.right[i]]
+
+    # --- rotations ---
+
+    def rotate_left(self, z):
+        """Performs a left rotation and returns the new subtree root."""
+        y = self.right[z]
+        self.right[z] = self.left[y]
+        self.left[y] = z
+        self._update(z)
+        self._update(y)
+        return y
+
+    def rotate_right(self, z):
+        """Performs a right rotation and returns the new subtree root."""
+        y = self.left[z]
+        self.left[z] = self.right[y]
+        self.right[y] = z
+        self._update(z)
+        self._update(y)
+        return y
+
+    def _rebalance(self, i):
+        """Restores the AVL property at slot i and returns the subtree root."""
+        self._update(i)
+        bf = self._balance(i)
+        if bf > 1:
+            if self._balance(self.left[i]) < 0:
+                self.left[i] = self.rotate_left(self.left[i])
+            return self.rotate_right(i)
+        if bf < -1:
+            if self._balance(self.right[i]) > 0:
+                self.right[i] = self.rotate_right(self.right[i])
+            return self.rotate_left(i)
+        return i
+
+    # --- public API ---
+
+    def search(self, key):
+        """Searches for a key; returns its slot index or None."""
+        keys, left, right = self.keys, self.left, self.right
+        cur = self.root
+        while cur:
+            k = keys[cur]
+            if key == k:
+                return cur
+            cur = left[cur] if key < k else right[cur]
+        return None
+
+    def insert(self, key):
+        """Inserts a key into the tree."""
+        self.root = self._insert(self.root, key)
+        self._count += 1
+
+    def _insert(self, i, key):
+        if not i:
+            return self._alloc(key)
+        if key < self.keys[i]:
+            self.left[i] = self._insert(self.left[i], key)
+        else:
+            self.right[i] = self._insert(self.right[i], key)
+        return self._rebalance(i)
+
+    def delete(self, key):
+        """Deletes a key from the tree (no-op if it is missing)."""
+        self.root = self._delete(self.root, key)
+
+    def _delete(self, i, key):
+        if not i:
+            return 0
+        k = self.keys[i]
+        if key < k:
+            self.left[i] = self._delete(self.left[i], key)
+        elif key > k:
+            self.right[i] = self._delete(self.right[i], key)
+        else:
+            if not self.left[i] or not self.right[i]:
+                child = self.left[i] or self.right[i]
+                self._release(i)
+                self._count -= 1
+                return child
+            succ = self.right[i]
+            while self.left[succ]:
+                succ = self.left[succ]
+            self.keys[i] = self.keys[succ]
+            self.right[i] = self._delete(self.right[i], self.keys[succ])
+        return self._rebalance(i)
+
+    def pretty_print(self, out=None, max_depth=None, max_width=None):
+        """Displays the tree structure (see ascii_tree.render_tree for the options)."""
+        root = _NodeView(self, self.root) if self.root else None
+        pretty_print(root, lambda n: str(n.key), out, max_depth, max_width)
+
+
+if __name__ == "__main__":
+    t = ArrayAVLTree("q")
+    for k in [30, 20, 40, 10, 25, 35, 50, 5, 15, 27]:
+        t.insert(k)
+    t.pretty_print()
+    print("\nDelete 20 and 30, then insert 26 (reuses a freed slot):")
+    t.delete(20)
+    t.delete(30)
+    t.insert(26)
+    t.pretty_print()
+    print("\nSlots allocated:", len(t.height) - 1, "keys stored:", len(t))
@@ -1,108 +1,160 @@
+import os
+import sys
+from bisect import bisect_left
 from dataclasses import dataclass
+from itertools import groupby
 
 # ---------- Pretty Printer ----------
 
-def _build_ascii_tree(node, label=str):
-    """
-    Recursively builds an ASCII rendering for a binary tree.
-    Returns (lines, width, height, root_x).
-
-    - lines: list of strings (each a row)
-    - width: total character width of the block
-    - height: number of rows
-    - root_x: horizontal index (0-based) of the root label start within the block
-    """
-    if node is None:
-        return [""], 0, 0, 0
-
-    s = str(label(node))
-    sw = len(s)
-
-    left_lines, lw, lh, lx = _build_ascii_tree(getattr(node, "left", None), label) if getattr(node, "left", None) else ([""], 0, 0, 0)
-    right_lines, rw, rh, rx = _build_ascii_tree(getattr(node, "right", None), label) if getattr(node, "right", None) else ([""], 0, 0, 0)
-
-    # No children
-    if lw == 0 and rw == 0:
-        return [s], sw, 1, sw // 2
-
-    # Only left child
-    if rw == 0:
-        # position root so its left edge is just after left block
-        root_x = lw + 1 + (sw // 2)
-        first = " " * (lx + 1) + "_" * (lw - lx - 1) + s
-        second = " " * lx + "/" + " " * (lw - lx - 1 + sw)
-        # pad right side to same height
-        pad = [""] * lh
-        merged = [l.ljust(lw) + " " * sw for l in left_lines]  # right is empty
-        return [first, second] + merged, lw + sw, 2 + lh, root_x
-
-    # Only right child
-    if lw == 0:
-        root_x = (sw // 2)
-        first = s + "_" * rx + " " * (rw - rx)
-        second = " " * (sw + rx) + "\\" + " " * (rw - rx - 1)
-        merged = [" " * sw + r.ljust(rw) for r in right_lines]
-        return [first, second] + merged, sw + rw, 2 + rh, root_x
-
-    # Two children
-    gap = 2  # minimum gap between left and right blocks
-    # position subroots relative to their blocks
-    # left connector goes from (lx) up to just before root; right from after root to (sw+rx)
-    # Build top two connector rows
-    first = (
-        " " * (lx + 1) + "_" * (lw - lx - 1) +
-        s +
-        "_" * rx + " " * (rw - rx)
-    )
-    second = (
-        " " * lx + "/" + " " * (lw - lx - 1) +
-        " " * sw +
-        " " * rx + "\\" + " " * (rw - rx - 1)
-    )
-
-    # Balance heights
-    h = max(lh, rh)
-    left_lines += [""] * (h - lh)
-    right_lines += [""] * (h - rh)
-
-    merged = [l.ljust(lw) + " " * sw + r.ljust(rw) for l, r in zip(left_lines, right_lines)]
-    root_x = lw + (sw // 2)
-    return [first, second] + merged, lw + sw + rw, 2 + h, root_x
-
-
-def pretty_print(root, label=str):
-    """Prints a binary tree with aligned branches and multi-digit support."""
-    lines, _, _, _ = _build_ascii_tree(root, label)
-    for line in lines:
-        print(line.rstrip())
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared"))
+from ascii_tree import pretty_print  # noqa: E402
+from tree_snapshot import load_keys, save_keys  # noqa: E402
+from tree_walk import ascending, range_keys  # noqa: E402
 
 # ---------- AVL Tree ----------
 
+# Subtree sizes (repeats included), which select/rank/count_range need,
+# are only kept with AVLTree(track_sizes=True). Keeping them means fixing
+# sizes along the whole insert/delete path instead of stopping where
+# rebalancing does; benchmarks/order_statistics.py measures the cost.
+
 @dataclass
 class AVLNode:
     key: any
     left = None
     right = None
     height = 1
+    size = 1
+    count = 1
+
+class AVLSlotNode:
+    """AVL node stored without a per-instance __dict__ (compact storage)."""
+
+    __slots__ = ("key", "left", "right", "height", "size", "count")
+
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+        self.count = 1
 
 def _height(n):
     """Returns node height (0 if None)."""
     return n.height if n else 0
 
+def _size(n):
+    """Returns the number of keys in a subtree, repeats included (0 if None)."""
+    return n.size if n else 0
+
 def _update(n):
-    """Updates the height of a node."""
+    """Updates the height and subtree size of a node."""
+    n.height = 1 + max(_height(n.left), _height(n.right))
+    n.size = n.count + _size(n.left) + _size(n.right)
+
+def _update_height(n):
+    """Updates the height of a node only (trees without track_sizes)."""
     n.height = 1 + max(_height(n.left), _height(n.right))
 
 def _balance(n):
     """Returns balance factor of a node."""
     return (_height(n.left) - _height(n.right)) if n else 0
 
+def _runs(keys, multiset):
+    """
+    Returns (keys, counts) for an ascending key list.
+
+    In multiset mode each run of equal keys is folded into one key and its
+    count; otherwise the keys are returned as they are, with counts None.
+    """
+    if not multiset:
+        return keys, None
+    runs = [(k, len(list(g))) for k, g in groupby(keys)]
+    return [k for k, _ in runs], [c for _, c in runs]
+
+def _label(n):
+    """Node label for pretty_print: the key, with its count if repeated."""
+    return str(n.key) if n.count == 1 else f"{n.key}x{n.count}"
+
 class AVLTree:
     """AVL Tree with self-balancing insert and delete."""
 
-    def __init__(self):
-        """Initializes an empty AVL tree."""
+    def __init__(self, node_type=AVLNode, multiset=False, track_sizes=False):
+        """
+        Initializes an empty AVL tree.
+
+        node_type selects the node storage: AVLNode (default) or
+        AVLSlotNode, which drops the per-node __dict__. With multiset=True
+        each node holds a count, so inserting a key that is already present
+        only increments it (no new node, no rotation); len(), rank() and
+        select() then count every repeat. track_sizes=True keeps subtree
+        sizes up to date, which select(), rank() and count_range() need.
+        """
         self.root = None
+        self.node_type = node_type
+        self.multiset = multiset
+        self.track_sizes = track_sizes
+        self._update_node = _update if track_sizes else _update_height
+        self._count = 0  # None when unknown (see _wrap)
+
+    @classmethod
+    def from_sorted(cls, iterable, **options):
+        """
+        Builds a perfectly balanced AVL tree from ascending keys in O(n).
+
+        Options are forwarded to the constructor. Heights are filled in
+        bottom-up, so no rotations are performed.
+        """
+        tree = cls(**options)
+        tree._load_sorted(ascending(iterable))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable, **options):
+        """Sorts the keys first, then builds the tree with from_sorted."""
+        return cls.from_sorted(sorted(iterable), **options)
+
+    @classmethod
+    def load(cls, source, **options):
+        """
+        Rebuilds a tree from a snapshot written by dump(), given its path or
+        an open binary file.
+
+        Options are forwarded to the constructor. The keys are read block by
+        block and go through from_sorted, so loading is O(n).
+        """
+        return cls.from_sorted(load_keys(source), **options)
+
+    def dump(self, target):
+        """
+        Writes the keys in order to target (see tree_snapshot): a path, which
+        is only replaced once the snapshot is complete, or a binary file.
+        """
+        save_keys(target, self.items())
+
+    def _load_sorted(self, keys):
+        """Replaces the tree with a balanced one holding the ascending list keys."""
+        self._count = len(keys)
+        keys, counts = _runs(keys, self.multiset)
+        self.root = self._build_balanced(keys, 0, len(keys), counts)
+
+    def _build_balanced(self, keys, lo, hi, counts=None):
+        """Builds the subtree for keys[lo:hi] around its middle key (counts: per-key repeats)."""
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self.node_type(keys[mid])
+        node.left = self._build_balanced(keys, lo, mid, counts)
+        node.right = self._build_balanced(keys, mid + 1, hi, counts)
+        if counts is None:
+            # Splitting at the middle gives a height of exactly this.
+            node.height = (hi - lo).bit_length()
+            node.size = hi - lo
+        else:
+            node.count = counts[mid]
+            self._update_node(node)
+        return node
 
     def rotate_left(self, z):
         """Performs a left rotation."""
@@ -110,8 +162,8 @@ class AVLTree:
         T2 = y.left
         y.left = z
         z.right = T2
-        _update(z)
-        _update(y)
+        self._update_node(z)
+        self._update_node(y)
         return y
 
     def rotate_right(self, z):
@@ -120,10 +172,76 @@ class AVLTree:
         T3 = y.right
         y.right = z
         z.left = T3
-        _update(z)
-        _update(y)
+        self._update_node(z)
+        self._update_node(y)
         return y
 
+    def __len__(self):
+        """Returns the number of keys in the tree."""
+        if self._count is None:
+            self._count = sum(1 for _ in self.items())
+        return self._count
+
+    def _need_sizes(self, name):
+        if not self.track_sizes:
+            raise ValueError(f"{name}() needs subtree sizes: build the tree with track_sizes=True")
+
+    def select(self, k):
+        """Returns the k-th smallest key (0-based) in O(log n)."""
+        self._need_sizes("select")
+        if not 0 <= k < _size(self.root):
+            raise IndexError("select index out of range")
+        cur = self.root
+        while True:
+            left = _size(cur.left)
+            if k < left:
+                cur = cur.left
+            elif k < left + cur.count:
+                return cur.key
+            else:
+                k -= left + cur.count
+                cur = cur.right
+
+    def rank(self, key):
+        """Returns how many keys are strictly smaller than key, in O(log n)."""
+        self._need_sizes("rank")
+        r, cur = 0, self.root
+        while cur:
+            if cur.key < key:
+                r += _size(cur.left) + cur.count
+                cur = cur.right
+            else:
+                cur = cur.left
+        return r
+
+    def _rank_le(self, key):
+        """Returns how many keys are smaller than or equal to key."""
+        r, cur = 0, self.root
+        while cur:
+            if key < cur.key:
+                cur = cur.left
+            else:
+                r += _size(cur.left) + cur.count
+                cur = cur.right
+        return r
+
+    def count(self, key):
+        """
+        Returns how many times key is stored (0 or 1 unless multiset).
+
+        O(log n) with track_sizes; otherwise the keys equal to key are walked.
+        """
+        if not self.track_sizes:
+            return sum(1 for _ in self.items(key, key))
+        return self._rank_le(key) - self.rank(key)
+
+    def count_range(self, lo, hi):
+        """Returns how many keys k satisfy lo <= k <= hi, in O(log n)."""
+        self._need_sizes("count_range")
+        if hi < lo:
+            return 0
+        return self._rank_le(hi) - self.rank(lo)
+
     def search(self, key):
         """Searches for a key in the AVL tree."""
         cur = self.root
@@ -133,69 +251,335 @@ class AVLTree:
             cur = cur.left if key < cur.key else cur.right
         return None
 
-    def insert(self, key):
-        """Inserts a key into the AVL tree."""
-        self.root = self._insert(self.root, key)
-
-    def _insert(self, node, key):
-        if not node:
-            return AVLNode(key)
-        if key < node.key:
-            node.left = self._insert(node.left, key)
-        else:
-            node.right = self._insert(node.right, key)
-        _update(node)
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yields the keys k with lo <= k <= hi in sorted order.
+
+        Bounds of None are open. The walk keeps only the current path on an
+        explicit stack (see tree_walk.range_keys).
+        """
+        return range_keys(self.root, lo, hi, reverse, counted=self.multiset)
+
+    def __iter__(self):
+        """Iterates over all keys in ascending order."""
+        return self.items()
+
+    def _rebalance(self, node):
+        """Updates node and rotates if needed; returns the new subtree root."""
+        self._update_node(node)
         bf = _balance(node)
-        if bf > 1 and key < node.left.key:
+        if bf > 1:
+            if _balance(node.left) < 0:
+                node.left = self.rotate_left(node.left)
             return self.rotate_right(node)
-        if bf < -1 and key > node.right.key:
-            return self.rotate_left(node)
-        if bf > 1 and key > node.left.key:
-            node.left = self.rotate_left(node.left)
-            return self.rotate_right(node)
-        if bf < -1 and key < node.right.key:
-            node.right = self.rotate_right(node.right)
+        if bf < -1:
+            if _balance(node.right) > 0:
+                node.right = self.rotate_right(node.right)
             return self.rotate_left(node)
         return node
 
-    def _min_node(self, n):
-        while n.left:
-            n = n.left
-        return n
+    def _retrace(self, path, delta):
+        """
+        Rebalances the nodes on a root-to-leaf path, bottom-up.
+
+        delta is the change in key count below the last node (+1 or -1).
+        Once a subtree keeps its old height, the ancestors above it need no
+        rotations and only their sizes are adjusted (with track_sizes).
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            sub = self._rebalance(node)
+            if i == 0:
+                self.root = sub
+            elif path[i - 1].left is node:
+                path[i - 1].left = sub
+            else:
+                path[i - 1].right = sub
+            if sub.height == old_height:
+                if self.track_sizes:
+                    for j in range(i):
+                        path[j].size += delta
+                return
+
+    def insert(self, key):
+        """
+        Inserts a key into the AVL tree (iterative, no recursion).
+
+        In multiset mode a key that is already present only has its count
+        (and the sizes on its path) incremented.
+        """
+        if self._count is not None:
+            self._count += 1
+        if not self.root:
+            self.root = self.node_type(key)
+            return
+        path, cur = [], self.root
+        multiset = self.multiset
+        while cur:
+            if multiset and key == cur.key:
+                cur.count += 1
+                if self.track_sizes:
+                    cur.size += 1
+                    for node in path:
+                        node.size += 1
+                return
+            path.append(cur)
+            cur = cur.left if key < cur.key else cur.right
+        node = self.node_type(key)
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = node
+        else:
+            parent.right = node
+        self._retrace(path, 1)
 
     def delete(self, key):
-        """Deletes a key from the AVL tree."""
-        self.root = self._delete(self.root, key)
+        """
+        Deletes a key from the AVL tree (iterative, no recursion).
+
+        In multiset mode one occurrence is removed: the node only goes away
+        when its count drops to zero.
+        """
+        path, cur = [], self.root
+        while cur and key != cur.key:
+            path.append(cur)
+            cur = cur.left if key < cur.key else cur.right
+        if not cur:
+            return
+        if self._count is not None:
+            self._count -= 1
+        if cur.count > 1:
+            cur.count -= 1
+            if self.track_sizes:
+                cur.size -= 1
+                for node in path:
+                    node.size -= 1
+            return
+        if cur.left and cur.right:
+            path.append(cur)
+            below = len(path)
+            succ = cur.right
+            while succ.left:
+                path.append(succ)
+                succ = succ.left
+            cur.key, cur.count = succ.key, succ.count
+            # The nodes between cur and succ lose all of succ's repeats, not
+            # just one; settle the difference so _retrace can use delta -1.
+            if self.track_sizes:
+                for node in path[below:]:
+                    node.size -= succ.count - 1
+            cur = succ
+        child = cur.left or cur.right
+        if not path:
+            self.root = child
+            return
+        parent = path[-1]
+        if parent.left is cur:
+            parent.left = child
+        else:
+            parent.right = child
+        self._retrace(path, -1)
+
+    # --- join/split-based bulk operations ---
+    #
+    # These treat the trees as sets (no duplicate keys) and move nodes
+    # instead of copying them, so every operand tree is left empty. split and
+    # join keep multiset counts; union, intersection and difference reject
+    # multiset trees.
+
+    def _wrap(self, root):
+        """
+        Returns a new tree of the same kind around an existing subtree.
+
+        Without track_sizes its key count is unknown until the first len(),
+        which counts the keys once in O(n).
+        """
+        tree = type(self)(node_type=self.node_type, multiset=self.multiset,
+                          track_sizes=self.track_sizes)
+        tree.root = root
+        tree._count = _size(root) if self.track_sizes else None
+        return tree
+
+    def _join(self, l, m, r):
+        """Joins subtrees l < m.key < r through node m, in O(|h(l) - h(r)|)."""
+        hl = l.height if l else 0
+        hr = r.height if r else 0
+        if -1 <= hl - hr <= 1:
+            # Fast path, inlined: this is by far the most common case.
+            m.left, m.right = l, r
+            m.height = (hl if hl > hr else hr) + 1
+            if self.track_sizes:
+                m.size = (l.size if l else 0) + (r.size if r else 0) + m.count
+            return m
+        # Walk down the spine of the taller tree to a subtree of about the
+        # other tree's height, hang m there and retrace like an insert.
+        taller_left = hl > hr
+        short = hr if taller_left else hl
+        path, cur = [], (l if taller_left else r)
+        while _height(cur) > short + 1:
+            path.append(cur)
+            cur = cur.right if taller_left else cur.left
+        if taller_left:
+            m.left, m.right = cur, r
+        else:
+            m.left, m.right = l, cur
+        self._update_node(m)
+        sub = m
+        for node in reversed(path):
+            if taller_left:
+                node.right = sub
+            else:
+                node.left = sub
+            sub = self._rebalance(node)
+        return sub
+
+    def _join2(self, l, r):
+        """Joins subtrees l < r without a middle key."""
+        if not l:
+            return r
+        l, m = self._split_last(l)
+        return self._join(l, m, r)
 
-    def _delete(self, node, key):
-        if not node:
+    def _split_last(self, t):
+        """Detaches the maximum node of t; returns (rest, max_node)."""
+        if not t.right:
+            return t.left, t
+        rest, m = self._split_last(t.right)
+        return self._join(t.left, t, rest), m
+
+    def _split(self, t, key):
+        """Splits subtree t into (keys < key, found, keys > key)."""
+        if not t:
+            return None, False, None
+        l, r = t.left, t.right
+        if key == t.key:
+            return l, True, r
+        if key < t.key:
+            ll, found, lr = self._split(l, key)
+            return ll, found, self._join(lr, t, r)
+        rl, found, rr = self._split(r, key)
+        return self._join(l, t, rl), found, rr
+
+    # The set operations walk the larger tree and carry the smaller one as a
+    # sorted key list. bisect partitions the keys at each visited node, so
+    # only O(m·log(n/m + 1)) nodes of the larger tree are touched and no
+    # per-node split/join work is spent on the smaller tree.
+
+    def _union(self, a, keys, lo, hi):
+        """Returns subtree a with keys[lo:hi] (a non-empty range) added."""
+        if not a:
+            return self._build_balanced(keys, lo, hi)
+        i = bisect_left(keys, a.key, lo, hi)
+        j = i + 1 if i < hi and keys[i] == a.key else i
+        left = self._union(a.left, keys, lo, i) if lo < i else a.left
+        right = self._union(a.right, keys, j, hi) if j < hi else a.right
+        return self._join(left, a, right)
+
+    def _intersection(self, a, keys, lo, hi):
+        """Returns the nodes of subtree a whose keys are in keys[lo:hi]."""
+        if lo >= hi or not a:
             return None
-        if key < node.key:
-            node.left = self._delete(node.left, key)
-        elif key > node.key:
-            node.right = self._delete(node.right, key)
+        i = bisect_left(keys, a.key, lo, hi)
+        found = i < hi and keys[i] == a.key
+        left = self._intersection(a.left, keys, lo, i)
+        right = self._intersection(a.right, keys, i + found, hi)
+        if found:
+            return self._join(left, a, right)
+        return self._join2(left, right)
+
+    def _difference(self, a, keys, lo, hi):
+        """Returns subtree a without the keys in keys[lo:hi]."""
+        if lo >= hi or not a:
+            return a
+        i = bisect_left(keys, a.key, lo, hi)
+        found = i < hi and keys[i] == a.key
+        left = self._difference(a.left, keys, lo, i)
+        right = self._difference(a.right, keys, i + found, hi)
+        if found:
+            return self._join2(left, right)
+        return self._join(left, a, right)
+
+    def _missing(self, b, keys, lo, hi, out):
+        """Appends to out the keys of keys[lo:hi] that are not in subtree b."""
+        if lo >= hi:
+            return
+        if not b:
+            out.extend(keys[lo:hi])
+            return
+        i = bisect_left(keys, b.key, lo, hi)
+        found = i < hi and keys[i] == b.key
+        self._missing(b.left, keys, lo, i, out)
+        self._missing(b.right, keys, i + found, hi, out)
+
+    def _check_sets(self, other):
+        if self.multiset or other.multiset:
+            raise ValueError("set operations are not defined for multiset trees")
+
+    def split(self, key):
+        """
+        Splits the tree around key in O(log n).
+
+        Returns (left, found, right): trees with the keys smaller and larger
+        than key, and whether key itself was present. This tree is emptied.
+        """
+        l, found, r = self._split(self.root, key)
+        self.root = None
+        self._count = 0
+        return self._wrap(l), found, self._wrap(r)
+
+    @classmethod
+    def join(cls, left, key, right):
+        """
+        Joins two trees in O(log n), given every key of left < key < every
+        key of right. Returns the joined tree; left and right are emptied.
+        """
+        tree = left._wrap(left._join(left.root, left.node_type(key), right.root))
+        if left._count is not None and right._count is not None:
+            tree._count = left._count + 1 + right._count
+        left.root = right.root = None
+        left._count = right._count = 0
+        return tree
+
+    def union(self, other):
+        """
+        Returns a tree with the keys of both trees in O(m·log(n/m + 1)),
+        where m is the size of the smaller tree. Both trees are emptied.
+        """
+        self._check_sets(other)
+        big, small = (self, other) if len(self) >= len(other) else (other, self)
+        keys = list(small)
+        root = self._union(big.root, keys, 0, len(keys)) if keys else big.root
+        tree = self._wrap(root)
+        self.root = other.root = None
+        self._count = other._count = 0
+        return tree
+
+    def intersection(self, other):
+        """Returns a tree with the keys present in both trees; both are emptied."""
+        self._check_sets(other)
+        big, small = (self, other) if len(self) >= len(other) else (other, self)
+        keys = list(small)
+        tree = self._wrap(self._intersection(big.root, keys, 0, len(keys)))
+        self.root = other.root = None
+        self._count = other._count = 0
+        return tree
+
+    def difference(self, other):
+        """Returns a tree with the keys of self not in other; both are emptied."""
+        self._check_sets(other)
+        if len(self) >= len(other):
+            keys = list(other)
+            root = self._difference(self.root, keys, 0, len(keys))
         else:
-            if not node.left:
-                return node.right
-            if not node.right:
-                return node.left
-            succ = self._min_node(node.right)
-            node.key = succ.key
-            node.right = self._delete(node.right, succ.key)
-        _update(node)
-        bf = _balance(node)
-        if bf > 1 and _balance(node.left) >= 0:
-            return self.rotate_right(node)
-        if bf > 1 and _balance(node.left) < 0:
-            node.left = self.rotate_left(node.left)
-            return self.rotate_right(node)
-        if bf < -1 and _balance(node.right) <= 0:
-            return self.rotate_left(node)
-        if bf < -1 and _balance(node.right) > 0:
-            node.right = self.rotate_right(node.right)
-            return self.rotate_left(node)
-        return node
+            keys, kept = list(self), []
+            self._missing(other.root, keys, 0, len(keys), kept)
+            root = self._build_balanced(kept, 0, len(kept))
+        tree = self._wrap(root)
+        self.root = other.root = None
+        self._count = other._count = 0
+        return tree
 
-    def pretty_print(self):
-        """Displays the AVL tree structure."""
-        pretty_print(self.root, label=lambda n: str(n.key))
+    def pretty_print(self, out=None, max_depth=None, max_width=None):
+        """Displays the AVL tree structure (see ascii_tree.render_tree for the options)."""
+        pretty_print(self.root, _label, out, max_depth, max_width)
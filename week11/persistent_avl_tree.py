@@ -0,0 +1,177 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared"))
+from ascii_tree import pretty_print  # noqa: E402
+from tree_walk import ascending, range_keys  # noqa: E402
+
+# ---------- Persistent AVL Tree ----------
+#
+# Nodes are never modified after they are built. insert() and delete() copy
+# only the nodes on the search path (plus the few that rebalancing touches)
+# and return a new tree that shares every other subtree with the old one.
+# Each version therefore costs O(log n) new nodes, and every old version
+# stays valid and can be searched or iterated forever.
+
+
+def _height(n):
+    """Returns node height (0 if None)."""
+    return n.height if n else 0
+
+
+def _size(n):
+    """Returns the number of keys in a subtree (0 if None)."""
+    return n.size if n else 0
+
+
+class PersistentAVLNode:
+    """Immutable AVL node; height and size are computed once, at construction."""
+
+    __slots__ = ("key", "left", "right", "height", "size")
+
+    def __init__(self, key, left=None, right=None):
+        self.key = key
+        self.left = left
+        self.right = right
+        self.height = 1 + max(_height(left), _height(right))
+        self.size = 1 + _size(left) + _size(right)
+
+
+def _node(key, left, right):
+    """Builds a node for key over left and right, rotating if they differ in height by 2."""
+    hl, hr = _height(left), _height(right)
+    if hl > hr + 1:
+        if _height(left.left) >= _height(left.right):  # single right rotation
+            return PersistentAVLNode(left.key, left.left,
+                                     PersistentAVLNode(key, left.right, right))
+        lr = left.right  # left-right double rotation
+        return PersistentAVLNode(lr.key, PersistentAVLNode(left.key, left.left, lr.left),
+                                 PersistentAVLNode(key, lr.right, right))
+    if hr > hl + 1:
+        if _height(right.right) >= _height(right.left):  # single left rotation
+            return PersistentAVLNode(right.key, PersistentAVLNode(key, left, right.left),
+                                     right.right)
+        rl = right.left  # right-left double rotation
+        return PersistentAVLNode(rl.key, PersistentAVLNode(key, left, rl.left),
+                                 PersistentAVLNode(right.key, rl.right, right.right))
+    return PersistentAVLNode(key, left, right)
+
+
+def _rebuild(path, node):
+    """Copies the nodes on path (root first), bottom-up, around a new subtree."""
+    for parent, went_left in reversed(path):
+        if went_left:
+            node = _node(parent.key, node, parent.right)
+        else:
+            node = _node(parent.key, parent.left, node)
+    return node
+
+
+def _build_balanced(keys, lo, hi):
+    """Builds the subtree for keys[lo:hi] around its middle key."""
+    if lo >= hi:
+        return None
+    mid = (lo + hi) // 2
+    return PersistentAVLNode(keys[mid], _build_balanced(keys, lo, mid),
+                             _build_balanced(keys, mid + 1, hi))
+
+
+class PersistentAVLTree:
+    """Immutable AVL tree: every update returns a new version sharing structure."""
+
+    __slots__ = ("root",)
+
+    def __init__(self, root=None):
+        """Wraps a root node (None for the empty tree)."""
+        self.root = root
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Builds a perfectly balanced tree from ascending keys in O(n)."""
+        keys = ascending(iterable)
+        return cls(_build_balanced(keys, 0, len(keys)))
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Sorts the keys first, then builds the tree with from_sorted."""
+        return cls.from_sorted(sorted(iterable))
+
+    def __len__(self):
+        """Returns the number of keys in this version."""
+        return _size(self.root)
+
+    def search(self, key):
+        """Searches for a key; returns its (immutable) node or None."""
+        cur = self.root
+        while cur:
+            if key == cur.key:
+                return cur
+            cur = cur.left if key < cur.key else cur.right
+        return None
+
+    def insert(self, key):
+        """Returns a new version containing key (self if it is already there)."""
+        path, cur = [], self.root
+        while cur:
+            if key < cur.key:
+                path.append((cur, True))
+                cur = cur.left
+            elif cur.key < key:
+                path.append((cur, False))
+                cur = cur.right
+            else:
+                return self
+        return PersistentAVLTree(_rebuild(path, PersistentAVLNode(key)))
+
+    def delete(self, key):
+        """Returns a new version without key (self if it is not there)."""
+        path, cur = [], self.root
+        while cur:
+            if key < cur.key:
+                path.append((cur, True))
+                cur = cur.left
+            elif cur.key < key:
+                path.append((cur, False))
+                cur = cur.right
+            else:
+                break
+        if cur is None:
+            return self
+        if cur.left is None or cur.right is None:
+            return PersistentAVLTree(_rebuild(path, cur.left or cur.right))
+        # Two children: the successor takes cur's place; copy the path to it.
+        succ_path, succ = [], cur.right
+        while succ.left:
+            succ_path.append((succ, True))
+            succ = succ.left
+        right = _rebuild(succ_path, succ.right)
+        return PersistentAVLTree(_rebuild(path, _node(succ.key, cur.left, right)))
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yields the keys k with lo <= k <= hi in sorted order
+        (descending if reverse).
+
+        Bounds of None are open. Versions are immutable, so an iteration is
+        never affected by later updates.
+        """
+        return range_keys(self.root, lo, hi, reverse)
+
+    def __iter__(self):
+        """Iterates over all keys in ascending order."""
+        return self.items()
+
+    def pretty_print(self, out=None, max_depth=None, max_width=None):
+        """Displays the tree structure (see ascii_tree.render_tree for the options)."""
+        pretty_print(self.root, lambda n: str(n.key), out, max_depth, max_width)
+
+
+if __name__ == "__main__":
+    v0 = PersistentAVLTree.from_sorted(range(1, 8))
+    v1 = v0.insert(8).insert(9)
+    v2 = v1.delete(4)
+    for name, version in (("v0", v0), ("v1 = v0 + {8, 9}", v1), ("v2 = v1 - {4}", v2)):
+        print(f"{name}:")
+        version.pretty_print()
+        print()
+    print("v2 shares the left subtree of v0:", v2.root.left is v0.root.left)
@@ -0,0 +1,195 @@
+import threading
+import time
+
+from red_black_tree import RBTree
+
+# ---------- Concurrent RBTree ----------
+#
+# One writer, many readers, and readers normally take no lock.
+#
+# Writers serialize on a lock and bump a version counter before and after
+# every change (a seqlock): the version is odd while the tree is being
+# modified and even when it is stable. Readers note the version, walk the
+# tree without locking, and check the version again when they are done
+# (range reads also check it at every step of their walk). If it moved, the walk may have
+# seen a half-rotated tree, so it is thrown away and retried. A descent
+# longer than MAX_WALK, which no valid red-black tree can have, is also
+# retried, so a torn read can never loop for long. A result is only
+# returned if the version did not change during the whole walk, so every
+# read sees one consistent version of the tree (range reads are materialized
+# for that reason).
+#
+# Reads are not strictly lock-free: after MAX_OPTIMISTIC_TRIES failed
+# attempts in a row a reader takes the writer lock and reads under it, so it
+# can wait behind a write. This bounds the retries under a writer that never
+# pauses; with writers that do pause, only a small share of reads ends up
+# locking.
+#
+# This relies on the interpreter lock making single attribute reads and
+# writes atomic, as in CPython.
+
+MAX_OPTIMISTIC_TRIES = 8
+MAX_WALK = 130  # a red-black tree is at most 2 * log2(n + 1) deep
+
+
+class _Retry(Exception):
+    """Raised inside a read when the tree changed under it."""
+
+
+class ConcurrentRBTree:
+    """RBTree wrapper with optimistic (seqlock) readers and one writer at a time."""
+
+    def __init__(self, tree=None):
+        """Wraps tree (a new empty RBTree by default); use only the wrapper afterwards."""
+        self._tree = tree if tree is not None else RBTree()
+        self._lock = threading.Lock()
+        self._version = 0
+
+    # --- writers ---
+
+    def insert(self, key):
+        """Inserts a key (writers serialize on the lock)."""
+        with self._lock:
+            self._version += 1
+            try:
+                self._tree.insert(key)
+            finally:
+                self._version += 1
+
+    def delete(self, key):
+        """Deletes a key (writers serialize on the lock)."""
+        with self._lock:
+            self._version += 1
+            try:
+                self._tree.delete(key)
+            finally:
+                self._version += 1
+
+    # --- readers ---
+
+    def _read(self, walk, *args):
+        """Runs walk(version, *args) optimistically until it sees a stable tree."""
+        for _ in range(MAX_OPTIMISTIC_TRIES):
+            version = self._version
+            if version & 1:
+                time.sleep(0)  # a write is in progress: let the writer finish
+                continue
+            try:
+                result = walk(version, *args)
+            except _Retry:
+                continue
+            except (AttributeError, TypeError):
+                # A torn read can reach the NIL sentinel's None key; only
+                # trust the error if the tree really did not change.
+                if self._version == version:
+                    raise
+                continue
+            if self._version == version:
+                return result
+        with self._lock:
+            return walk(self._version, *args)
+
+    def _search(self, version, key):
+        tree = self._tree
+        nil, cur = tree.NIL, tree.root
+        for _ in range(MAX_WALK):
+            if cur is nil:
+                return False
+            if key == cur.key:
+                return True
+            cur = cur.left if key < cur.key else cur.right
+        raise _Retry
+
+    def search(self, key):
+        """
+        Returns True if key is in the tree, normally without locking.
+
+        Nodes are not handed out: the writer recycles deleted nodes, so a
+        node could change its key after being returned.
+        """
+        return self._read(self._search, key)
+
+    def __contains__(self, key):
+        """Supports `key in tree`."""
+        return self._read(self._search, key)
+
+    def _items(self, version, lo, hi):
+        tree = self._tree
+        nil, out, stack, cur = tree.NIL, [], [], tree.root
+        while cur is not nil:
+            if self._version != version:
+                raise _Retry
+            if lo is not None and cur.key < lo:
+                cur = cur.right
+            else:
+                stack.append(cur)
+                cur = cur.left
+        while stack:
+            if self._version != version:
+                raise _Retry
+            node = stack.pop()
+            if hi is not None and hi < node.key:
+                break
+            out.append(node.key)
+            cur = node.right
+            while cur is not nil:
+                if self._version != version:
+                    raise _Retry  # a recycled node may have closed a cycle
+                stack.append(cur)
+                cur = cur.left
+        return out
+
+    def items(self, lo=None, hi=None):
+        """
+        Returns the keys k with lo <= k <= hi, in sorted order, as a list.
+
+        The list is a consistent snapshot: it was read while no write
+        happened. Bounds of None are open.
+        """
+        return self._read(self._items, lo, hi)
+
+    def snapshot(self):
+        """Returns every key in sorted order as one consistent snapshot."""
+        return self._read(self._items, None, None)
+
+    def _len(self, version):
+        return len(self._tree)
+
+    def __len__(self):
+        """
+        Returns the number of keys in the tree.
+
+        It goes through _read like the other reads: a rotation publishes a
+        new root before fixing its size, so a bare read could be torn.
+        """
+        return self._read(self._len)
+
+
+if __name__ == "__main__":
+    t = ConcurrentRBTree()
+    stop = threading.Event()
+
+    def writer():
+        k = 0
+        while not stop.is_set():
+            t.insert(k)
+            if k >= 1_000:
+                t.delete(k - 1_000)
+            k += 1
+
+    def reader(out):
+        while not stop.is_set():
+            keys = t.items(100, 200)
+            out.append(keys == sorted(keys) and all(100 <= k <= 200 for k in keys))
+
+    results = []
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader, args=(results,))
+                                                   for _ in range(3)]
+    for th in threads:
+        th.start()
+    time.sleep(1)
+    stop.set()
+    for th in threads:
+        th.join()
+    print(f"{len(results):,} range reads during writes, all consistent: {all(results)}")
+    print("Keys now:", len(t))
@@ -0,0 +1,139 @@
+from dataclasses import dataclass
+
+from red_black_tree import RBNode, RBTree, pretty_print
+
+# ---------- Interval Tree ----------
+#
+# An RBTree whose keys are closed intervals (start, end), ordered by start
+# (then end). Every node also stores max_end, the largest end in its
+# subtree, which lets a query skip any subtree that ends before the query
+# starts (CLRS 14.3). max_end is kept up to date by:
+#   - insert: raised along the descent before the node is linked in;
+#   - rotate_left/rotate_right: recomputed for the two rotated nodes, which
+#     covers both fixups;
+#   - delete: recomputed from the splice point up in _refresh_path.
+#
+# Queries are lazy generators that yield intervals in sorted order; the tree
+# must not be modified while one is being consumed.
+
+
+@dataclass(eq=False)
+class IntervalNode(RBNode):
+    max_end: any = None
+
+
+def _interval(key):
+    """Validates an interval key and returns it as a (start, end) tuple."""
+    start, end = key
+    if end < start:
+        raise ValueError("interval start must not be greater than its end")
+    return (start, end)
+
+
+class IntervalTree(RBTree):
+    """Red-Black interval tree with stabbing and overlap queries."""
+
+    def __init__(self, track_sizes=False):
+        """Initializes an empty interval tree (see RBTree for track_sizes)."""
+        super().__init__(track_sizes)
+        self.NIL = IntervalNode(key=None, color="B", size=0)
+        self.root = self.NIL
+
+    def _new_node(self, key):
+        """Returns a fresh red leaf for an interval, with max_end = its end."""
+        key = _interval(key)
+        if self._free:
+            node = self._free.pop()
+            node.key = key
+        else:
+            node = IntervalNode(key=key, color="R", left=self.NIL, right=self.NIL, parent=None)
+        node.max_end = key[1]
+        return node
+
+    def _update_max_end(self, x):
+        """Recomputes max_end of x from its own end and its children."""
+        m = x.key[1]
+        if x.left is not self.NIL and m < x.left.max_end:
+            m = x.left.max_end
+        if x.right is not self.NIL and m < x.right.max_end:
+            m = x.right.max_end
+        x.max_end = m
+
+    def _build_balanced(self, keys, lo, hi, depth, red_depth):
+        """Builds the subtree for keys[lo:hi], then fills in max_end bottom-up."""
+        node = super()._build_balanced(keys, lo, hi, depth, red_depth)
+        if node is not self.NIL:
+            self._update_max_end(node)
+        return node
+
+    def rotate_left(self, x):
+        """Left rotation that also maintains max_end."""
+        super().rotate_left(x)
+        self._update_max_end(x)
+        self._update_max_end(x.parent)
+
+    def rotate_right(self, x):
+        """Right rotation that also maintains max_end."""
+        super().rotate_right(x)
+        self._update_max_end(x)
+        self._update_max_end(x.parent)
+
+    def _refresh_path(self, x):
+        """Recomputes max_end (and subtree sizes, with track_sizes) from x up to the root."""
+        while x is not None and x is not self.NIL:
+            if self.track_sizes:
+                x.size = x.left.size + x.right.size + 1
+            self._update_max_end(x)
+            x = x.parent
+
+    def insert(self, key):
+        """Inserts an interval (start, end) with start <= end."""
+        key = _interval(key)
+        x = self.root
+        while x is not self.NIL:  # the same path RBTree.insert is about to take
+            if x.max_end < key[1]:
+                x.max_end = key[1]
+            x = x.left if key < x.key else x.right
+        super().insert(key)
+
+    def overlapping(self, lo, hi):
+        """
+        Lazily yields the intervals (start, end) with start <= hi and end >= lo.
+
+        Subtrees whose max_end is below lo are never entered, and the walk
+        stops at the first interval that starts after hi, so the cost is
+        O((k + 1) log n) for k results.
+        """
+        nil, stack, cur = self.NIL, [], self.root
+        while True:
+            while cur is not nil and not cur.max_end < lo:
+                stack.append(cur)
+                cur = cur.left
+            if not stack:
+                return
+            node = stack.pop()
+            if hi < node.key[0]:
+                return  # every later interval starts after hi too
+            if not node.key[1] < lo:
+                yield node.key
+            cur = node.right
+
+    def stabbing(self, point):
+        """Lazily yields the intervals (start, end) with start <= point <= end."""
+        return self.overlapping(point, point)
+
+    def pretty_print(self, out=None, max_depth=None, max_width=None):
+        """Displays the tree, labelling each node with its interval, color and max_end."""
+        pretty_print(self.root, lambda n: f"{n.key}({n.color}) max={n.max_end}", out, max_depth,
+                     max_width, nil=self.NIL)
+
+
+if __name__ == "__main__":
+    t = IntervalTree()
+    for iv in [(16, 21), (8, 9), (25, 30), (5, 8), (15, 23), (17, 19), (26, 26), (0, 3), (6, 10), (19, 20)]:
+        t.insert(iv)
+    t.pretty_print()
+    print("\nStabbing 20:", list(t.stabbing(20)))
+    print("Overlapping [9, 16]:", list(t.overlapping(9, 16)))
+    t.delete((15, 23))
+    print("After deleting (15, 23), stabbing 20:", list(t.stabbing(20)))
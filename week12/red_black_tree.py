@@ -1,98 +1,124 @@
+import os
+import sys
 from dataclasses import dataclass
 
 # ---------- Pretty Printer ----------
 
-def _build_ascii_tree(node, label=str):
-    """
-    Recursively builds an ASCII rendering for a binary tree.
-    Returns (lines, width, height, root_x).
-
-    - lines: list of strings (each a row)
-    - width: total character width of the block
-    - height: number of rows
-    - root_x: horizontal index (0-based) of the root label start within the block
-    """
-    if node is None:
-        return [""], 0, 0, 0
-
-    s = str(label(node))
-    sw = len(s)
-
-    left_lines, lw, lh, lx = _build_ascii_tree(getattr(node, "left", None), label) if getattr(node, "left", None) else ([""], 0, 0, 0)
-    right_lines, rw, rh, rx = _build_ascii_tree(getattr(node, "right", None), label) if getattr(node, "right", None) else ([""], 0, 0, 0)
-
-    # No children
-    if lw == 0 and rw == 0:
-        return [s], sw, 1, sw // 2
-
-    # Only left child
-    if rw == 0:
-        # position root so its left edge is just after left block
-        root_x = lw + 1 + (sw // 2)
-        first = " " * (lx + 1) + "_" * (lw - lx - 1) + s
-        second = " " * lx + "/" + " " * (lw - lx - 1 + sw)
-        # pad right side to same height
-        pad = [""] * lh
-        merged = [l.ljust(lw) + " " * sw for l in left_lines]  # right is empty
-        return [first, second] + merged, lw + sw, 2 + lh, root_x
-
-    # Only right child
-    if lw == 0:
-        root_x = (sw // 2)
-        first = s + "_" * rx + " " * (rw - rx)
-        second = " " * (sw + rx) + "\\" + " " * (rw - rx - 1)
-        merged = [" " * sw + r.ljust(rw) for r in right_lines]
-        return [first, second] + merged, sw + rw, 2 + rh, root_x
-
-    # Two children
-    gap = 2  # minimum gap between left and right blocks
-    # position subroots relative to their blocks
-    # left connector goes from (lx) up to just before root; right from after root to (sw+rx)
-    # Build top two connector rows
-    first = (
-        " " * (lx + 1) + "_" * (lw - lx - 1) +
-        s +
-        "_" * rx + " " * (rw - rx)
-    )
-    second = (
-        " " * lx + "/" + " " * (lw - lx - 1) +
-        " " * sw +
-        " " * rx + "\\" + " " * (rw - rx - 1)
-    )
-
-    # Balance heights
-    h = max(lh, rh)
-    left_lines += [""] * (h - lh)
-    right_lines += [""] * (h - rh)
-
-    merged = [l.ljust(lw) + " " * sw + r.ljust(rw) for l, r in zip(left_lines, right_lines)]
-    root_x = lw + (sw // 2)
-    return [first, second] + merged, lw + sw + rw, 2 + h, root_x
-
-
-def pretty_print(root, label=str):
-    """Prints a binary tree with aligned branches and multi-digit support."""
-    lines, _, _, _ = _build_ascii_tree(root, label)
-    for line in lines:
-        print(line.rstrip())
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared"))
+from ascii_tree import pretty_print  # noqa: E402
+from tree_snapshot import load_keys, save_keys  # noqa: E402
+from tree_walk import ascending, range_keys  # noqa: E402
 
 # ---------- Red-Black Tree ----------
 
-@dataclass
+# Subtree sizes, which select/rank/count_range need, are only kept with
+# RBTree(track_sizes=True): two more updates per rotation, a bump on every
+# node of the insert path and a recount from the deleted node up to the
+# root. benchmarks/order_statistics.py measures the cost.
+
+@dataclass(eq=False)
 class RBNode:
     key: any
-    color = "R"
-    left = None
-    right = None
-    parent = None
+    color: str = "R"
+    left: "RBNode" = None
+    right: "RBNode" = None
+    parent: "RBNode" = None
+    size: int = 1
 
 class RBTree:
     """Red-Black Tree following CLRS-style balancing rules."""
 
-    def __init__(self):
-        """Initializes an empty Red-Black tree."""
-        self.NIL = RBNode(key=None, color="B")
+    def __init__(self, track_sizes=False):
+        """
+        Initializes an empty Red-Black tree.
+
+        track_sizes=True keeps subtree sizes up to date, which select(),
+        rank() and count_range() need.
+        """
+        self.NIL = RBNode(key=None, color="B", size=0)
+        self.root = self.NIL
+        self.track_sizes = track_sizes
+        self._count = 0
+        self._free = []  # deleted nodes waiting to be reused by insert
+
+    @classmethod
+    def from_sorted(cls, iterable, **options):
+        """
+        Builds a balanced Red-Black tree from ascending keys in O(n).
+
+        Options are forwarded to the constructor. The tree is built around
+        middle keys, so every level is full except possibly the deepest one;
+        coloring that level red and everything else black satisfies all
+        Red-Black properties without any fixup.
+        """
+        tree = cls(**options)
+        tree._load_sorted(ascending(iterable))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable, **options):
+        """Sorts the keys first, then builds the tree with from_sorted."""
+        return cls.from_sorted(sorted(iterable), **options)
+
+    @classmethod
+    def load(cls, source, **options):
+        """
+        Rebuilds a tree from a snapshot written by dump(), given its path or
+        an open binary file.
+
+        Options are forwarded to the constructor. The keys are read block by
+        block and go through from_sorted, so loading is O(n).
+        """
+        return cls.from_sorted(load_keys(source), **options)
+
+    def dump(self, target):
+        """
+        Writes the keys in order to target (see tree_snapshot): a path, which
+        is only replaced once the snapshot is complete, or a binary file.
+        """
+        save_keys(target, self.items())
+
+    def _load_sorted(self, keys):
+        """Replaces the (empty) tree with a balanced one holding the ascending list keys."""
         self.root = self.NIL
+        self._count = len(keys)
+        if keys:
+            red_depth = len(keys).bit_length() - 1
+            self.root = self._build_balanced(keys, 0, len(keys), 0, red_depth)
+            self.root.parent = None
+
+    def _build_balanced(self, keys, lo, hi, depth, red_depth):
+        """Builds the subtree for keys[lo:hi]; nodes at red_depth are red."""
+        if lo >= hi:
+            return self.NIL
+        mid = (lo + hi) // 2
+        node = self._new_node(keys[mid])
+        node.color = "R" if depth == red_depth and depth > 0 else "B"
+        node.left = self._build_balanced(keys, lo, mid, depth + 1, red_depth)
+        node.right = self._build_balanced(keys, mid + 1, hi, depth + 1, red_depth)
+        if node.left is not self.NIL:
+            node.left.parent = node
+        if node.right is not self.NIL:
+            node.right.parent = node
+        node.size = hi - lo
+        return node
+
+    def _new_node(self, key):
+        """Returns a fresh red leaf, recycling a deleted node when possible."""
+        if self._free:
+            node = self._free.pop()
+            node.key = key
+            return node
+        return RBNode(key=key, color="R", left=self.NIL, right=self.NIL, parent=None)
+
+    def _release(self, node):
+        """Resets a deleted node and keeps it for reuse."""
+        node.key = None
+        node.color = "R"
+        node.left = node.right = self.NIL
+        node.parent = None
+        node.size = 1
+        self._free.append(node)
 
     def _is_nil(self, x):
         """Checks if a node is the sentinel NIL."""
@@ -113,6 +139,9 @@ class RBTree:
             x.parent.right = y
         y.left = x
         x.parent = y
+        if self.track_sizes:
+            y.size = x.size
+            x.size = x.left.size + x.right.size + 1
 
     def rotate_right(self, x):
         """Performs a right rotation around node x."""
@@ -129,6 +158,63 @@ class RBTree:
             x.parent.left = y
         y.right = x
         x.parent = y
+        if self.track_sizes:
+            y.size = x.size
+            x.size = x.left.size + x.right.size + 1
+
+    def __len__(self):
+        """Returns the number of keys in the tree."""
+        return self._count
+
+    def _need_sizes(self, name):
+        if not self.track_sizes:
+            raise ValueError(f"{name}() needs subtree sizes: build the tree with track_sizes=True")
+
+    def select(self, k):
+        """Returns the k-th smallest key (0-based) in O(log n)."""
+        self._need_sizes("select")
+        if not 0 <= k < self.root.size:
+            raise IndexError("select index out of range")
+        cur = self.root
+        while True:
+            left = cur.left.size
+            if k < left:
+                cur = cur.left
+            elif k == left:
+                return cur.key
+            else:
+                k -= left + 1
+                cur = cur.right
+
+    def rank(self, key):
+        """Returns how many keys are strictly smaller than key, in O(log n)."""
+        self._need_sizes("rank")
+        r, cur = 0, self.root
+        while not self._is_nil(cur):
+            if cur.key < key:
+                r += cur.left.size + 1
+                cur = cur.right
+            else:
+                cur = cur.left
+        return r
+
+    def _rank_le(self, key):
+        """Returns how many keys are smaller than or equal to key."""
+        r, cur = 0, self.root
+        while not self._is_nil(cur):
+            if key < cur.key:
+                cur = cur.left
+            else:
+                r += cur.left.size + 1
+                cur = cur.right
+        return r
+
+    def count_range(self, lo, hi):
+        """Returns how many keys k satisfy lo <= k <= hi, in O(log n)."""
+        self._need_sizes("count_range")
+        if hi < lo:
+            return 0
+        return self._rank_le(hi) - self.rank(lo)
 
     def search(self, key):
         """Searches for a key in the Red-Black tree."""
@@ -139,15 +225,34 @@ class RBTree:
             cur = cur.left if key < cur.key else cur.right
         return None
 
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yields the keys k with lo <= k <= hi in sorted order.
+
+        Bounds of None are open. The walk keeps only the current path on an
+        explicit stack (see tree_walk.range_keys).
+        """
+        return range_keys(self.root, lo, hi, reverse, nil=self.NIL)
+
+    def __iter__(self):
+        """Iterates over all keys in ascending order."""
+        return self.items()
+
     def insert(self, key):
         """Inserts a key into the Red-Black tree."""
-        node = RBNode(key=key, color="R", left=self.NIL, right=self.NIL, parent=None)
+        node = self._new_node(key)
         y = self.NIL
         x = self.root
         while not self._is_nil(x):
             y = x
             x = x.left if node.key < x.key else x.right
         node.parent = y if y is not self.NIL else None
+        self._count += 1
+        if self.track_sizes:
+            p = node.parent
+            while p is not None and p is not self.NIL:
+                p.size += 1
+                p = p.parent
         if y is self.NIL:
             self.root = node
         elif node.key < y.key:
@@ -189,10 +294,118 @@ class RBTree:
                     self.rotate_left(z.parent.parent)
         self.root.color = "B"
 
-    def pretty_print(self):
-        """Displays the Red-Black tree structure."""
-        def label(n):
-            if self._is_nil(n):
-                return ""
-            return f"{n.key}({n.color})"
-        pretty_print(self.root if not self._is_nil(self.root) else None, label=label)
+    def _transplant(self, u, v):
+        """Replaces the subtree rooted at u with the one rooted at v."""
+        if u.parent is None or u.parent is self.NIL:
+            self.root = v
+        elif u is u.parent.left:
+            u.parent.left = v
+        else:
+            u.parent.right = v
+        v.parent = u.parent
+
+    def _refresh_path(self, x):
+        """Recomputes subtree sizes from x up to the root (with track_sizes)."""
+        if not self.track_sizes:
+            return
+        while x is not None and x is not self.NIL:
+            x.size = x.left.size + x.right.size + 1
+            x = x.parent
+
+    def delete(self, key):
+        """
+        Deletes a key from the Red-Black tree (no-op if it is missing).
+
+        The removed node goes to a free list and is reused by a later insert,
+        so a tree under steady insert/delete churn stops allocating nodes.
+        Node references returned by search() are invalid after a delete.
+        """
+        z = self.search(key)
+        if z is None:
+            return
+        self._count -= 1
+        y = z
+        y_color = y.color
+        if self._is_nil(z.left):
+            x = z.right
+            start = z.parent
+            self._transplant(z, z.right)
+        elif self._is_nil(z.right):
+            x = z.left
+            start = z.parent
+            self._transplant(z, z.left)
+        else:
+            y = z.right
+            while not self._is_nil(y.left):
+                y = y.left
+            y_color = y.color
+            x = y.right
+            if y.parent is z:
+                x.parent = y
+                start = y
+            else:
+                start = y.parent
+                self._transplant(y, y.right)
+                y.right = z.right
+                y.right.parent = y
+            self._transplant(z, y)
+            y.left = z.left
+            y.left.parent = y
+            y.color = z.color
+        self._refresh_path(start)
+        if y_color == "B":
+            self._delete_fixup(x)
+        self.NIL.parent = None
+        self._release(z)
+
+    def _delete_fixup(self, x):
+        """Restores Red-Black properties after deletion."""
+        while x is not self.root and x.color == "B":
+            if x is x.parent.left:
+                w = x.parent.right
+                if w.color == "R":
+                    w.color = "B"
+                    x.parent.color = "R"
+                    self.rotate_left(x.parent)
+                    w = x.parent.right
+                if w.left.color == "B" and w.right.color == "B":
+                    w.color = "R"
+                    x = x.parent
+                else:
+                    if w.right.color == "B":
+                        w.left.color = "B"
+                        w.color = "R"
+                        self.rotate_right(w)
+                        w = x.parent.right
+                    w.color = x.parent.color
+                    x.parent.color = "B"
+                    w.right.color = "B"
+                    self.rotate_left(x.parent)
+                    x = self.root
+            else:
+                w = x.parent.left
+                if w.color == "R":
+                    w.color = "B"
+                    x.parent.color = "R"
+                    self.rotate_right(x.parent)
+                    w = x.parent.left
+                if w.right.color == "B" and w.left.color == "B":
+                    w.color = "R"
+                    x = x.parent
+                else:
+                    if w.left.color == "B":
+                        w.right.color = "B"
+                        w.color = "R"
+                        self.rotate_left(w)
+                        w = x.parent.left
+                    w.color = x.parent.color
+                    x.parent.color = "B"
+                    w.left.color = "B"
+                    self.rotate_right(x.parent)
+                    x = self.root
+        x.color = "B"
+
+    def pretty_print(self, out=None, max_depth=None, max_width=None):
+        """Displays the Red-Black tree structure (see ascii_tree.render_tree for the options)."""
+        pretty_print(self.root, lambda n: f"{n.key}({n.color})", out, max_depth, max_width,
+                     nil=self.NIL)
@@ -0,0 +1,319 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import islice
+
+# ---------- B+ Tree ----------
+#
+# Every node packs up to `order` sorted keys into one Python list (or one
+# array.array for numeric keys), so a lookup touches about log_order(n)
+# nodes instead of log2(n). Keys only live in the leaves; internal nodes hold
+# separators, where children[i] covers keys in [keys[i-1], keys[i]). Leaves
+# are linked in both directions for range scans.
+#
+# Keys are unique: inserting a key that is already present does nothing.
+
+DEFAULT_ORDER = 64
+
+
+class BPlusLeaf:
+    """Leaf node: sorted keys plus links to its neighbouring leaves."""
+
+    __slots__ = ("keys", "next", "prev")
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.next = None
+        self.prev = None
+
+
+class BPlusInternal:
+    """Internal node: separator keys and len(keys) + 1 children."""
+
+    __slots__ = ("keys", "children")
+
+    def __init__(self, keys, children):
+        self.keys = keys
+        self.children = children
+
+
+class BPlusTree:
+    """B+ Tree with configurable fanout, insert, search, delete and range scans."""
+
+    def __init__(self, order=DEFAULT_ORDER, key_type=None):
+        """
+        Initializes an empty B+ tree.
+
+        order is the maximum number of keys per node (at least 3). key_type
+        is an array.array typecode (e.g. "q") to pack numeric keys, or None
+        to store arbitrary keys in lists.
+        """
+        if order < 3:
+            raise ValueError("order must be at least 3")
+        self.order = order
+        self.key_type = key_type
+        self.root = BPlusLeaf(self._new_keys())
+        self.depth = 0  # number of internal levels above the leaves
+        self._count = 0
+
+    def _new_keys(self, keys=()):
+        """Returns a key container of the configured type."""
+        return list(keys) if self.key_type is None else array(self.key_type, keys)
+
+    @classmethod
+    def from_sorted(cls, iterable, **options):
+        """
+        Bulk-loads a B+ tree from ascending keys in O(n).
+
+        Options are forwarded to the constructor. Duplicates are dropped and
+        nodes are filled evenly, so every node meets the minimum occupancy.
+        """
+        tree = cls(**options)
+        keys = []
+        for k in iterable:
+            if keys and not keys[-1] < k:
+                if k < keys[-1]:
+                    raise ValueError("from_sorted() requires keys in ascending order")
+                continue
+            keys.append(k)
+        if not keys:
+            return tree
+
+        leaves = [BPlusLeaf(tree._new_keys(chunk)) for chunk in _even_chunks(keys, tree.order)]
+        for left, right in zip(leaves, islice(leaves, 1, None)):
+            left.next = right
+            right.prev = left
+        level = leaves
+        mins = [leaf.keys[0] for leaf in leaves]
+        depth = 0
+        while len(level) > 1:
+            parents, parent_mins = [], []
+            start = 0
+            for group in _even_chunks(level, tree.order + 1):
+                end = start + len(group)
+                parents.append(BPlusInternal(tree._new_keys(mins[start + 1:end]), group))
+                parent_mins.append(mins[start])
+                start = end
+            level, mins = parents, parent_mins
+            depth += 1
+        tree.root = level[0]
+        tree.depth = depth
+        tree._count = len(keys)
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable, **options):
+        """Sorts the keys first, then bulk-loads them with from_sorted."""
+        return cls.from_sorted(sorted(iterable), **options)
+
+    def __len__(self):
+        """Returns the number of keys in the tree."""
+        return self._count
+
+    def _find_leaf(self, key):
+        """Descends to the leaf whose range covers key."""
+        node = self.root
+        for _ in range(self.depth):
+            node = node.children[bisect_right(node.keys, key)]
+        return node
+
+    def search(self, key):
+        """Searches for a key; returns the leaf holding it or None."""
+        leaf = self._find_leaf(key)
+        keys = leaf.keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return leaf
+        return None
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yields the keys k with lo <= k <= hi in sorted order.
+
+        Bounds of None are open. The scan descends once and then follows the
+        leaf links, yielding whole slices of each leaf.
+        """
+        if not reverse:
+            if lo is None:
+                leaf = self.root
+                for _ in range(self.depth):
+                    leaf = leaf.children[0]
+                i = 0
+            else:
+                leaf = self._find_leaf(lo)
+                i = bisect_left(leaf.keys, lo)
+            while leaf:
+                keys = leaf.keys
+                if hi is not None and keys and hi < keys[-1]:
+                    yield from islice(keys, i, bisect_right(keys, hi))
+                    return
+                yield from islice(keys, i, None)
+                leaf, i = leaf.next, 0
+        else:
+            if hi is None:
+                leaf = self.root
+                for _ in range(self.depth):
+                    leaf = leaf.children[-1]
+                j = len(leaf.keys)
+            else:
+                leaf = self._find_leaf(hi)
+                j = bisect_right(leaf.keys, hi)
+            while leaf:
+                keys = leaf.keys
+                if lo is not None and keys and keys[0] < lo:
+                    i = bisect_left(keys, lo)
+                    for n in range(j - 1, i - 1, -1):
+                        yield keys[n]
+                    return
+                for n in range(j - 1, -1, -1):
+                    yield keys[n]
+                leaf = leaf.prev
+                j = len(leaf.keys) if leaf else 0
+
+    def __iter__(self):
+        """Iterates over all keys in ascending order."""
+        return self.items()
+
+    def insert(self, key):
+        """Inserts a key, splitting full nodes on the way back up."""
+        path, node = [], self.root
+        for _ in range(self.depth):
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+        keys = node.keys
+        j = bisect_left(keys, key)
+        if j < len(keys) and keys[j] == key:
+            return
+        keys.insert(j, key)
+        self._count += 1
+        if len(keys) <= self.order:
+            return
+
+        # Split the leaf; its right half's first key becomes the separator.
+        mid = len(keys) // 2
+        right = BPlusLeaf(keys[mid:])
+        del keys[mid:]
+        right.next, right.prev = node.next, node
+        if node.next:
+            node.next.prev = right
+        node.next = right
+        sep, child = right.keys[0], right
+
+        while path:
+            parent, i = path.pop()
+            parent.keys.insert(i, sep)
+            parent.children.insert(i + 1, child)
+            if len(parent.keys) <= self.order:
+                return
+            mid = len(parent.keys) // 2
+            sep = parent.keys[mid]
+            child = BPlusInternal(parent.keys[mid + 1:], parent.children[mid + 1:])
+            del parent.keys[mid:]
+            del parent.children[mid + 1:]
+
+        self.root = BPlusInternal(self._new_keys([sep]), [self.root, child])
+        self.depth += 1
+
+    def delete(self, key):
+        """Deletes a key, borrowing from or merging with siblings on underflow."""
+        path, node = [], self.root
+        for _ in range(self.depth):
+            i = bisect_right(node.keys, key)
+            path.append((node, i))
+            node = node.children[i]
+        keys = node.keys
+        j = bisect_left(keys, key)
+        if j == len(keys) or keys[j] != key:
+            return
+        del keys[j]
+        self._count -= 1
+
+        min_keys = self.order // 2
+        while path and len(node.keys) < min_keys:
+            parent, i = path.pop()
+            self._fix_underflow(parent, i)
+            node = parent
+
+        if self.depth and not self.root.keys:
+            self.root = self.root.children[0]
+            self.depth -= 1
+
+    def _fix_underflow(self, parent, i):
+        """Refills parent.children[i] from a sibling, or merges it into one."""
+        node = parent.children[i]
+        left = parent.children[i - 1] if i > 0 else None
+        right = parent.children[i + 1] if i + 1 < len(parent.children) else None
+        min_keys = self.order // 2
+        is_leaf = isinstance(node, BPlusLeaf)
+
+        if left and len(left.keys) > min_keys:
+            if is_leaf:
+                node.keys.insert(0, left.keys.pop())
+                parent.keys[i - 1] = node.keys[0]
+            else:
+                node.keys.insert(0, parent.keys[i - 1])
+                node.children.insert(0, left.children.pop())
+                parent.keys[i - 1] = left.keys.pop()
+            return
+        if right and len(right.keys) > min_keys:
+            if is_leaf:
+                node.keys.append(right.keys.pop(0))
+                parent.keys[i] = right.keys[0]
+            else:
+                node.keys.append(parent.keys[i])
+                node.children.append(right.children.pop(0))
+                parent.keys[i] = right.keys.pop(0)
+            return
+
+        # Neither sibling can lend a key: merge with one of them.
+        if left:
+            left_node, right_node, sep_index = left, node, i - 1
+        else:
+            left_node, right_node, sep_index = node, right, i
+        if is_leaf:
+            left_node.keys.extend(right_node.keys)
+            left_node.next = right_node.next
+            if right_node.next:
+                right_node.next.prev = left_node
+        else:
+            left_node.keys.append(parent.keys[sep_index])
+            left_node.keys.extend(right_node.keys)
+            left_node.children.extend(right_node.children)
+        del parent.keys[sep_index]
+        del parent.children[sep_index + 1]
+
+    def pretty_print(self):
+        """Displays the tree level by level, one bracketed node per key list."""
+        level = [self.root]
+        for _ in range(self.depth + 1):
+            print("  ".join("[" + " ".join(str(k) for k in n.keys) + "]" for n in level))
+            if isinstance(level[0], BPlusLeaf):
+                break
+            level = [c for n in level for c in n.children]
+
+
+def _even_chunks(items, capacity):
+    """Splits items into the fewest chunks of at most capacity, sized evenly."""
+    count = -(-len(items) // capacity)
+    base, extra = divmod(len(items), count)
+    chunks, start = [], 0
+    for n in range(count):
+        end = start + base + (1 if n < extra else 0)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+if __name__ == "__main__":
+    t = BPlusTree(order=4)
+    for k in [10, 20, 5, 6, 12, 30, 7, 17, 3, 25, 27, 1]:
+        t.insert(k)
+    t.pretty_print()
+    print("\nDelete 6, 7 and 5:")
+    for k in (6, 7, 5):
+        t.delete(k)
+    t.pretty_print()
+    print("\nSearch 12:", t.search(12) is not None)
+    print("Keys in [5, 25]:", list(t.items(5, 25)))
+    print("\nBulk-loaded from range(1, 30):")
+    BPlusTree.from_sorted(range(1, 30), order=4).pretty_print()
@@ -0,0 +1,257 @@
+import os
+import sys
+from itertools import islice
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared"))
+from tree_walk import ascending  # noqa: E402
+
+# ---------- Bitmap Trie (64-ary) ----------
+#
+# Ordered set of integers in a fixed universe [0, 2**bits). A key is split
+# into 6-bit digits, and each trie node is a single Python int used as a
+# 64-bit mask of which of its 64 children are non-empty. Level 0 holds the
+# keys themselves: bit (k & 63) of the word for prefix k >> 6. Level d + 1
+# holds one bit per non-empty word of level d, up to a single root word.
+#
+# Words live in one dict per level (prefix -> mask), so memory follows the
+# number of keys, not the universe, and only non-empty words are stored.
+#
+# Every operation touches at most one word per level, i.e. O(log_64 U):
+# 6 levels for 32-bit keys. That is the same flat depth a van Emde Boas
+# tree offers at this size (log2 log2 2**32 = 5), with far less machinery.
+# Within a word, the next or previous set bit comes from int bit tricks
+# (w & -w, bit_length) instead of key comparisons.
+
+WORD_BITS = 6
+WORD_MASK = (1 << WORD_BITS) - 1
+
+
+class BitmapTrie:
+    """Ordered set of integers in [0, 2**bits) backed by a 64-ary bitmap trie."""
+
+    def __init__(self, bits=32):
+        """Initializes an empty set for keys in [0, 2**bits)."""
+        self.bits = bits
+        self.universe = 1 << bits
+        self._levels = [{} for _ in range(max(1, -(-bits // WORD_BITS)))]
+        self._count = 0
+
+    @classmethod
+    def from_iterable(cls, iterable, bits=32):
+        """
+        Builds the set from keys in any order in O(n).
+
+        Level 0 is filled with one dict update per key; each level above is
+        then derived from the prefixes of the one below. Duplicates are
+        dropped.
+        """
+        trie = cls(bits)
+        words = trie._levels[0]
+        for k in iterable:
+            trie._check(k)
+            prefix = k >> WORD_BITS
+            words[prefix] = words.get(prefix, 0) | 1 << (k & WORD_MASK)
+        trie._count = sum(w.bit_count() for w in words.values())
+        for below, level in zip(trie._levels, islice(trie._levels, 1, None)):
+            for key in below:
+                prefix = key >> WORD_BITS
+                level[prefix] = level.get(prefix, 0) | 1 << (key & WORD_MASK)
+        return trie
+
+    @classmethod
+    def from_sorted(cls, iterable, bits=32):
+        """Builds the set from ascending keys in O(n) (see from_iterable)."""
+        return cls.from_iterable(ascending(iterable), bits)
+
+    def _check(self, key):
+        """Raises ValueError unless key is an int in the universe."""
+        if not (type(key) is int and 0 <= key < self.universe):
+            raise ValueError(f"key must be an int in [0, 2**{self.bits})")
+
+    def __len__(self):
+        """Returns the number of keys in the set."""
+        return self._count
+
+    def member(self, key):
+        """Returns True if key is in the set (False for keys outside the universe)."""
+        if type(key) is not int or not 0 <= key < self.universe:
+            return False
+        return self._levels[0].get(key >> WORD_BITS, 0) >> (key & WORD_MASK) & 1 == 1
+
+    __contains__ = member
+
+    def insert(self, key):
+        """Inserts a key, setting its bit and those of any newly non-empty words above it."""
+        self._check(key)
+        for level in self._levels:
+            prefix, bit = key >> WORD_BITS, 1 << (key & WORD_MASK)
+            word = level.get(prefix, 0)
+            if word & bit:
+                return  # only possible on level 0: the key is already there
+            level[prefix] = word | bit
+            if word:
+                break  # the word was non-empty, so its ancestors are already set
+            key = prefix
+        self._count += 1
+
+    def delete(self, key):
+        """Deletes a key (no-op if it is missing), clearing words that become empty."""
+        if not self.member(key):
+            return
+        for level in self._levels:
+            prefix = key >> WORD_BITS
+            word = level[prefix] & ~(1 << (key & WORD_MASK))
+            if word:
+                level[prefix] = word
+                break
+            del level[prefix]
+            key = prefix
+        self._count -= 1
+
+    def _descend(self, depth, node, lowest):
+        """
+        Follows the lowest (or highest) set bits down to a key.
+
+        node indexes a word of level depth - 1; depth = number of levels
+        with node 0 starts from the root word.
+        """
+        levels = self._levels
+        for d in range(depth - 1, -1, -1):
+            word = levels[d][node]
+            digit = (word & -word).bit_length() - 1 if lowest else word.bit_length() - 1
+            node = node << WORD_BITS | digit
+        return node
+
+    def successor(self, key):
+        """Returns the smallest key > key in the set, or None."""
+        if key < 0:
+            return self.min()
+        if key >= self.universe:
+            return None
+        for depth, level in enumerate(self._levels):
+            prefix, digit = key >> WORD_BITS, key & WORD_MASK
+            word = level.get(prefix, 0) >> digit + 1 << digit + 1
+            if word:
+                node = prefix << WORD_BITS | (word & -word).bit_length() - 1
+                return self._descend(depth, node, lowest=True)
+            key = prefix
+        return None
+
+    def predecessor(self, key):
+        """Returns the largest key < key in the set, or None."""
+        if key <= 0:
+            return None
+        if key >= self.universe:
+            return self.max()
+        for depth, level in enumerate(self._levels):
+            prefix, digit = key >> WORD_BITS, key & WORD_MASK
+            word = level.get(prefix, 0) & (1 << digit) - 1
+            if word:
+                node = prefix << WORD_BITS | word.bit_length() - 1
+                return self._descend(depth, node, lowest=False)
+            key = prefix
+        return None
+
+    def min(self):
+        """Returns the smallest key, or None if the set is empty."""
+        return self._descend(len(self._levels), 0, lowest=True) if self._count else None
+
+    def max(self):
+        """Returns the largest key, or None if the set is empty."""
+        return self._descend(len(self._levels), 0, lowest=False) if self._count else None
+
+    def _scan_words(self, start, reverse):
+        """
+        Yields the prefixes of the non-empty level-0 words in key order
+        (descending if reverse), beginning with the word holding start.
+
+        The walk keeps, per level, the bits of the current word not visited
+        yet, like the explicit stack of a tree's in-order walk, so each word
+        costs O(1) amortized instead of a successor() climb from level 0.
+        """
+        levels, stack = self._levels, []
+        for d in range(len(levels) - 1, 0, -1):
+            shift = WORD_BITS * d
+            node, digit = start >> shift + WORD_BITS, start >> shift & WORD_MASK
+            word = levels[d][node]
+            word = word & (1 << digit) - 1 if reverse else word >> digit + 1 << digit + 1
+            stack.append((d, node, word))
+        yield start >> WORD_BITS
+        while stack:
+            depth, node, word = stack.pop()
+            if not word:
+                continue
+            for d in range(depth, 0, -1):
+                if d < depth:
+                    word = levels[d][node]
+                bit = 1 << word.bit_length() - 1 if reverse else word & -word
+                stack.append((d, node, word ^ bit))
+                node = node << WORD_BITS | bit.bit_length() - 1
+            yield node
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yields the keys k with lo <= k <= hi in sorted order.
+
+        Bounds of None are open. One successor/predecessor search finds the
+        first key; from there _scan_words supplies the level-0 words and
+        their keys are read straight off the bits.
+        """
+        words = self._levels[0]
+        lo = 0 if lo is None else max(lo, 0)
+        hi = self.universe - 1 if hi is None else min(hi, self.universe - 1)
+        if hi < lo:
+            return
+        if not reverse:
+            first = lo if self.member(lo) else self.successor(lo)
+            if first is None:
+                return
+            skip = first & WORD_MASK  # bits of the first word below lo
+            for prefix in self._scan_words(first, reverse):
+                word, base = words[prefix] >> skip << skip, prefix << WORD_BITS
+                skip = 0
+                while word:
+                    low = word & -word
+                    key = base | low.bit_length() - 1
+                    if hi < key:
+                        return
+                    yield key
+                    word ^= low
+        else:
+            first = hi if self.member(hi) else self.predecessor(hi)
+            if first is None:
+                return
+            keep = (2 << (first & WORD_MASK)) - 1  # bits of the first word up to hi
+            for prefix in self._scan_words(first, reverse):
+                word, base = words[prefix] & keep, prefix << WORD_BITS
+                keep = -1
+                while word:
+                    top = word.bit_length() - 1
+                    key = base | top
+                    if key < lo:
+                        return
+                    yield key
+                    word ^= 1 << top
+
+    def __iter__(self):
+        """Iterates over all keys in ascending order."""
+        return self.items()
+
+    def pretty_print(self):
+        """Prints the non-empty words of each level, root level first, as bit strings."""
+        for d in range(len(self._levels) - 1, -1, -1):
+            words = sorted(self._levels[d].items())
+            print(f"L{d}: " + "  ".join(f"{p}:{w:b}" for p, w in words))
+
+
+if __name__ == "__main__":
+    t = BitmapTrie(bits=16)
+    for k in [3, 64, 65, 127, 4096, 40000, 7]:
+        t.insert(k)
+    t.pretty_print()
+    print("\nMember 65:", t.member(65), " member 66:", t.member(66))
+    print("Successor of 7:", t.successor(7), " predecessor of 4096:", t.predecessor(4096))
+    print("Keys in [5, 5000]:", list(t.items(5, 5000)))
+    t.delete(64)
+    t.delete(65)
+    print("After deleting 64 and 65:", list(t))
@@ -0,0 +1,272 @@
+# disk_b_plus_tree.py
+#
+# A read-optimized B+ tree index that lives in a single page file and is read
+# through mmap, so indexes larger than RAM can be queried without loading
+# them. Opening an index only parses the header page; every other page is
+# faulted in by the OS on first touch and decoded into a small LRU cache.
+#
+# Like week2/file-performance/compare_files.py, every record is a fixed-width
+# struct: a (key, value) pair of signed 64-bit integers. The value is
+# typically a row id or a byte offset into a data file.
+#
+# File layout (all little-endian, PAGE_SIZE bytes per page):
+#
+#   page 0    header: magic, page size, root page, depth, key count,
+#             first leaf page, last leaf page
+#   leaf      kind=1, n, prev leaf, next leaf, then n (key, value) records
+#   internal  kind=2, n, then n separator keys and n + 1 child page numbers
+#
+# Pages are written bottom-up by build(), leaves first, so building streams
+# the sorted input and only keeps one (first key, page) pair per page.
+
+import mmap
+import struct
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+from b_plus_tree import _even_chunks
+
+PAGE_SIZE = 4096
+MAGIC = b"BPTIDX01"
+
+HEADER_FORMAT = "<8sIqIqqq"      # magic, page size, root, depth, count, first, last
+PAGE_HEADER_FORMAT = "<BHqq"     # kind, n, prev/unused, next/unused
+RECORD_FORMAT = "qq"             # key, value
+KEY_FORMAT = "q"
+
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+PAGE_HEADER_SIZE = struct.calcsize(PAGE_HEADER_FORMAT)
+RECORD_SIZE = struct.calcsize("<" + RECORD_FORMAT)
+KEY_SIZE = struct.calcsize("<" + KEY_FORMAT)
+
+_RECORD = struct.Struct("<" + RECORD_FORMAT)
+
+LEAF, INTERNAL = 1, 2
+NO_PAGE = -1
+
+
+def leaf_capacity(page_size):
+    """Returns how many (key, value) records fit in one leaf page."""
+    return (page_size - PAGE_HEADER_SIZE) // RECORD_SIZE
+
+
+def internal_capacity(page_size):
+    """Returns how many separator keys fit in one internal page."""
+    # n keys + (n + 1) child page numbers, all 8 bytes wide.
+    return (page_size - PAGE_HEADER_SIZE - KEY_SIZE) // (2 * KEY_SIZE)
+
+
+class DiskBPlusTree:
+    """Page-file B+ tree index read through mmap with an LRU page cache."""
+
+    def __init__(self, filename, cache_pages=1024):
+        """Opens an index file built by DiskBPlusTree.build()."""
+        self._file = open(filename, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{filename} is empty, not a B+ tree index")
+        if len(self._map) < HEADER_SIZE or self._map[:len(MAGIC)] != MAGIC:
+            self._map.close()
+            self._file.close()
+            raise ValueError(f"{filename} is not a B+ tree index")
+        _, page_size, root, depth, count, first, last = struct.unpack_from(HEADER_FORMAT, self._map, 0)
+        self.page_size = page_size
+        self.root = root
+        self.depth = depth
+        self._count = count
+        self._first_leaf = first
+        self._last_leaf = last
+        self._cache = OrderedDict()
+        self.cache_pages = cache_pages
+
+    # --- building ---
+
+    @classmethod
+    def build(cls, filename, items, page_size=PAGE_SIZE):
+        """
+        Writes an index file from (key, value) pairs in ascending key order.
+
+        The input is streamed: leaves are written as soon as they fill up.
+        Keys must be unique int64 values; values are int64 as well.
+        """
+        leaf_cap = leaf_capacity(page_size)
+        fanout = internal_capacity(page_size) + 1
+        leaf_records = struct.Struct("<" + RECORD_FORMAT * leaf_cap)
+        with open(filename, "wb") as f:
+            f.write(bytes(page_size))  # header placeholder
+            level = []                 # (first key, page number) per page
+            buffer, prev_key, count = [], None, 0
+            page_no = 1
+
+            def flush_leaf(is_last):
+                nonlocal page_no
+                n = len(buffer) // 2
+                nxt = NO_PAGE if is_last else page_no + 1
+                prv = page_no - 1 if level else NO_PAGE
+                header = struct.pack(PAGE_HEADER_FORMAT, LEAF, n, prv, nxt)
+                body = struct.pack("<" + RECORD_FORMAT * n, *buffer) if n < leaf_cap else leaf_records.pack(*buffer)
+                f.write(header + body + bytes(page_size - PAGE_HEADER_SIZE - len(body)))
+                level.append((buffer[0] if buffer else 0, page_no))
+                page_no += 1
+                buffer.clear()
+
+            for key, value in items:
+                if prev_key is not None and not prev_key < key:
+                    raise ValueError("build() requires unique keys in ascending order")
+                if len(buffer) == 2 * leaf_cap:
+                    flush_leaf(is_last=False)
+                buffer.append(key)
+                buffer.append(value)
+                prev_key = key
+                count += 1
+            if buffer or not level:
+                flush_leaf(is_last=True)
+            first_leaf, last_leaf = level[0][1], level[-1][1]
+
+            depth = 0
+            while len(level) > 1:
+                next_level = []
+                for group in _even_chunks(level, fanout):
+                    seps = [k for k, _ in group[1:]]
+                    children = [p for _, p in group]
+                    header = struct.pack(PAGE_HEADER_FORMAT, INTERNAL, len(seps), NO_PAGE, NO_PAGE)
+                    body = struct.pack(f"<{len(seps)}{KEY_FORMAT}{len(children)}{KEY_FORMAT}", *seps, *children)
+                    f.write(header + body + bytes(page_size - PAGE_HEADER_SIZE - len(body)))
+                    next_level.append((group[0][0], page_no))
+                    page_no += 1
+                level = next_level
+                depth += 1
+
+            f.seek(0)
+            f.write(struct.pack(HEADER_FORMAT, MAGIC, page_size, level[0][1], depth, count, first_leaf, last_leaf))
+
+    # --- page access ---
+
+    def _page(self, page_no):
+        """Returns a decoded page, going through the LRU cache."""
+        cache = self._cache
+        page = cache.get(page_no)
+        if page is not None:
+            cache.move_to_end(page_no)
+            return page
+        offset = page_no * self.page_size
+        kind, n, prev, nxt = struct.unpack_from(PAGE_HEADER_FORMAT, self._map, offset)
+        body = offset + PAGE_HEADER_SIZE
+        if kind == LEAF:
+            records = struct.unpack_from("<" + RECORD_FORMAT * n, self._map, body)
+            page = (records[0::2], records[1::2], prev, nxt)
+        else:
+            fields = struct.unpack_from(f"<{n}{KEY_FORMAT}{n + 1}{KEY_FORMAT}", self._map, body)
+            page = (fields[:n], fields[n:])
+        cache[page_no] = page
+        if len(cache) > self.cache_pages:
+            cache.popitem(last=False)
+        return page
+
+    def _find_leaf(self, key):
+        """Returns the page number of the leaf whose range covers key."""
+        page_no = self.root
+        for _ in range(self.depth):
+            keys, children = self._page(page_no)
+            page_no = children[bisect_right(keys, key)]
+        return page_no
+
+    # --- queries ---
+
+    def __len__(self):
+        """Returns the number of keys in the index."""
+        return self._count
+
+    def search(self, key):
+        """
+        Returns the value stored for key, or None if it is missing.
+
+        A leaf that is not cached is binary-searched in place in the mapping
+        (a handful of 8-byte reads) instead of being decoded and cached, so
+        random lookups do not churn the cache that range scans rely on.
+        """
+        page_no = self._find_leaf(key)
+        page = self._cache.get(page_no)
+        if page is not None:
+            keys, values, _, _ = page
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                return values[i]
+            return None
+        offset = page_no * self.page_size
+        n = struct.unpack_from(PAGE_HEADER_FORMAT, self._map, offset)[1]
+        base = offset + PAGE_HEADER_SIZE
+        lo, hi = 0, n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            k, v = _RECORD.unpack_from(self._map, base + mid * RECORD_SIZE)
+            if k == key:
+                return v
+            if k < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yields the (key, value) pairs with lo <= key <= hi.
+
+        Bounds of None are open. The scan descends once and then follows the
+        leaf links, like BPlusTree.items().
+        """
+        if not reverse:
+            page_no = self._first_leaf if lo is None else self._find_leaf(lo)
+            first = True
+            while page_no != NO_PAGE:
+                keys, values, _, nxt = self._page(page_no)
+                i = bisect_left(keys, lo) if first and lo is not None else 0
+                j = len(keys) if hi is None else bisect_right(keys, hi)
+                yield from zip(keys[i:j], values[i:j])
+                if j < len(keys):
+                    return
+                page_no, first = nxt, False
+        else:
+            page_no = self._last_leaf if hi is None else self._find_leaf(hi)
+            first = True
+            while page_no != NO_PAGE:
+                keys, values, prev, _ = self._page(page_no)
+                j = bisect_right(keys, hi) if first and hi is not None else len(keys)
+                i = 0 if lo is None else bisect_left(keys, lo)
+                for n in range(j - 1, i - 1, -1):
+                    yield keys[n], values[n]
+                if i > 0:
+                    return
+                page_no, first = prev, False
+
+    def __iter__(self):
+        """Iterates over all (key, value) pairs in key order."""
+        return self.items()
+
+    def close(self):
+        """Releases the mapping and the file handle."""
+        self._cache.clear()
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    path = os.path.join(tempfile.gettempdir(), "example_index.bpt")
+    DiskBPlusTree.build(path, ((k, k * 100) for k in range(0, 100_000, 3)))
+    with DiskBPlusTree(path) as index:
+        print(f"{len(index):,} keys, depth {index.depth}, page size {index.page_size}")
+        print("search(300):", index.search(300))
+        print("search(301):", index.search(301))
+        print("items(10, 25):", list(index.items(10, 25)))
+    os.remove(path)
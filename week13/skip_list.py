@@ -0,0 +1,180 @@
+import random
+
+# ---------- Skip List ----------
+#
+# Sorted linked list with express lanes: a node of level h appears in the
+# lists 0..h-1, and level h is reached with probability 2**-(h-1), so a
+# search drops through about log2(n) levels with a couple of steps on each.
+# Each node keeps its forward pointers in one list of exactly h entries.
+#
+# Updates never rebalance: an insert links one node into h lists and a
+# delete unlinks it, which keeps writes cheap.
+#
+# Searches remember the node that stopped them on the level above (`last`):
+# when the same node comes up again one level down it is known to be >= key
+# and is not compared again, which saves about a fifth of the comparisons.
+#
+# Keys are unique: inserting a key that is already present does nothing.
+
+MAX_LEVEL = 32
+
+
+class SkipNode:
+    """Skip list node: key plus one forward pointer per level."""
+
+    __slots__ = ("key", "forward")
+
+    def __init__(self, key, level):
+        self.key = key
+        self.forward = [None] * level
+
+
+class SkipList:
+    """Randomized ordered set with insert, search, delete and range scans."""
+
+    def __init__(self, seed=None):
+        """Initializes an empty skip list; seed makes node levels reproducible."""
+        self.head = SkipNode(None, MAX_LEVEL)
+        self.level = 1  # levels currently in use
+        self._count = 0
+        self._bits = random.Random(seed).getrandbits
+
+    def _random_level(self):
+        """Geometric level in [1, MAX_LEVEL]: one more per trailing zero bit."""
+        bits = self._bits(MAX_LEVEL - 1) | 1 << (MAX_LEVEL - 1)
+        return (bits & -bits).bit_length()
+
+    @classmethod
+    def from_sorted(cls, iterable, seed=None):
+        """
+        Builds a skip list from ascending keys in O(n).
+
+        Each new node is appended after the last node of every level it
+        joins, so nothing is searched. Duplicates are dropped.
+        """
+        sl = cls(seed)
+        tails = [sl.head] * MAX_LEVEL
+        last = None
+        for k in iterable:
+            if sl._count:
+                if k < last:
+                    raise ValueError("from_sorted() requires keys in ascending order")
+                if not last < k:
+                    continue
+            level = sl._random_level()
+            node = SkipNode(k, level)
+            for i in range(level):
+                tails[i].forward[i] = node
+                tails[i] = node
+            if level > sl.level:
+                sl.level = level
+            last = k
+            sl._count += 1
+        return sl
+
+    @classmethod
+    def from_iterable(cls, iterable, seed=None):
+        """Sorts the keys first, then bulk-loads them with from_sorted."""
+        return cls.from_sorted(sorted(iterable), seed)
+
+    def __len__(self):
+        """Returns the number of keys in the skip list."""
+        return self._count
+
+    def _predecessors(self, key):
+        """Returns, per level, the last node whose key is < key."""
+        update = [self.head] * MAX_LEVEL
+        x, last = self.head, None
+        for i in range(self.level - 1, -1, -1):
+            nxt = x.forward[i]
+            while nxt is not last and nxt.key < key:
+                x = nxt
+                nxt = x.forward[i]
+            update[i] = x
+            last = nxt
+        return update
+
+    def search(self, key):
+        """Searches for a key; returns its node or None."""
+        x, last = self.head, None
+        for i in range(self.level - 1, -1, -1):
+            nxt = x.forward[i]
+            while nxt is not last and nxt.key < key:
+                x = nxt
+                nxt = x.forward[i]
+            last = nxt
+        x = x.forward[0]
+        if x is not None and not key < x.key:
+            return x
+        return None
+
+    def insert(self, key):
+        """Inserts a key by linking a new node into its levels."""
+        update = self._predecessors(key)
+        nxt = update[0].forward[0]
+        if nxt is not None and not key < nxt.key:
+            return
+        level = self._random_level()
+        if level > self.level:
+            self.level = level  # update[] already holds head for the new levels
+        node = SkipNode(key, level)
+        forward = node.forward
+        for i in range(level):
+            prev = update[i].forward
+            forward[i] = prev[i]
+            prev[i] = node
+        self._count += 1
+
+    def delete(self, key):
+        """Deletes a key by unlinking its node from every level it is on."""
+        update = self._predecessors(key)
+        node = update[0].forward[0]
+        if node is None or key < node.key:
+            return
+        for i in range(len(node.forward)):
+            update[i].forward[i] = node.forward[i]
+        while self.level > 1 and self.head.forward[self.level - 1] is None:
+            self.level -= 1
+        self._count -= 1
+
+    def items(self, lo=None, hi=None):
+        """
+        Lazily yields the keys k with lo <= k <= hi in sorted order.
+
+        Bounds of None are open. One search finds the first key, then the
+        scan follows the level-0 list.
+        """
+        x = self.head.forward[0] if lo is None else self._predecessors(lo)[0].forward[0]
+        while x is not None:
+            if hi is not None and hi < x.key:
+                return
+            yield x.key
+            x = x.forward[0]
+
+    def __iter__(self):
+        """Iterates over all keys in ascending order."""
+        return self.items()
+
+    def pretty_print(self):
+        """Prints one line per level, top level first."""
+        for i in range(self.level - 1, -1, -1):
+            keys, x = [], self.head.forward[i]
+            while x is not None:
+                keys.append(str(x.key))
+                x = x.forward[i]
+            print(f"L{i}: " + " -> ".join(keys))
+
+
+if __name__ == "__main__":
+    sl = SkipList(seed=7)
+    for k in [30, 10, 50, 20, 40, 60, 70, 5]:
+        sl.insert(k)
+    sl.pretty_print()
+    print("\nDelete 40 and 5:")
+    sl.delete(40)
+    sl.delete(5)
+    sl.pretty_print()
+    print("\nSearch 50:", sl.search(50) is not None)
+    print("Keys in [15, 60]:", list(sl.items(15, 60)))
+    print("\nBulk-loaded from range(1, 16):")
+    SkipList.from_sorted(range(1, 16), seed=7).pretty_print()
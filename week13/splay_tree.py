@@ -0,0 +1,172 @@
+import os
+import sys
+
+# ---------- Pretty Printer ----------
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared"))
+from ascii_tree import pretty_print  # noqa: E402
+from tree_walk import range_keys  # noqa: E402
+
+# ---------- Splay Tree ----------
+#
+# Every search, insert and delete splays the key it touched (or the last
+# node on its path) to the root with top-down splaying, so recently and
+# frequently used keys stay near the top. Operations are O(log n) amortized;
+# on skewed access patterns the hot keys cost far less than log n.
+#
+# Keys are unique: inserting a key that is already present only splays it.
+
+
+class SplayNode:
+    """Splay tree node."""
+
+    __slots__ = ("key", "left", "right")
+
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+
+
+class SplayTree:
+    """Self-adjusting binary search tree with insert, search, delete and range scans."""
+
+    def __init__(self):
+        """Initializes an empty splay tree."""
+        self.root = None
+        self._count = 0
+        self._header = SplayNode(None)  # scratch node reused by _splay
+
+    def __len__(self):
+        """Returns the number of keys in the tree."""
+        return self._count
+
+    def _splay(self, key):
+        """
+        Top-down splay: moves key, or the last node on its search path, to the root.
+
+        The tree is split into a left part (keys < key) and a right part
+        (keys > key) while descending, then reassembled around the final
+        node. Zig-zig steps rotate first, which is what halves the depth of
+        the nodes along the path.
+        """
+        t = self.root
+        header = self._header
+        header.left = header.right = None
+        left = right = header
+        while True:
+            if key < t.key:
+                if t.left is None:
+                    break
+                if key < t.left.key:  # zig-zig: rotate right
+                    y = t.left
+                    t.left = y.right
+                    y.right = t
+                    t = y
+                    if t.left is None:
+                        break
+                right.left = t  # link t into the right part
+                right = t
+                t = t.left
+            elif t.key < key:
+                if t.right is None:
+                    break
+                if t.right.key < key:  # zig-zig: rotate left
+                    y = t.right
+                    t.right = y.left
+                    y.left = t
+                    t = y
+                    if t.right is None:
+                        break
+                left.right = t  # link t into the left part
+                left = t
+                t = t.right
+            else:
+                break
+        left.right = t.left
+        right.left = t.right
+        t.left = header.right
+        t.right = header.left
+        header.left = header.right = None
+        self.root = t
+
+    def search(self, key):
+        """Searches for a key and splays it; returns the node or None."""
+        if self.root is None:
+            return None
+        self._splay(key)
+        root = self.root
+        if key < root.key or root.key < key:
+            return None
+        return root
+
+    def insert(self, key):
+        """Inserts a key and makes it the root."""
+        if self.root is None:
+            self.root = SplayNode(key)
+            self._count = 1
+            return
+        self._splay(key)
+        root = self.root
+        node = SplayNode(key)
+        if key < root.key:
+            node.left = root.left
+            node.right = root
+            root.left = None
+        elif root.key < key:
+            node.right = root.right
+            node.left = root
+            root.right = None
+        else:
+            return
+        self.root = node
+        self._count += 1
+
+    def delete(self, key):
+        """Deletes a key; its predecessor (if any) becomes the new root."""
+        if self.root is None:
+            return
+        self._splay(key)
+        root = self.root
+        if key < root.key or root.key < key:
+            return
+        if root.left is None:
+            self.root = root.right
+        else:
+            right = root.right
+            self.root = root.left
+            self._splay(key)  # key is above everything left: splays the maximum
+            self.root.right = right
+        self._count -= 1
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yields the keys k with lo <= k <= hi in sorted order
+        (descending if reverse).
+
+        Bounds of None are open. Scans do not splay, so iterating does not
+        reshape the tree.
+        """
+        return range_keys(self.root, lo, hi, reverse)
+
+    def __iter__(self):
+        """Iterates over all keys in ascending order."""
+        return self.items()
+
+    def pretty_print(self, out=None, max_depth=None, max_width=None):
+        """Displays the tree structure (see ascii_tree.render_tree for the options)."""
+        pretty_print(self.root, lambda n: str(n.key), out, max_depth, max_width)
+
+
+if __name__ == "__main__":
+    t = SplayTree()
+    for k in [10, 20, 30, 40, 50, 60, 70]:
+        t.insert(k)
+    t.pretty_print()
+    print("\nSearch 10 (splayed to the root):")
+    t.search(10)
+    t.pretty_print()
+    print("\nDelete 40:")
+    t.delete(40)
+    t.pretty_print()
+    print("\nKeys in [15, 60]:", list(t.items(15, 60)))
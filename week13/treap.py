@@ -0,0 +1,179 @@
+import os
+import random
+import sys
+
+# ---------- Pretty Printer ----------
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "shared"))
+from ascii_tree import pretty_print  # noqa: E402
+from tree_walk import range_keys  # noqa: E402
+
+# ---------- Treap ----------
+#
+# A binary search tree on keys that is also a max-heap on priorities. With
+# random priorities the shape is that of a random BST, so every operation
+# is O(log n) expected whatever the insertion order.
+#
+# With by_frequency=True every successful search adds 1 to the node's
+# priority and rotates it up past lighter ancestors, so the most accessed
+# keys drift towards the root (random priorities in [0, 1) only break
+# ties). Under skewed lookups that approximates an optimal static BST.
+#
+# Keys are unique: inserting a key that is already present does nothing.
+
+
+class TreapNode:
+    """Treap node: key, heap priority and children."""
+
+    __slots__ = ("key", "priority", "left", "right")
+
+    def __init__(self, key, priority):
+        self.key = key
+        self.priority = priority
+        self.left = None
+        self.right = None
+
+
+class Treap:
+    """Randomized search tree with optional priority by access frequency."""
+
+    def __init__(self, by_frequency=False, seed=None):
+        """
+        Initializes an empty treap.
+
+        by_frequency makes searches raise the priority of the key found.
+        seed makes the random priorities reproducible.
+        """
+        self.root = None
+        self.by_frequency = by_frequency
+        self._random = random.Random(seed).random
+        self._count = 0
+
+    def __len__(self):
+        """Returns the number of keys in the treap."""
+        return self._count
+
+    def _replace_child(self, parent, old, new):
+        """Points parent's link to old (or the root) at new."""
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def _sift_up(self, path, node):
+        """Rotates node up past the ancestors in path that have a lower priority."""
+        while path and path[-1].priority < node.priority:
+            parent = path.pop()
+            if parent.left is node:  # rotate right
+                parent.left = node.right
+                node.right = parent
+            else:  # rotate left
+                parent.right = node.left
+                node.left = parent
+            self._replace_child(path[-1] if path else None, parent, node)
+
+    def search(self, key):
+        """Searches for a key; returns the node or None."""
+        cur = self.root
+        if not self.by_frequency:
+            while cur:
+                if key < cur.key:
+                    cur = cur.left
+                elif cur.key < key:
+                    cur = cur.right
+                else:
+                    return cur
+            return None
+        path = []
+        while cur:
+            if key < cur.key:
+                path.append(cur)
+                cur = cur.left
+            elif cur.key < key:
+                path.append(cur)
+                cur = cur.right
+            else:
+                cur.priority += 1
+                self._sift_up(path, cur)
+                return cur
+        return None
+
+    def insert(self, key):
+        """Inserts a key as a leaf and rotates it up to its heap position."""
+        path, cur = [], self.root
+        while cur:
+            if key < cur.key:
+                path.append(cur)
+                cur = cur.left
+            elif cur.key < key:
+                path.append(cur)
+                cur = cur.right
+            else:
+                return
+        node = TreapNode(key, self._random())
+        if not path:
+            self.root = node
+        elif key < path[-1].key:
+            path[-1].left = node
+        else:
+            path[-1].right = node
+        self._count += 1
+        self._sift_up(path, node)
+
+    def delete(self, key):
+        """Deletes a key by rotating it down until it has at most one child."""
+        parent, cur = None, self.root
+        while cur:
+            if key < cur.key:
+                parent, cur = cur, cur.left
+            elif cur.key < key:
+                parent, cur = cur, cur.right
+            else:
+                break
+        if cur is None:
+            return
+        while cur.left and cur.right:
+            if cur.left.priority > cur.right.priority:  # rotate right
+                child = cur.left
+                cur.left = child.right
+                child.right = cur
+            else:  # rotate left
+                child = cur.right
+                cur.right = child.left
+                child.left = cur
+            self._replace_child(parent, cur, child)
+            parent = child
+        self._replace_child(parent, cur, cur.left or cur.right)
+        self._count -= 1
+
+    def items(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yields the keys k with lo <= k <= hi in sorted order
+        (descending if reverse).
+
+        Bounds of None are open.
+        """
+        return range_keys(self.root, lo, hi, reverse)
+
+    def __iter__(self):
+        """Iterates over all keys in ascending order."""
+        return self.items()
+
+    def pretty_print(self, out=None, max_depth=None, max_width=None):
+        """Displays the treap structure (see ascii_tree.render_tree for the options)."""
+        pretty_print(self.root, lambda n: str(n.key), out, max_depth, max_width)
+
+
+if __name__ == "__main__":
+    t = Treap(by_frequency=True, seed=1)
+    for k in range(1, 16):
+        t.insert(k)
+    t.pretty_print()
+    for _ in range(3):
+        t.search(13)
+    print("\nAfter searching 13 three times:")
+    t.pretty_print()
+    t.delete(13)
+    print("\nKeys in [5, 14] after deleting 13:", list(t.items(5, 14)))
@@ -1,5 +1,6 @@
 from collections import deque
 from graph import Graph
+from csr_graph import CSRGraph
 
 
 def adjacency_list(graph):
@@ -57,7 +58,11 @@ def bfs(graph, start):
     Perform a breadth-first search starting at the given vertex.
 
     Returns the list of vertices in the order they are visited.
+    graph may also be a CSRGraph, which is traversed on its int arrays.
     """
+    if isinstance(graph, CSRGraph):
+        return _bfs_csr(graph, start)
+
     visited = set()
     order = []
     queue = deque()
@@ -84,7 +89,11 @@ def dfs(graph, start):
     Perform a depth-first search starting at the given vertex.
 
     Returns the list of vertices in the order they are visited.
+    graph may also be a CSRGraph, which is traversed on its int arrays.
     """
+    if isinstance(graph, CSRGraph):
+        return _dfs_csr(graph, start)
+
     visited = set()
     order = []
 
@@ -101,6 +110,63 @@ def dfs(graph, start):
     return order
 
 
+def _bfs_csr(graph, start):
+    """
+    BFS over a CSRGraph, on vertex IDs.
+
+    Visited flags are a bytearray and the queue is a plain list that is
+    read while it grows, so the loop does no hashing at all.
+    """
+    s = graph.index.get(start)
+    if s is None:
+        return []
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(len(graph.labels))
+    visited[s] = 1
+    queue = [s]
+    for u in queue:
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            if not visited[v]:
+                visited[v] = 1
+                queue.append(v)
+    labels = graph.labels
+    return [labels[i] for i in queue]
+
+
+def _dfs_csr(graph, start):
+    """
+    DFS over a CSRGraph, on vertex IDs.
+
+    Visits vertices in the same order as the recursive dfs(), but keeps
+    the next edge position of every open vertex on an explicit stack, so
+    long paths do not hit the recursion limit.
+    """
+    s = graph.index.get(start)
+    if s is None:
+        return []
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(len(graph.labels))
+    visited[s] = 1
+    order = [s]
+    stack, pos = [s], [offsets[s]]
+    while stack:
+        i, end = pos[-1], offsets[stack[-1] + 1]
+        while i < end and visited[targets[i]]:
+            i += 1
+        if i == end:
+            stack.pop()
+            pos.pop()
+            continue
+        pos[-1] = i + 1
+        v = targets[i]
+        visited[v] = 1
+        order.append(v)
+        stack.append(v)
+        pos.append(offsets[v])
+    labels = graph.labels
+    return [labels[i] for i in order]
+
+
 if __name__ == "__main__":
     g = Graph(directed=False)
     g.add_edge('A', 'B')
@@ -117,3 +183,7 @@ if __name__ == "__main__":
 
     print("BFS from A:", bfs(g, 'A'))
     print("DFS from A:", dfs(g, 'A'))
+
+    csr = CSRGraph(g)
+    print("BFS from A (CSR):", bfs(csr, 'A'))
+    print("DFS from A (CSR):", dfs(csr, 'A'))
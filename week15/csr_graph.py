@@ -0,0 +1,89 @@
+from array import array
+
+
+class CSRGraph:
+    """
+    Frozen graph in compressed sparse row (CSR) form.
+
+    Vertices are interned to dense int IDs 0..n-1, in the order of the
+    source graph's adjacency dictionary. The neighbors of vertex i are
+    targets[offsets[i]:offsets[i + 1]], so the whole graph is two flat
+    arrays of machine integers instead of one Python list per vertex.
+    """
+
+    def __init__(self, graph):
+        """
+        Build the CSR form of a Graph (the graph is only read).
+
+        Neighbor order is kept, so traversals visit vertices in the same
+        order as on the original graph.
+        """
+        self.directed = graph.directed
+        self.labels = list(graph.adj)
+        self.index = {v: i for i, v in enumerate(self.labels)}
+        self.offsets = array("q", [0])
+        self.targets = array("i" if len(self.labels) < 2 ** 31 else "q")
+        lookup = self.index.__getitem__
+        for v in self.labels:
+            self.targets.extend(map(lookup, graph.adj[v]))
+            self.offsets.append(len(self.targets))
+
+    def __len__(self):
+        """Return the number of vertices."""
+        return len(self.labels)
+
+    def vertices(self):
+        """Return a list of vertices in the graph."""
+        return list(self.labels)
+
+    def neighbors(self, v):
+        """Return the list of vertices adjacent to v."""
+        i = self.index[v]
+        return [self.labels[j] for j in self.targets[self.offsets[i]:self.offsets[i + 1]]]
+
+    def edges(self):
+        """
+        Return a list of edges in the graph.
+
+        For a directed graph, edges are ordered pairs (u, v).
+        For an undirected graph, each edge appears only once.
+        """
+        edge_list = []
+        seen = set()
+        for i, u in enumerate(self.labels):
+            for j in self.targets[self.offsets[i]:self.offsets[i + 1]]:
+                if self.directed:
+                    edge_list.append((u, self.labels[j]))
+                elif (j, i) not in seen:
+                    edge_list.append((u, self.labels[j]))
+                    seen.add((i, j))
+        return edge_list
+
+    def nbytes(self):
+        """Return the bytes used by the offsets and targets arrays."""
+        return (len(self.offsets) * self.offsets.itemsize
+                + len(self.targets) * self.targets.itemsize)
+
+    def __str__(self):
+        """
+        Return a string representation of the graph adjacency list.
+        """
+        lines = ["CSRGraph (directed={})".format(self.directed)]
+        for v in self.labels:
+            neighbors = ", ".join(str(n) for n in self.neighbors(v))
+            lines.append("{} -> {}".format(v, neighbors))
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    from graph import Graph
+
+    g = Graph(directed=True)
+    g.add_edge("A", "B")
+    g.add_edge("A", "C")
+    g.add_edge("B", "D")
+    g.add_edge("C", "D")
+    csr = CSRGraph(g)
+    print(csr)
+    print("offsets:", csr.offsets.tolist())
+    print("targets:", csr.targets.tolist())
@@ -1,5 +1,6 @@
 from collections import deque
 from graph import Graph
+from csr_graph import CSRGraph
 
 
 def topological_sort_dfs(graph):
@@ -7,8 +8,12 @@ def topological_sort_dfs(graph):
     Perform a topological sort of a directed acyclic graph using DFS.
 
     Returns a list of vertices in topological order. If the graph has
-    cycles, the result is not guaranteed to be valid.
+    cycles, the result is not guaranteed to be valid. graph may also be
+    a CSRGraph.
     """
+    if isinstance(graph, CSRGraph):
+        return _topological_sort_dfs_csr(graph)
+
     visited = set()
     order = []
 
@@ -33,7 +38,11 @@ def topological_sort_kahn(graph):
 
     Returns a list of vertices in topological order.
     If the graph contains a cycle, raises a ValueError.
+    graph may also be a CSRGraph.
     """
+    if isinstance(graph, CSRGraph):
+        return _topological_sort_kahn_csr(graph)
+
     indegree = {}
     for u in graph.adj:
         indegree.setdefault(u, 0)
@@ -57,6 +66,64 @@ def topological_sort_kahn(graph):
     return order
 
 
+def _topological_sort_dfs_csr(graph):
+    """
+    DFS topological sort over a CSRGraph, on vertex IDs.
+
+    Same order as topological_sort_dfs(), with an explicit stack of next
+    edge positions instead of recursion.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(len(graph.labels))
+    order = []
+    for s in range(len(graph.labels)):
+        if visited[s]:
+            continue
+        visited[s] = 1
+        stack, pos = [s], [offsets[s]]
+        while stack:
+            i, end = pos[-1], offsets[stack[-1] + 1]
+            while i < end and visited[targets[i]]:
+                i += 1
+            if i == end:
+                order.append(stack.pop())
+                pos.pop()
+                continue
+            pos[-1] = i + 1
+            v = targets[i]
+            visited[v] = 1
+            stack.append(v)
+            pos.append(offsets[v])
+    labels = graph.labels
+    return [labels[i] for i in reversed(order)]
+
+
+def _topological_sort_kahn_csr(graph):
+    """
+    Kahn's algorithm over a CSRGraph, on vertex IDs.
+
+    In-degrees are counted in one pass over the targets array, and the
+    queue is a plain list that is read while it grows.
+    """
+    offsets, targets = graph.offsets, graph.targets
+    indegree = [0] * len(graph.labels)
+    for v in targets:
+        indegree[v] += 1
+
+    queue = [v for v, d in enumerate(indegree) if d == 0]
+    for u in queue:
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            indegree[v] -= 1
+            if indegree[v] == 0:
+                queue.append(v)
+
+    if len(queue) != len(indegree):
+        raise ValueError("Graph has at least one cycle; topological sort is not possible.")
+
+    labels = graph.labels
+    return [labels[i] for i in queue]
+
+
 if __name__ == "__main__":
     g = Graph(directed=True)
     g.add_edge("A", "C")
@@ -66,3 +133,7 @@ if __name__ == "__main__":
 
     print("Topological sort (DFS):", topological_sort_dfs(g))
     print("Topological sort (Kahn):", topological_sort_kahn(g))
+
+    csr = CSRGraph(g)
+    print("Topological sort (DFS, CSR):", topological_sort_dfs(csr))
+    print("Topological sort (Kahn, CSR):", topological_sort_kahn(csr))
@@ -1,7 +1,15 @@
 # Author: El Tigre
 # Description: Binary tree basic functions (traversals, insertion, deletion, etc.)
 
-import queue
+CHUNK_SIZE = 1 << 16  # characters/bytes per read() and write() in the file I/O
+
+# Binary format: MAGIC, then one record per node in pre-order. A record is
+# a flags byte (HAS_LEFT | HAS_RIGHT), the key length as a LEB128 varint and
+# the key as UTF-8, so missing children cost nothing and a one-character key
+# takes three bytes.
+MAGIC = b"BTREE\x00\x01\n"
+HAS_LEFT = 1
+HAS_RIGHT = 2
 
 
 class Node:
@@ -31,20 +39,82 @@ class BinaryTree:
         Create a binary tree from a serialized file representation.
 
         The file must contain characters where `$` represents a null node.
+        It is read in CHUNK_SIZE blocks and the tree is rebuilt without
+        recursion, so arbitrarily deep trees load fine.
 
         Args:
             filename (str): Path to the file containing the tree serialization.
 
         Returns:
-            int | None: 1 if tree was created successfully, None otherwise.
+            int | None: 1 if tree was created successfully, None otherwise
+            (including a truncated file).
         """
         try:
             handle = open(filename, "r")
         except IOError:
             return None
 
-        self.root = self._create_from_file(handle)
-        handle.close()
+        with handle:
+            self.root = self._load(self._read_chars(handle), null="$")
+
+        if self.root is None:
+            return None
+        return 1
+
+    def save_to_binary_file(self, filename):
+        """
+        Serialize the tree to the compact binary format (see MAGIC).
+
+        Keys are written as str(key), so they may have any length. The tree
+        is walked with an explicit stack and written in CHUNK_SIZE blocks.
+
+        Args:
+            filename (str): Path of the file to write.
+        """
+        with open(filename, "wb") as handle:
+            handle.write(MAGIC)
+            out = bytearray()
+            stack = [self.root] if self.root is not None else []
+            while stack:
+                r = stack.pop()
+                data = str(r.key).encode("utf-8")
+                length = len(data)
+                out.append((HAS_LEFT if r.left is not None else 0) |
+                           (HAS_RIGHT if r.right is not None else 0))
+                while length >= 0x80:
+                    out.append(length & 0x7F | 0x80)
+                    length >>= 7
+                out.append(length)
+                out += data
+                if r.right is not None:
+                    stack.append(r.right)
+                if r.left is not None:
+                    stack.append(r.left)
+                if len(out) >= CHUNK_SIZE:
+                    handle.write(out)
+                    out.clear()
+            handle.write(out)
+
+    def create_from_binary_file(self, filename):
+        """
+        Create a binary tree from a file written by save_to_binary_file.
+
+        Args:
+            filename (str): Path to the binary serialization.
+
+        Returns:
+            int | None: 1 if tree was created successfully, None otherwise
+            (including an empty tree, a wrong header or truncated data).
+        """
+        try:
+            handle = open(filename, "rb")
+        except IOError:
+            return None
+
+        with handle:
+            if handle.read(len(MAGIC)) != MAGIC:
+                return None
+            self.root = self._load_records(self._read_records(handle))
 
         if self.root is None:
             return None
@@ -55,8 +125,8 @@ class BinaryTree:
         return self.root is None
 
     def height(self):
-        """Calculate the height of the binary tree."""
-        return self._height(self.root)
+        """Calculate the height of the binary tree (-1 if empty), without recursion."""
+        return self.level_profile()["height"]
 
     def delete_tree(self):
         """Delete the entire tree by removing its root reference."""
@@ -64,19 +134,88 @@ class BinaryTree:
 
     def pre_order(self):
         """Perform a pre-order traversal (root-left-right)."""
-        return self._pre_order(self.root)
+        return list(self.iter_pre_order())
 
     def in_order(self):
         """Perform an in-order traversal (left-root-right)."""
-        return self._in_order(self.root)
+        return list(self.iter_in_order())
 
     def pos_order(self):
         """Perform a post-order traversal (left-right-root)."""
-        return self._pos_order(self.root)
+        return list(self.iter_pos_order())
+
+    def iter_pre_order(self):
+        """Lazily yield keys in pre-order (root-left-right) using an explicit stack."""
+        return self._iter_pre_order(self.root)
+
+    def iter_in_order(self):
+        """Lazily yield keys in in-order (left-root-right) using an explicit stack."""
+        return self._iter_in_order(self.root)
+
+    def iter_pos_order(self):
+        """Lazily yield keys in post-order (left-right-root) using an explicit stack."""
+        return self._iter_pos_order(self.root)
+
+    def morris_in_order(self):
+        """
+        Lazily yield keys in in-order using Morris threading (O(1) extra memory).
+
+        The tree is temporarily threaded through empty right pointers and is
+        fully restored when the traversal ends, even if it is abandoned early.
+        """
+        return self._morris(self.root, pre_order=False)
+
+    def morris_pre_order(self):
+        """Lazily yield keys in pre-order using Morris threading (O(1) extra memory)."""
+        return self._morris(self.root, pre_order=True)
 
     def bfs_traversal(self):
         """Perform a breadth-first (level-order) traversal."""
-        return self._bfs_traversal()
+        return [key for level in self.level_order() for key in level]
+
+    def level_order(self, profile=None):
+        """
+        Lazily yield the tree one level at a time, as lists of keys.
+
+        Levels are swapped as plain lists, so there is no per-node queue
+        overhead. If a dict is given as `profile`, it is filled in during the
+        same pass (see level_profile) and is complete once the generator ends.
+
+        Args:
+            profile (dict | None): Receives "height", "widths" and "leaves".
+        """
+        widths = []
+        leaves = 0
+        if profile is not None:
+            profile.update(height=-1, widths=widths, leaves=0)
+        level = [self.root] if self.root is not None else []
+        while level:
+            below = []
+            for node in level:
+                if node.left is not None:
+                    below.append(node.left)
+                if node.right is not None:
+                    below.append(node.right)
+                if node.left is None and node.right is None:
+                    leaves += 1
+            widths.append(len(level))
+            if profile is not None:
+                profile.update(height=len(widths) - 1, leaves=leaves)
+            yield [node.key for node in level]
+            level = below
+
+    def level_profile(self):
+        """
+        Compute the shape of the tree in one level-order pass.
+
+        Returns:
+            dict: "height" (-1 if empty), "widths" (nodes per level, root
+            first) and "leaves" (nodes without children).
+        """
+        profile = {}
+        for _ in self.level_order(profile):
+            pass
+        return profile
 
     def print_tree(self):
         """Print the tree structure in a readable format."""
@@ -84,55 +223,169 @@ class BinaryTree:
 
     # --- Internal helpers ---
 
-    def _create_from_file(self, handle):
-        c = handle.read(1)
-        if c == '$':
-            return None
-
-        tmp = Node(c)
-        tmp.left = self._create_from_file(handle)
-        tmp.right = self._create_from_file(handle)
-        return tmp
-
-    def _height(self, r):
-        if r is None:
-            return -1
-        max_left = self._height(r.left) + 1
-        max_right = self._height(r.right) + 1
-        return max(max_left, max_right)
-
-    def _pre_order(self, r):
-        if r is None:
-            return []
-        return [r.key] + self._pre_order(r.left) + self._pre_order(r.right)
-
-    def _in_order(self, r):
-        if r is None:
-            return []
-        return self._in_order(r.left) + [r.key] + self._in_order(r.right)
-
-    def _pos_order(self, r):
-        if r is None:
-            return []
-        return self._pos_order(r.left) + self._pos_order(r.right) + [r.key]
-
-    def _bfs_traversal(self):
-        if self.root is None:
-            return []
+    def _read_chars(self, handle):
+        while True:
+            chunk = handle.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    def _read_records(self, handle):
+        buf = b""
+        while True:
+            chunk = handle.read(CHUNK_SIZE)
+            if not chunk:
+                return
+            buf += chunk
+            records = []
+            pos, end = 0, len(buf)
+            while pos + 2 <= end:
+                flags, length, start = buf[pos], buf[pos + 1], pos + 2
+                if length & 0x80:  # multi-byte varint
+                    length, shift = length & 0x7F, 7
+                    while start < end and buf[start - 1] & 0x80:
+                        length |= (buf[start] & 0x7F) << shift
+                        shift += 7
+                        start += 1
+                    if buf[start - 1] & 0x80:
+                        break  # the varint continues in the next chunk
+                if start + length > end:
+                    break  # the key continues in the next chunk
+                records.append((flags, buf[start:start + length].decode("utf-8")))
+                pos = start + length
+            buf = buf[pos:]
+            yield records
+
+    def _load_records(self, chunks):
+        """
+        Rebuild a tree from (flags, key) records in pre-order without recursion.
 
-        result = []
-        cola = queue.Queue()
-        cola.put(self.root)
+        Returns the root, or None if there are no records or they run out
+        before the tree is complete.
+        """
+        holder = Node()
+        cur, left = holder, True  # the next record fills cur.left or cur.right
+        stack = []  # nodes whose right child comes after their left subtree
+        for chunk in chunks:
+            for flags, key in chunk:
+                node = Node(key)
+                if left:
+                    cur.left = node
+                else:
+                    cur.right = node
+                if flags & HAS_LEFT:
+                    if flags & HAS_RIGHT:
+                        stack.append(node)
+                    cur, left = node, True
+                elif flags & HAS_RIGHT:
+                    cur, left = node, False
+                elif stack:
+                    cur, left = stack.pop(), False
+                else:
+                    return holder.left
+        return None
+
+    def _load(self, chunks, null):
+        """
+        Rebuild a tree from its pre-order tokens without recursion.
 
-        while not cola.empty():
-            tmp = cola.get()
-            result.append(tmp.key)
-            if tmp.left is not None:
-                cola.put(tmp.left)
-            if tmp.right is not None:
-                cola.put(tmp.right)
+        chunks yields sequences of tokens; each token is a key, or `null` for
+        a missing child. Returns the root, or None if the tokens run out
+        before the tree is complete.
+        """
+        holder = Node()
+        cur, left = holder, True  # the next token fills cur.left or cur.right
+        stack = []  # nodes whose right child comes after their left subtree
+        for chunk in chunks:
+            for token in chunk:
+                if token != null:
+                    node = Node(token)
+                    if left:
+                        cur.left = node
+                        stack.append(cur)
+                    else:
+                        cur.right = node
+                    cur, left = node, True
+                elif left:
+                    if cur is holder:
+                        return None
+                    left = False
+                else:
+                    cur, left = stack.pop(), False
+                    if cur is holder:
+                        return holder.left
+        return None
+
+    def _iter_pre_order(self, r):
+        stack = [r] if r is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.key
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def _iter_in_order(self, r):
+        stack = []
+        while stack or r is not None:
+            while r is not None:
+                stack.append(r)
+                r = r.left
+            r = stack.pop()
+            yield r.key
+            r = r.right
+
+    def _iter_pos_order(self, r):
+        stack = []
+        last = None
+        while stack or r is not None:
+            while r is not None:
+                stack.append(r)
+                r = r.left
+            top = stack[-1]
+            if top.right is not None and top.right is not last:
+                r = top.right
+            else:
+                yield top.key
+                last = stack.pop()
 
-        return result
+    def _morris(self, r, pre_order):
+        cur = r
+        try:
+            while cur is not None:
+                if cur.left is None:
+                    yield cur.key
+                    cur = cur.right
+                    continue
+                pred = cur.left
+                while pred.right is not None and pred.right is not cur:
+                    pred = pred.right
+                if pred.right is None:
+                    pred.right = cur  # thread back to cur
+                    if pre_order:
+                        yield cur.key
+                    cur = cur.left
+                else:
+                    pred.right = None  # left subtree done, remove the thread
+                    if not pre_order:
+                        yield cur.key
+                    cur = cur.right
+        finally:
+            # Abandoned mid-walk: finish it silently so every thread is removed.
+            while cur is not None:
+                if cur.left is None:
+                    cur = cur.right
+                    continue
+                pred = cur.left
+                while pred.right is not None and pred.right is not cur:
+                    pred = pred.right
+                if pred.right is None:
+                    pred.right = cur
+                    cur = cur.left
+                else:
+                    pred.right = None
+                    cur = cur.right
 
     def _print_tree(self, p, r, is_left):
         if r: